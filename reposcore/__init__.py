@@ -1,2 +1,11 @@
 # Empty or with basic package info
 __version__ = "0.1.0"
+
+from .api import ReposcoreClient
+from .errors import (
+    ReposcoreError,
+    RepositoryNotFoundError,
+    GitHubAPIError,
+    AuthenticationError,
+    RateLimitError,
+)
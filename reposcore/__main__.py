@@ -1,30 +1,54 @@
 #!/usr/bin/env python3
 
 import argparse
+import atexit
+import csv
+import importlib.util
 import sys
 import os
 import requests
 from datetime import datetime
 import json
 import logging
+import threading
+import time
 from collections import defaultdict
-import pandas as pd
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from .common_utils import *
 from .github_utils import *
 from .analyzer import RepoAnalyzer
+from .aggregate import PartialAggregate
+from .scoring import ScoringRules
+from .cassette import Cassette, CassetteMissError
+from .cache_file import (
+    CacheFormatError, cache_lock, cache_path_for, cache_sync_time, cache_watermark, migrate_legacy_cache
+)
+from .http_cache import HttpCache
+from .local_repo import open_repo
+from .errors import ReposcoreError, AuthenticationError
 from .output_handler import OutputHandler
 from . import common_utils
-from utils import parse_semester_start
+from .utils import parse_semester_start, parse_date_argument
+from .webhook import WebhookReceiver
+from .watch import RepoWatcher
+from .progress import ProgressReporter
+from .memprofile import memory_phase, start_memory_profiling, stop_memory_profiling, summary_lines
+from .work_queue import WorkQueue, DEFAULT_LEASE_SECONDS, run_worker
 
 
 # 포맷 상수
 FORMAT_TABLE = "table"
 FORMAT_TEXT = "text"
 FORMAT_CHART = "chart"
+FORMAT_PARQUET = "parquet"
+FORMAT_NDJSON = "ndjson"
 FORMAT_ALL = "all"
 
-VALID_FORMATS = [FORMAT_TABLE, FORMAT_TEXT, FORMAT_CHART, FORMAT_ALL]
+VALID_FORMATS = [FORMAT_TABLE, FORMAT_TEXT, FORMAT_CHART, FORMAT_PARQUET, FORMAT_NDJSON, FORMAT_ALL]
+# 분석용 내보내기 형식 (all에는 포함하지 않음)
+EXPORT_FORMATS = [FORMAT_PARQUET, FORMAT_NDJSON]
 VALID_FORMATS_DISPLAY = ", ".join(VALID_FORMATS)
 
 # 친절한 오류 메시지를 출력할 ArgumentParser 클래스
@@ -44,19 +68,21 @@ def parse_arguments() -> argparse.Namespace:
         prog="python -m reposcore",
         usage=(
             "python -m reposcore [-h] [-v] [owner/repo ...] "
+            "[--org org [--pattern glob]] "
             "[--output dir_name] "
             f"[--format {{{VALID_FORMATS_DISPLAY}}}] "
             "[--check-limit] "
+            "[--from YYYY-MM-DD] [--to YYYY-MM-DD] "
             "[--user-info path]"
         ),
         description="오픈 소스 수업용 레포지토리의 기여도를 분석하는 CLI 도구",
         add_help=False
     )
-    # 저장소 인자를 하나 이상 받도록 nargs="+"로 변경
+    # 저장소 인자는 --org로 대신할 수 있으므로 nargs="*"로 받고 아래에서 검사
     parser.add_argument(
         "repository",
         type=str,
-        nargs="+",
+        nargs="*",
         metavar="owner/repo",
         help="분석할 GitHub 저장소들 (형식: '소유자/저장소'). 여러 저장소의 경우 공백 혹은 쉼표로 구분하여 입력"
     )
@@ -83,7 +109,8 @@ def parse_arguments() -> argparse.Namespace:
         nargs='+',
         default=[FORMAT_ALL],
         metavar=f"{{{VALID_FORMATS_DISPLAY}}}",
-        help =  f"결과 출력 형식 선택 (복수 선택 가능, 예: --format {FORMAT_TABLE} {FORMAT_CHART}) (기본값:'{FORMAT_ALL}')"
+        help =  f"결과 출력 형식 선택 (복수 선택 가능, 예: --format {FORMAT_TABLE} {FORMAT_CHART}) (기본값:'{FORMAT_ALL}'). "
+                f"'{FORMAT_ALL}'은 {FORMAT_TABLE}, {FORMAT_TEXT}, {FORMAT_CHART}이며 분석용 {FORMAT_PARQUET}, {FORMAT_NDJSON}은 따로 지정해야 합니다."
     )
     parser.add_argument(
         "--grade",
@@ -98,7 +125,8 @@ def parse_arguments() -> argparse.Namespace:
     parser.add_argument(
         "--token",
         type=str,
-        help="API 요청 제한 해제를 위한 깃허브 개인 액세스 토큰"
+        help="API 요청 제한 해제를 위한 깃허브 개인 액세스 토큰. 쉼표로 여러 개를 지정하면 요청마다 한도가 가장 많이 남은 토큰을 사용합니다. "
+             "('-': 표준 입력에서 읽음, 기본값: GITHUB_TOKEN 환경 변수)"
     )
     parser.add_argument(
         "--check-limit",
@@ -116,6 +144,25 @@ def parse_arguments() -> argparse.Namespace:
         metavar="username",
         help="특정 사용자의 점수와 등수를 출력합니다 (GitHub 사용자명)"
     )
+    parser.add_argument(
+        "--rules",
+        type=str,
+        metavar="path",
+        help="점수 규칙 설정 파일(JSON)의 경로. 라벨 별칭, 집계 항목, 가중치, 상한을 지정합니다. (docs/scoring_rules_guide.md 참고)"
+    )
+    parser.add_argument(
+        "--local",
+        type=str,
+        metavar="path",
+        help="GitHub API 대신 로컬 clone의 커밋 기록(git log)으로 참여자별 커밋 수(c_commit, c_merge, c_co_authored)를 "
+             "집계합니다. API 요청을 하지 않으며, 저장소 인자는 결과 이름으로만 사용합니다. (점수 반영은 --rules로 지정)"
+    )
+    parser.add_argument(
+        "--enrich",
+        action="store_true",
+        help="병합된 PR의 리뷰, 변경 줄 수, 병합한 사용자를 GraphQL로 여러 PR씩 묶어 조회해 "
+             "집계 항목(p_review, p_merge, p_changed_lines)에 추가합니다. (토큰 필요, 점수 반영은 --rules로 지정)"
+    )
     parser.add_argument(
         "--theme", "-t",
         choices=["default", "dark"],
@@ -129,227 +176,509 @@ def parse_arguments() -> argparse.Namespace:
     help="주차별 PR/이슈 활동량 차트를 생성합니다."
     )
 
+    parser.add_argument(
+        "--timeline",
+        action="store_true",
+        help="주차별 누적 점수와 등수 변화를 timeline.csv와 timeline.png로 저장합니다. (--semester-start 필요)"
+    )
+
     parser.add_argument(
         "--semester-start",
         type=str,
         help="학기 시작일 (형식: YYYY-MM-DD, 예: 2025-03-04)"
     )
+    parser.add_argument(
+        "--webhook",
+        type=int,
+        metavar="port",
+        help="분석 후 지정한 포트에서 GitHub 웹훅(issues, pull_request, label)을 받아 점수를 즉시 갱신합니다."
+    )
+    parser.add_argument(
+        "--webhook-secret",
+        type=str,
+        metavar="secret",
+        help="웹훅 서명(X-Hub-Signature-256) 검증용 비밀값 (기본값: GITHUB_WEBHOOK_SECRET 환경 변수, 없으면 검증 생략)"
+    )
+    parser.add_argument(
+        "--watch",
+        type=float,
+        metavar="seconds",
+        help="분석 후 종료하지 않고 지정한 주기마다 변경된 이슈/PR만 받아 반영하고, 바뀐 저장소와 통합 결과만 다시 저장합니다."
+    )
+    parser.add_argument(
+        "--queue",
+        type=str,
+        metavar="path",
+        help="저장소 목록을 SQLite 작업 큐 파일에 넣고, 이 프로세스와 --worker 프로세스들이 나누어 수집한 뒤 통합 결과를 만듭니다."
+    )
+    parser.add_argument(
+        "--worker",
+        action="store_true",
+        help="--queue의 저장소를 가져가 수집하고 점수를 계산해 결과를 큐에 기록합니다. (저장소 인자 없이 사용, 다른 옵션은 큐를 만든 실행과 같게 지정)"
+    )
+    parser.add_argument(
+        "--lease",
+        type=float,
+        default=DEFAULT_LEASE_SECONDS,
+        metavar="seconds",
+        help="--queue 작업자가 응답 없이 저장소를 가지고 있을 수 있는 시간. 지나면 다른 작업자가 다시 처리합니다. (기본값: %(default)s)"
+    )
+    parser.add_argument(
+        "--org",
+        type=str,
+        metavar="org",
+        help="조직(또는 사용자)의 저장소 중 --pattern과 일치하는 저장소를 모두 찾아 분석합니다."
+    )
+    parser.add_argument(
+        "--pattern",
+        type=str,
+        default="*",
+        metavar="glob",
+        help="--org 사용 시 저장소 이름 패턴 (예: 'reposcore-*') (기본값: '*')"
+    )
+    parser.add_argument(
+        "--jobs", "-j",
+        type=int,
+        default=4,
+        metavar="N",
+        help="동시에 수집할 저장소 수 (기본값: 4)"
+    )
 
-    return parser.parse_args()
+    parser.add_argument(
+        "--top",
+        type=int,
+        metavar="N",
+        help="총점 상위 N명만 표, 텍스트, 차트에 출력합니다."
+    )
+    parser.add_argument(
+        "--others",
+        action="store_true",
+        help="--top 사용 시 나머지 참여자의 점수 합계를 '(others)' 행으로 추가합니다."
+    )
+    parser.add_argument(
+        "--chart-page-size",
+        type=int,
+        default=OutputHandler.CHART_CONFIG['participants_per_page'],
+        metavar="N",
+        help="차트 한 장에 그릴 최대 참여자 수. 초과하면 여러 장으로 나누고 chart_index.html로 연결합니다 (기본값: %(default)s)"
+    )
+    parser.add_argument(
+        "--checkpoint-interval",
+        type=int,
+        default=10,
+        metavar="pages",
+        help="수집 중 지정한 페이지 수마다 진행 상태를 저장해, 중단된 수집을 다음 실행에서 이어서 진행합니다 (0: 사용 안 함, 기본값: 10)"
+    )
 
-args = parse_arguments()
+    parser.add_argument(
+        "--progress",
+        action="store_true",
+        help="수집 중 저장소/페이지 진행률, 초당 처리 수, 남은 API 요청 수, 남은 시간을 터미널 한 줄로 표시합니다. (표준 오류 출력)"
+    )
+    parser.add_argument(
+        "--status-file",
+        type=str,
+        metavar="path",
+        help="수집 중 --status-interval초마다 진행 상황을 JSON 한 줄씩 지정한 파일에 덧붙여 기록합니다. (감시 프로그램용)"
+    )
+    parser.add_argument(
+        "--status-interval",
+        type=float,
+        default=10,
+        metavar="seconds",
+        help="--status-file 기록 주기 (기본값: %(default)s)"
+    )
 
-def handle_individual_user_mode(args):
+    parser.add_argument(
+        "--memprofile",
+        nargs="?",
+        const="",
+        metavar="path",
+        help="단계(수집, 점수 계산, 표/텍스트/차트 저장)와 저장소별 최대·잔여 메모리, 할당 위치 상위 목록을 기록합니다. "
+             "(경로 생략 시 '<output>/memprofile.json', tracemalloc을 사용하므로 실행이 느려짐)"
+    )
+
+    parser.add_argument(
+        "--http-cache",
+        nargs="?",
+        const="",
+        metavar="dir",
+        help="GitHub API 응답을 디스크에 저장해 두고 Cache-Control/ETag에 따라 다시 사용합니다. "
+             "(디렉토리 생략 시 '<output>/http_cache')"
+    )
+    parser.add_argument(
+        "--http-cache-size",
+        type=int,
+        default=100,
+        metavar="MB",
+        help="--http-cache 최대 크기. 넘으면 가장 오래 사용하지 않은 응답부터 삭제합니다. (기본값: 100)"
+    )
+    parser.add_argument(
+        "--record",
+        type=str,
+        metavar="dir",
+        help="GitHub API 응답(상태 코드, 헤더, 본문)을 모두 지정한 디렉토리에 압축해 녹화합니다."
+    )
+    parser.add_argument(
+        "--replay",
+        type=str,
+        metavar="dir",
+        help="--record로 녹화한 응답을 네트워크 없이 같은 순서로 재생합니다. (재현 가능한 테스트/벤치마크용)"
+    )
+    parser.add_argument(
+        "--replay-latency",
+        type=float,
+        default=0.0,
+        metavar="seconds",
+        help="--replay 시 요청마다 지정한 시간만큼 대기해 네트워크 지연을 흉내 냅니다. (기본값: 0)"
+    )
+    parser.add_argument(
+        "--from",
+        dest="date_from",
+        type=parse_date_argument,
+        metavar="YYYY-MM-DD",
+        help="이 날짜(포함) 이후에 생성된 이슈/PR만 점수에 반영합니다. (KST 기준)"
+    )
+    parser.add_argument(
+        "--to",
+        dest="date_to",
+        type=parse_date_argument,
+        metavar="YYYY-MM-DD",
+        help="이 날짜(미포함) 이전에 생성된 이슈/PR만 점수에 반영합니다. (KST 기준, 예: --from 2025-03-17 --to 2025-04-28)"
+    )
+
+    args = parser.parse_args()
+    if args.local and (args.org or len(args.repository) > 1):
+        parser.error("--local은 저장소 하나에만 사용할 수 있습니다. (--org와 함께 사용할 수 없음)")
+    if args.worker and not args.queue:
+        parser.error("--worker는 --queue와 함께 사용해야 합니다.")
+    if args.queue and (args.local or args.watch is not None or args.webhook is not None):
+        parser.error("--queue는 --local, --watch, --webhook과 함께 사용할 수 없습니다.")
+    if args.lease <= 0:
+        parser.error("--lease 값은 0보다 커야 합니다.")
+    if not args.repository and not args.org and not args.check_limit and not args.local and not args.worker:
+        parser.error("the following arguments are required: owner/repo (또는 --org)")
+    if args.jobs < 1:
+        parser.error("--jobs 값은 1 이상이어야 합니다.")
+    if args.chart_page_size < 1:
+        parser.error("--chart-page-size 값은 1 이상이어야 합니다.")
+    if args.top is not None and args.top < 1:
+        parser.error("--top 값은 1 이상이어야 합니다.")
+    if args.watch is not None and args.watch <= 0:
+        parser.error("--watch 값은 0보다 커야 합니다.")
+    if args.watch is not None and (args.local or args.webhook is not None):
+        parser.error("--watch는 --local 또는 --webhook과 함께 사용할 수 없습니다.")
+    if args.record and args.replay:
+        parser.error("--record와 --replay는 함께 사용할 수 없습니다.")
+    if args.status_interval <= 0:
+        parser.error("--status-interval 값은 0보다 커야 합니다.")
+    if args.http_cache_size < 1:
+        parser.error("--http-cache-size 값은 1 이상이어야 합니다.")
+    if args.replay_latency < 0:
+        parser.error("--replay-latency 값은 0 이상이어야 합니다.")
+    if args.date_from and args.date_to and args.date_from >= args.date_to:
+        parser.error("--from 날짜는 --to 날짜보다 앞서야 합니다.")
+    return args
+
+def load_scoring_rules(path: str | None) -> ScoringRules:
+    """--rules 파일을 읽어 점수 규칙을 컴파일합니다. (지정하지 않으면 기본 규칙)"""
+    if not path:
+        return ScoringRules()
+    if not os.path.isfile(path):
+        logging.error(f"❌ 점수 규칙 파일을 찾을 수 없습니다: {path}")
+        sys.exit(1)
+    try:
+        return ScoringRules.load(path)
+    except json.JSONDecodeError:
+        logging.error("❌ 점수 규칙 파일이 올바른 JSON 형식이 아닙니다.")
+        sys.exit(1)
+    except (ValueError, KeyError, TypeError, AttributeError) as e:
+        logging.error(f"❌ 점수 규칙 파일 오류: {e}")
+        sys.exit(1)
+
+def handle_individual_user_mode(args, github_token: str | None = None, rate_budget: RateBudget | None = None):
     repo = args.repository[0]
-    analyzer = RepoAnalyzer(repo, token=args.token, theme=args.theme)
+    rules = load_scoring_rules(args.rules)
+    analyzer = RepoAnalyzer(repo, token=github_token, theme=args.theme,
+                            rules=rules.with_enrichment() if args.enrich else rules)
+    analyzer.rate_budget = rate_budget
     analyzer.collect_PRs_and_issues()
+    analyzer.enrich_pull_requests()
 
     user_info = None
     if args.user_info and os.path.exists(args.user_info):
         with open(args.user_info, "r", encoding="utf-8") as f:
             user_info = json.load(f)
 
-    repo_scores = analyzer.calculate_scores(user_info)
     user_lookup_name = user_info.get(args.user, args.user) if user_info else args.user
+    user_rank = analyzer.get_user_rank(user_lookup_name, user_info, args.date_from, args.date_to)
 
-    if user_lookup_name in repo_scores:
-        sorted_users = list(repo_scores.keys())
-        rank = sorted_users.index(user_lookup_name) + 1
-        score = repo_scores[user_lookup_name]["total"]
+    if user_rank:
+        rank, score, num_users = user_rank
         print(f"[INFO] 사용자: {user_lookup_name}")
         print(f"[INFO] 총점: {score:.2f}점")
-        print(f"[INFO] 등수: {rank}등 (전체 {len(sorted_users)}명 중)")
+        print(f"[INFO] 등수: {rank}등 (전체 {num_users}명 중)")
     else:
         print(f"[INFO] 사용자 '{args.user}'의 점수를 찾을 수 없습니다.")
 
-if args.user:                        
-    handle_individual_user_mode(args)
-    sys.exit(0)
-
-def merge_participants(
-    overall: dict[str, dict[str, int]],
-    new_data: dict[str, dict[str, int]]
-) -> dict[str, dict[str, int]]:
-    """두 participants 딕셔너리를 병합합니다."""
-    for user, activities in new_data.items():
-        if user not in overall:
-            overall[user] = activities.copy()
-        else:
-            # 각 항목별로 활동수를 누적합산합니다.
-            for key, value in activities.items():
-                overall[user][key] = overall[user].get(key, 0) + value
-    return overall
 
+def resolve_formats(args: argparse.Namespace) -> set[str]:
+    """--format 인자를 실제로 생성할 출력 형식 집합으로 변환합니다."""
+    formats = set(args.format)
+    if FORMAT_ALL in formats:
+        formats = (formats - {FORMAT_ALL}) | {FORMAT_TABLE, FORMAT_TEXT, FORMAT_CHART}
+    return formats
 
-def main() -> None:
-    """Main execution function"""
-    args = parse_arguments()
-    common_utils.is_verbose = args.verbose
-    github_token = args.token
-    if not args.token:
-        github_token = os.getenv('GITHUB_TOKEN')
-    elif args.token == '-':
-        github_token = sys.stdin.readline().strip()
 
-    if github_token and len(github_token) != 0:
-        validate_token(github_token)
+def export_datasets(
+    datasets: dict[str, tuple[str, Callable[[], Iterable[tuple]]]],
+    output_dir: str,
+    formats: set[str],
+    output_handler: OutputHandler,
+    label: str = ""
+) -> None:
+    """
+    --format parquet/ndjson 지정 시 데이터셋들을 분석용 파일로 저장합니다.
+    datasets는 {파일 이름: (스키마 이름, 행 제너레이터를 만드는 함수[, 스키마])} 형식입니다.
+    (스키마를 생략하면 스키마 이름의 고정 스키마 사용)
+    """
+    for fmt in EXPORT_FORMATS:
+        if fmt not in formats:
+            continue
+        for file_name, (dataset, make_rows, *schema) in datasets.items():
+            path = output_handler.export_records(dataset, make_rows(), os.path.join(output_dir, file_name), fmt, *schema)
+            log(f"{label}{fmt} 파일 저장 완료: {path}", force=True)
 
-    # --check-limit 옵션 처리: 이 옵션이 있으면 repository 인자 없이 실행됨.
-    if args.check_limit:
-        check_rate_limit(token=github_token)
-        sys.exit(0)
 
-    # --user-info 옵션으로 지정된 파일이 존재하는지, JSON 파싱이 가능한지 검증
-    if args.user_info:
-        # 1) 파일 존재 여부 확인
-        if not os.path.isfile(args.user_info):
-            logging.error("❌ 사용자 정보 파일을 찾을 수 없습니다.")
-            sys.exit(1)
-        # 2) JSON 문법 오류 확인
-        try:
-            with open(args.user_info, "r", encoding="utf-8") as f:
-                user_info = json.load(f)
-        except json.JSONDecodeError:
-            logging.error("❌ 사용자 정보 파일이 올바른 JSON 형식이 아닙니다.")
-            sys.exit(1)
-    else:
-        user_info = None
+def write_repo_outputs(
+    repo: str,
+    repo_scores: dict[str, dict[str, float]],
+    analyzer: RepoAnalyzer,
+    args: argparse.Namespace,
+    output_handler: OutputHandler,
+    semester_start_date=None,
+    user_info: dict[str, str] | None = None
+) -> None:
+    """저장소 하나의 점수 결과를 --format에 맞게 results/owner_repo/ 아래에 저장합니다."""
+    formats = resolve_formats(args)
 
-    repositories: list[str] = args.repository
-    # 쉼표로 여러 저장소가 입력된 경우 분리
-    final_repositories = list(dict.fromkeys(
-        [r.strip() for repo in repositories for r in repo.split(",") if r.strip()]
-    ))
+    # 저장소별 폴더 생성 (owner/repo -> owner_repo)
+    repo_safe_name = repo.replace('/', '_')
+    repo_output_dir = os.path.join(args.output, repo_safe_name)
+    os.makedirs(repo_output_dir, exist_ok=True)
 
-    # 각 저장소 유효성 검사
-    for repo in final_repositories:
-        analyzer = RepoAnalyzer(repo, token=github_token, theme=args.theme)
+    # 1) CSV 테이블 저장
+    if FORMAT_TABLE in formats:
+        table_path = os.path.join(repo_output_dir, "score.csv")
+        with memory_phase("table", repo):
+            output_handler.generate_count_csv(repo_scores, save_path=table_path)
+        log(f"CSV 파일 저장 완료: {table_path}", force=True)
+        if args.local:
+            # 커밋 집계 항목은 기본 규칙에서 점수에 반영되지 않으므로 원본 커밋 수도 함께 저장
+            commits_path = os.path.join(repo_output_dir, "commits.csv")
+            commit_keys = [analyzer.participants.count_keys()[index] for index in analyzer.rules.commit_kinds.values()]
+            output_handler.generate_participant_csv(analyzer.participants, commit_keys, commits_path)
+            log(f"커밋 수 CSV 파일 저장 완료: {commits_path}", force=True)
 
-    # 학기 시작일 설정은 collect 전에!
-        if args.weekly_chart:
-            if not args.semester_start:
-                logging.error("❌ --weekly-chart 사용 시 --semester-start 날짜를 반드시 지정해야 합니다.")
-                sys.exit(1)
-            try:
-                semester_start_date = datetime.strptime(args.semester_start, "%Y-%m-%d").date()
-                analyzer.set_semester_start_date(semester_start_date)
-            except ValueError:
-                logging.error("❌ 학기 시작일 형식이 잘못되었습니다. YYYY-MM-DD 형식으로 입력해 주세요.")
-                sys.exit(1)
+    # 2) 텍스트 테이블 저장
+    if FORMAT_TEXT in formats:
+        txt_path = os.path.join(repo_output_dir, "score.txt")
+        with memory_phase("text", repo):
+            output_handler.generate_text(repo_scores, txt_path)
+        log(f"텍스트 파일 저장 완료: {txt_path}", force=True)
 
-        analyzer.collect_PRs_and_issues()
+    # 3) 차트 이미지 저장
+    if FORMAT_CHART in formats:
+        chart_filename = "chart_grade.png" if args.grade else "chart.png"
+        chart_path = os.path.join(repo_output_dir, chart_filename)
+        with memory_phase("chart", repo):
+            chart_files = output_handler.generate_chart(repo_scores, save_path=chart_path, show_grade=args.grade,
+                                                        page_size=args.chart_page_size)
+        log(f"차트 이미지 저장 완료: {chart_files[-1]} (파일 {len(chart_files)}개)", force=True)
 
-                
-        if not validate_repo_format(repo):
-            logging.error(f"오류: 저장소 '{repo}'는 'owner/repo' 형식으로 입력해야 합니다. 예) 'oss2025hnu/reposcore-py'")
-            sys.exit(1)
-        if not check_github_repo_exists(repo):
-            logging.warning(f"입력한 저장소 '{repo}'가 깃허브에 존재하지 않을 수 있음.")
-            sys.exit(1)
+    # 주차별 활동 차트생성
+    if args.weekly_chart and semester_start_date:
+        weekly_chart_path = os.path.join(repo_output_dir, "weekly_activity.png")
+        output_handler.generate_weekly_chart(analyzer.weekly_activity, semester_start_date, weekly_chart_path)
 
-    log(f"저장소 분석 시작: {', '.join(final_repositories)}", force=True)
+    # 주차별 누적 점수/등수 타임라인
+    if args.timeline and semester_start_date:
+        write_timeline(analyzer, user_info, repo_output_dir, args, output_handler)
 
-    overall_participants = {}
-    all_repo_scores = {}
-    
-    #저장소별로 분석 후 '개별 결과'도 저장하기
-    for repo in final_repositories:
-        log(f"분석 시작: {repo}", force=True)
+    # 4) 분석용 parquet/ndjson 저장 (점수, 원본 카운트, 주차별 활동)
+    datasets = {
+        "scores": ("scores", lambda: output_handler.score_records(repo, repo_scores)),
+        "counts": ("counts", lambda: output_handler.count_records(repo, analyzer.participants),
+                   output_handler.counts_schema(output_handler.count_keys(analyzer.participants))),
+    }
+    if semester_start_date:
+        datasets["weekly_activity"] = ("weekly", lambda: output_handler.weekly_records(repo, analyzer.weekly_activity))
+    export_datasets(datasets, repo_output_dir, formats, output_handler)
 
-        analyzer = RepoAnalyzer(repo, token=github_token, theme=args.theme)
-        output_handler = OutputHandler(theme=args.theme)
-        if args.weekly_chart:
-            if not args.semester_start:
-                logging.error("❌ --weekly-chart 사용 시 --semester-start 날짜를 반드시 지정해야 합니다.")
-                sys.exit(1)
-            semester_start = parse_semester_start(args.semester_start)
 
-        # 저장소별 캐시 파일 생성 (예: cache_oss2025hnu_reposcore-py.json)
-        cache_file_name = f"cache_{repo.replace('/', '_')}.json"
-        cache_path = os.path.join(args.output, cache_file_name)
+def write_timeline(
+    analyzer: RepoAnalyzer,
+    user_info: dict[str, str] | None,
+    output_dir: str,
+    args: argparse.Namespace,
+    output_handler: OutputHandler,
+    label: str = ""
+) -> None:
+    """주차별 누적 점수/등수를 계산해 timeline.csv와 timeline.png로 저장합니다."""
+    names, weeks, totals, ranks = analyzer.score_timeline(user_info)
+    csv_path = os.path.join(output_dir, "timeline.csv")
+    output_handler.generate_timeline_csv(names, weeks, totals, ranks, csv_path)
+    chart_path = os.path.join(output_dir, "timeline.png")
+    output_handler.generate_timeline_chart(names, weeks, totals, ranks, chart_path, top=args.top or 10)
+    log(f"{label}타임라인 저장 완료: {csv_path}, {chart_path}", force=True)
 
-        os.makedirs(args.output, exist_ok=True)
 
-        cache_update_required = os.path.exists(cache_path) and analyzer.is_cache_update_required(cache_path)
+def local_repo_name(path: str) -> str:
+    """--local 저장소의 결과 이름 (저장소 인자를 생략한 경우, 예: local/reposcore-py)"""
+    return f"local/{os.path.basename(os.path.abspath(path))}"
 
-        if args.use_cache and os.path.exists(cache_path) and not cache_update_required:
-            log(f"✅ 캐시 파일({cache_file_name})이 존재합니다. 캐시에서 데이터를 불러옵니다.", force=True)
-            with open(cache_path, "r", encoding="utf-8") as f:
-                cached_json = json.load(f)
-                analyzer.participants = cached_json['participants']
-                analyzer.previous_create_at = cached_json['update_time']
-        else:
-            if args.use_cache and cache_update_required:
-                log(f"🔄 리포지토리의 최근 이슈 생성 시간이 캐시파일의 생성 시간보다 최근입니다. GitHub API로 데이터를 수집합니다.", force=True)
+
+def load_or_collect(
+    repo: str,
+    args: argparse.Namespace,
+    github_token: str | None,
+    semester_start_date=None,
+    rate_budget: RateBudget | None = None,
+    stop_event: threading.Event | None = None,
+    rules: ScoringRules | None = None,
+    progress: ProgressReporter | None = None
+) -> RepoAnalyzer | None:
+    """
+    저장소 하나의 데이터를 캐시에서 불러오거나 GitHub API로 수집합니다.
+    API 요청에 실패하면 None을 반환합니다. (여러 스레드에서 동시에 호출됨)
+    """
+    log(f"분석 시작: {repo}", force=True)
+
+    # 존재 여부는 main()에서 이미 확인했으므로 다시 요청하지 않음
+    analyzer = RepoAnalyzer(repo, token=github_token, theme=args.theme, check_exists=False, rules=rules)
+    analyzer.rate_budget = rate_budget
+    analyzer.stop_event = stop_event
+    analyzer.progress = progress
+    if semester_start_date:
+        analyzer.set_semester_start_date(semester_start_date)
+
+    # --local: 로컬 clone의 커밋 기록만 사용 (API 요청, 캐시 없음)
+    if args.local:
+        analyzer.collect_local_commits(args.local)
+        return analyzer
+
+    # 저장소별 캐시 파일 생성 (예: cache_oss2025hnu_reposcore-py.bin)
+    cache_path = cache_path_for(args.output, repo)
+    cache_file_name = os.path.basename(cache_path)
+
+    os.makedirs(args.output, exist_ok=True)
+
+    # 같은 저장소를 수집 중인 다른 실행(CI 작업, cron 등)이 있으면 끝날 때까지 기다렸다가
+    # 기다리는 동안 저장된 캐시를 그대로 사용 (같은 저장소를 동시에 두 번 수집하지 않음)
+    requested_at = time.time()
+    with cache_lock(cache_path) as waited:
+        # 이전 버전의 JSON 캐시(cache_<저장소>.json)만 있으면 먼저 이 형식으로 옮김
+        migrate_legacy_cache(cache_path)
+        shared = False
+        if waited and (cache_sync_time(cache_path) or 0) >= requested_at:
+            try:
+                shared = analyzer.load_cache(cache_path)
+            except (CacheFormatError, ValueError):
+                pass
+            if shared:
+                log(f"✅ 다른 실행이 방금 저장한 캐시 파일({cache_file_name})을 불러옵니다.", force=True)
+
+        # 캐시에 반영한 마지막 updated_at 이후 바뀐 이슈/PR이 없으면 (요청 1회로 확인) 저장 시각과 관계없이 캐시 사용
+        # 단, 점수 규칙/학기 시작일이 다른 캐시는 바뀐 항목이 없어도 집계 기준이 다르므로 다시 수집
+        policy_matches = os.path.exists(cache_path) and analyzer.cache_matches_policy(cache_path)
+        unchanged = False
+        if not shared and args.use_cache and policy_matches:
+            watermark = cache_watermark(cache_path)
+            unchanged = watermark is not None and analyzer.has_changes_since(watermark) is False
+
+        cache_update_required = os.path.exists(cache_path) and not unchanged and analyzer.is_cache_update_required(cache_path)
+
+        cache_loaded = shared
+        if not cache_loaded and args.use_cache and os.path.exists(cache_path) and not cache_update_required:
+            if unchanged:
+                log(f"✅ 캐시 파일({cache_file_name}) 이후 바뀐 이슈/PR이 없습니다. 캐시에서 데이터를 불러옵니다.", force=True)
+            else:
+                log(f"✅ 캐시 파일({cache_file_name})이 존재합니다. 캐시에서 데이터를 불러옵니다.", force=True)
+            try:
+                cache_loaded = analyzer.load_cache(cache_path)
+                if not cache_loaded:
+                    log(f"🔄 캐시 파일({cache_file_name})에 이슈/PR별 반영 내역이 없거나 점수 규칙/학기 시작일이 다릅니다. 전체를 다시 수집합니다.", force=True)
+            except (CacheFormatError, ValueError) as e:
+                logging.warning(f"⚠️ 캐시 파일({cache_file_name})을 읽을 수 없어 다시 수집합니다: {e}")
+        if not cache_loaded:
+            if args.use_cache and cache_update_required and not policy_matches:
+                log(f"🔄 캐시 파일({cache_file_name})의 점수 규칙/학기 시작일이 지금과 다릅니다. GitHub API로 데이터를 수집합니다.", force=True)
+            elif args.use_cache and cache_update_required:
+                log(f"🔄 캐시 파일({cache_file_name})이 1시간보다 오래되었거나 이전 형식입니다. GitHub API로 데이터를 수집합니다.", force=True)
             else:
-                log(f"�� 캐시를 사용하지 않거나 캐시 파일({cache_file_name})이 없습니다. GitHub API로 데이터를 수집합니다.", force=True)
-            analyzer.collect_PRs_and_issues()
+                log(f"📡 캐시를 사용하지 않거나 캐시 파일({cache_file_name})이 없습니다. GitHub API로 데이터를 수집합니다.", force=True)
+            # 중단되더라도 다음 실행에서 이어서 수집할 수 있도록 체크포인트 사용 (예: checkpoint_oss2025hnu_reposcore-py.json)
+            checkpoint_path = None
+            if args.checkpoint_interval > 0:
+                checkpoint_path = os.path.join(args.output, f"checkpoint_{repo.replace('/', '_')}.json")
+            analyzer.collect_PRs_and_issues(checkpoint_path=checkpoint_path, checkpoint_interval=args.checkpoint_interval)
             if not getattr(analyzer, "_data_collected", True):
-                logging.error("❌ GitHub API 요청에 실패했습니다. 결과 파일을 생성하지 않고 종료합니다.")
-                logging.error("ℹ️ 인증 없이 실행한 경우 요청 횟수 제한(403)일 수 있습니다. --token 옵션을 사용해보세요.")
-                sys.exit(1)
-            with open(cache_path, "w", encoding="utf-8") as f:
-                json.dump({'update_time':analyzer.previous_create_at, 'participants': analyzer.participants, 'weekly_activity': dict(analyzer.weekly_activity)}, f, indent=2, ensure_ascii=False)
+                return None
+            analyzer.save_cache(cache_path)
+
+        # PR 상세 정보 집계 항목이 있으면 아직 조회하지 않은 병합 PR만 묶어서 조회 (캐시에 있는 PR은 다시 조회하지 않음)
+        if analyzer.enrich_pull_requests():
+            analyzer.save_cache(cache_path)
+
+        return analyzer
 
-        try:
-            # 1) 사용자 정보 로드 (없으면 None)
-            user_info = json.load(open(args.user_info, "r", encoding="utf-8")) \
-                if args.user_info and os.path.exists(args.user_info) else None
 
+def write_outputs(
+    final_repositories: list[str],
+    repos: Iterable[str],
+    analyzers: dict[str, RepoAnalyzer],
+    partials: dict[str, PartialAggregate],
+    all_repo_scores: dict[str, dict[str, float]],
+    args: argparse.Namespace,
+    output_handler: OutputHandler,
+    rules: ScoringRules,
+    user_info: dict[str, str] | None = None,
+    semester_start_date=None,
+    github_token: str | None = None
+) -> None:
+    """
+    repos에 해당하는 저장소별 결과를 저장한 뒤 전체 저장소 통합 결과를 다시 만듭니다.
+    저장소별 점수 합계(all_repo_scores)와 부분 집계(partials)는 저장소 이름별로 갱신하므로,
+    --watch에서는 바뀐 저장소만 repos로 넘기고 나머지 저장소의 결과는 그대로 다시 사용합니다.
+    """
+    formats = resolve_formats(args)
+
+    # 2단계: 저장소별로 분석 후 '개별 결과'도 저장하기 (차트 생성은 스레드 안전하지 않으므로 순서대로)
+    for repo in repos:
+        analyzer = analyzers[repo]
+        try:
             # 스코어 계산
-            repo_scores = analyzer.calculate_scores(user_info)
+            with memory_phase("score", repo):
+                repo_scores = analyzer.calculate_scores(user_info, top=args.top, include_others=args.others,
+                                                        start=args.date_from, end=args.date_to)
 
-            # --user 옵션이 지정된 경우 사용자 점수 및 등수 출력
+            # --user 옵션이 지정된 경우 사용자 점수 및 등수 출력 (--top과 관계없이 전체 참여자 기준)
             user_lookup_name = user_info.get(args.user, args.user) if args.user and user_info else args.user
-            if args.user and user_lookup_name in repo_scores:
-                sorted_users = list(repo_scores.keys())
-                user_rank = sorted_users.index(user_lookup_name) + 1
-                user_score = repo_scores[user_lookup_name]["total"]
+            user_rank = analyzer.get_user_rank(user_lookup_name, user_info, args.date_from, args.date_to) if args.user else None
+            if user_rank:
+                rank, user_score, num_users = user_rank
                 log(f"[INFO] 사용자: {user_lookup_name}", force=True)
                 log(f"[INFO] 총점: {user_score:.2f}점", force=True)
-                log(f"[INFO] 등수: {user_rank}등 (전체 {len(sorted_users)}명 중)", force=True)
+                log(f"[INFO] 등수: {rank}등 (전체 {num_users}명 중)", force=True)
             elif args.user:
                 log(f"[INFO] 사용자 '{args.user}'의 점수가 계산된 결과에 없습니다.", force=True)
 
-            # 출력 형식
-            formats = set(args.format)
-            if FORMAT_ALL in formats:
-                formats = {FORMAT_TABLE, FORMAT_TEXT, FORMAT_CHART}
-
-            # 저장소별 폴더 생성 (owner/repo -> owner_repo)
-            repo_safe_name = repo.replace('/', '_')
-            repo_output_dir = os.path.join(args.output, repo_safe_name)
-            os.makedirs(repo_output_dir, exist_ok=True)
-            all_repo_scores[repo_safe_name] = repo_scores
-
-            # 1) CSV 테이블 저장
-            if FORMAT_TABLE in formats:
-                table_path = os.path.join(repo_output_dir, "score.csv")
-                output_handler.generate_table(repo_scores, save_path=table_path)
-                output_handler.generate_count_csv(repo_scores, save_path=table_path)
-                log(f"CSV 파일 저장 완료: {table_path}", force=True)
-
-            # 2) 텍스트 테이블 저장
-            if FORMAT_TEXT in formats:
-                txt_path = os.path.join(repo_output_dir, "score.txt")
-                output_handler.generate_text(repo_scores, txt_path)
-                log(f"텍스트 파일 저장 완료: {txt_path}", force=True)
-
-            # 3) 차트 이미지 저장
-            if FORMAT_CHART in formats:
-                chart_filename = "chart_grade.png" if args.grade else "chart.png"
-                chart_path = os.path.join(repo_output_dir, chart_filename)
-                output_handler.generate_chart(repo_scores, save_path=chart_path, show_grade=args.grade)
-                log(f"차트 이미지 저장 완료: {chart_path}", force=True)
-
-            # 주차별 활동 차트생성
-            if args.weekly_chart:
-                analyzer.set_semester_start_date(semester_start_date)
-                weekly_chart_path = os.path.join(repo_output_dir, "weekly_activity.png")
-                output_handler.generate_weekly_chart(analyzer.weekly_activity, semester_start_date, weekly_chart_path)
-
-            # 전체 참여자 데이터 병합
-            overall_participants = merge_participants(overall_participants, analyzer.participants)
+            # 저장소별 결과 저장 (overall_repository는 --top과 관계없이 전체 참여자의 총점으로 계산)
+            all_repo_scores[repo.replace('/', '_')] = analyzer.calculate_totals(user_info, args.date_from, args.date_to)
+            write_repo_outputs(repo, repo_scores, analyzer, args, output_handler, semester_start_date, user_info)
+
+            # 통합 분석용 부분 집계 (참여자별 카운트 + 주차별 활동)
+            partials[repo] = PartialAggregate.from_analyzer(repo, analyzer, args.date_from, args.date_to)
 
         except Exception as e:
             logging.error(f"❌ 저장소 '{repo}' 분석 중 오류 발생: {str(e)}")
@@ -357,50 +686,53 @@ def main() -> None:
 
     # 전체 저장소 통합 분석
     if len(final_repositories) > 1:
+        # 저장소별 부분 집계를 합쳐 통합 결과를 만듦 (캐시 파일을 다시 읽지 않음)
+        overall = PartialAggregate.combine(
+            [partials[repo] for repo in final_repositories if repo in partials], rules.categories
+        )
+        overall_participants = overall.participants
+
         if args.weekly_chart:
-            overall_weekly_activity = defaultdict(lambda: {"pr": 0, "issue": 0})
-            for repo in final_repositories:
-                log(f"분석 시작: {repo}", force=True)
-                
-                analyzer = RepoAnalyzer(repo, token=github_token, theme=args.theme)
-                if args.weekly_chart:
-                    analyzer.set_semester_start_date(semester_start_date)
-
-                cache_file = f"cache_{repo.replace('/', '_')}.json"
-                cache_path = os.path.join(args.output, cache_file)
-                if os.path.exists(cache_path):
-                    with open(cache_path, "r", encoding="utf-8") as f:
-                        cache_data = json.load(f)
-                        repo_weekly = cache_data.get("weekly_activity", {})
-                        for week_str, data in repo_weekly.items():
-                            week = int(week_str)
-                            overall_weekly_activity[week]["pr"] += data.get("pr", 0)
-                            overall_weekly_activity[week]["issue"] += data.get("issue", 0)
-            
+            overall_weekly_activity = overall.weekly
+
             overall_output_dir = os.path.join(args.output, "overall")
             os.makedirs(overall_output_dir, exist_ok=True)
 
             weekly_chart_path = os.path.join(overall_output_dir, "weekly_activity.png")
             output_handler.generate_weekly_chart(overall_weekly_activity, semester_start_date, weekly_chart_path)
+            export_datasets(
+                {"weekly_activity": ("weekly", lambda: output_handler.weekly_records(None, overall_weekly_activity))},
+                overall_output_dir, formats, output_handler, label="[통합 저장소] "
+            )
 
         log("\n=== 전체 저장소 통합 분석 ===", force=True)
         
         # 통합 분석을 위한 analyzer 생성
-        overall_analyzer = RepoAnalyzer("multiple_repos", token=github_token, theme=args.theme)
+        overall_analyzer = RepoAnalyzer("multiple_repos", token=github_token, theme=args.theme, rules=rules)
         overall_analyzer.participants = overall_participants
+
+        # 통합 타임라인: 모든 저장소의 반영 내역을 합쳐 주차별 누적 점수/등수 계산
+        if args.timeline and semester_start_date:
+            overall_analyzer.set_semester_start_date(semester_start_date)
+            merged = [
+                (record, analyzers[repo].pr_details.get(number))
+                for repo in final_repositories if repo in partials
+                for number, record in analyzers[repo].items.items()
+            ]
+            overall_analyzer.items = {index: record for index, (record, _) in enumerate(merged)}
+            overall_analyzer.pr_details = {index: details for index, (_, details) in enumerate(merged) if details}
         
         # 통합 점수 계산
-        overall_scores = overall_analyzer.calculate_scores(user_info)
+        overall_scores = overall_analyzer.calculate_scores(user_info, top=args.top, include_others=args.others)
 
-        # --user 옵션이 지정된 경우 통합 점수에서 출력
+        # --user 옵션이 지정된 경우 사용자 점수 및 등수 출력 (--top과 관계없이 전체 참여자 기준)
         user_lookup_name = user_info.get(args.user, args.user) if args.user and user_info else args.user
-        if args.user and user_lookup_name in overall_scores:
-            sorted_users = list(overall_scores.keys())
-            user_rank = sorted_users.index(user_lookup_name) + 1
-            user_score = overall_scores[user_lookup_name]["total"]
+        user_rank = overall_analyzer.get_user_rank(user_lookup_name, user_info) if args.user else None
+        if user_rank:
+            rank, user_score, num_users = user_rank
             log(f"[INFO] 사용자: {user_lookup_name}", force=True)
             log(f"[INFO] 총점: {user_score:.2f}점", force=True)
-            log(f"[INFO] 등수: {user_rank}등 (전체 {len(sorted_users)}명 중)", force=True)
+            log(f"[INFO] 등수: {rank}등 (전체 {num_users}명 중)", force=True)
         elif args.user:
             log(f"[INFO] 사용자 '{args.user}'의 점수가 통합 분석 결과에 없습니다.", force=True)
         
@@ -411,8 +743,8 @@ def main() -> None:
         # 1) CSV 테이블 저장
         if FORMAT_TABLE in formats:
             table_path = os.path.join(overall_output_dir, "score.csv")
-            output_handler.generate_table(overall_scores, save_path=table_path)
-            output_handler.generate_count_csv(overall_scores, save_path=table_path)
+            with memory_phase("table", "overall"):
+                output_handler.generate_count_csv(overall_scores, save_path=table_path)
             log(f"[통합 저장소] CSV 파일 저장 완료: {table_path}", force=True)
         
         # 2) 텍스트 테이블 저장
@@ -425,75 +757,420 @@ def main() -> None:
         if FORMAT_CHART in formats:
             chart_filename = "chart_grade.png" if args.grade else "chart.png"
             chart_path = os.path.join(overall_output_dir, chart_filename)
-            output_handler.generate_chart(overall_scores, save_path=chart_path, show_grade=args.grade)
-            log(f"[통합 저장소] 차트 이미지 저장 완료: {chart_path}", force=True)
-
-    # 사용자별 저장소별 점수 CSV 만드는 함수
-    def generate_overall_repository_csv(all_repo_scores, output_path):
-        user_scores = defaultdict(dict)
-
-        for repo_name, repo_scores in all_repo_scores.items():
-            for username, score_dict in repo_scores.items():
-                user_scores[username][repo_name] = score_dict["total"]
-
-        for username in user_scores:
-            user_scores[username]["total"] = sum(user_scores[username].values())
-
-        df = pd.DataFrame.from_dict(user_scores, orient='index').fillna(0)
-        df.index.name = "name"
-        column_order = [
-            "oss2025hnu_reposcore-py",
-            "oss2025hnu_reposcore-js",
-            "oss2025hnu_reposcore-cs",
-            "total"
-        ]
-        existing_columns = [col for col in column_order if col in df.columns]
-        df = df[existing_columns]
-        df = df.astype(int)
-        df.reset_index(inplace=True)
-        df = df[["name"] + existing_columns]
-        df = df.sort_values(by="total", ascending=False)
-        df.to_csv(output_path, encoding="utf-8", index=False)
+            with memory_phase("chart", "overall"):
+                chart_files = output_handler.generate_chart(overall_scores, save_path=chart_path, show_grade=args.grade,
+                                                            page_size=args.chart_page_size)
+            log(f"[통합 저장소] 차트 이미지 저장 완료: {chart_files[-1]} (파일 {len(chart_files)}개)", force=True)
+
+        if args.timeline and semester_start_date:
+            write_timeline(overall_analyzer, user_info, overall_output_dir, args, output_handler, label="[통합 저장소] ")
+
+        # 4) 분석용 parquet/ndjson 저장 (repo는 null)
+        export_datasets({
+            "scores": ("scores", lambda: output_handler.score_records(None, overall_scores)),
+            "counts": ("counts", lambda: output_handler.count_records(None, overall_participants),
+                       output_handler.counts_schema(output_handler.count_keys(overall_participants))),
+        }, overall_output_dir, formats, output_handler, label="[통합 저장소] ")
+
+    # 사용자 점수 재구성 (user_scores: username → repo별 점수 + total), 저장소 수와 무관하게 한 번만 계산
+    repo_columns = [repo.replace("/", "_") for repo in final_repositories if repo.replace("/", "_") in all_repo_scores]
+    user_scores = defaultdict(dict)
+    for repo_name in repo_columns:
+        for username, total in all_repo_scores[repo_name].items():
+            user_scores[username][repo_name] = total
+    for username, score_dict in user_scores.items():
+        score_dict["total"] = sum(score_dict.values())
+    # --top: 상위 N명만 남김 (부분 선택)
+    user_scores = select_top_scores(user_scores, args.top, args.others)
+
+    # 사용자별 저장소별 점수 CSV 만드는 함수 (DataFrame 없이 한 줄씩 기록)
+    def generate_overall_repository_csv(user_scores, output_path):
+        columns = repo_columns + ["total"]
+        with open(output_path, "w", encoding="utf-8", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(["name"] + columns)
+            for username, score_dict in user_scores.items():
+                writer.writerow([username] + [int(score_dict.get(col, 0)) for col in columns])
 
     # 저장 경로 지정하고 생성
     overall_repo_dir = os.path.join(args.output, "overall_repository")
     os.makedirs(overall_repo_dir, exist_ok=True)
 
     overall_csv_path = os.path.join(overall_repo_dir, "overall_scores.csv")
-    generate_overall_repository_csv(all_repo_scores, overall_csv_path)
+    with memory_phase("table", "overall_repository"):
+        generate_overall_repository_csv(user_scores, overall_csv_path)
     log(f"[📊 overall_repository] 저장소별 사용자 점수 CSV 저장 완료: {overall_csv_path}", force=True)
 
     # 🔽 텍스트 파일 저장: overall_scores.txt
     overall_txt_path = os.path.join(overall_repo_dir, "overall_scores.txt")
     with open(overall_txt_path, "w", encoding="utf-8") as f:
-        sorted_users = sorted(all_repo_scores.keys())
-        
-        # 사용자 점수 재구성 (user_scores: username → repo별 점수)
-        user_scores = defaultdict(dict)
-        for repo_name, repo_scores in all_repo_scores.items():
-            for username, score_dict in repo_scores.items():
-                user_scores[username][repo_name] = score_dict["total"]
-
-        # 총점 계산 후 정렬
-        for username in user_scores:
-            user_scores[username]["total"] = sum(user_scores[username].values())
-
-        sorted_users = sorted(user_scores.items(), key=lambda x: x[1]["total"], reverse=True)
-
-        for username, score_dict in sorted_users:
+        # user_scores는 select_top_scores에서 이미 총점 기준으로 정렬됨
+        for username, score_dict in user_scores.items():
             f.write(f"📊 {username}\n")
             f.write(f"총점: {score_dict['total']}점\n")
-            for repo in final_repositories:
-                repo_key = repo.replace("/", "_")
-                if repo_key in score_dict:
-                    f.write(f"{repo_key}: {score_dict[repo_key]}점\n")
+            # 사용자가 참여한 저장소만 순회 (저장소 수 × 사용자 수 반복 방지)
+            for repo_key, repo_score in score_dict.items():
+                if repo_key != "total":
+                    f.write(f"{repo_key}: {repo_score}점\n")
             f.write("\n")  # 사용자별 공백 줄
     log(f"[📊 overall_repository] 저장소별 사용자 점수 TXT 저장 완료: {overall_txt_path}", force=True)
 
     # 📈 통합 차트 이미지 저장
     chart_path = os.path.join(overall_repo_dir, "chart.png")
-    output_handler.generate_repository_stacked_chart(user_scores, save_path=chart_path)
-    log(f"[📊 overall_repository] 누적 기여도 차트 저장 완료: {chart_path}", force=True)
+    with memory_phase("chart", "overall_repository"):
+        chart_files = output_handler.generate_repository_stacked_chart(user_scores, save_path=chart_path,
+                                                                       page_size=args.chart_page_size)
+    if chart_files:
+        log(f"[📊 overall_repository] 누적 기여도 차트 저장 완료: {chart_files[-1]} (파일 {len(chart_files)}개)", force=True)
+
+    # 분석용 parquet/ndjson 저장 (사용자 × 참여 저장소 행, 저장소는 owner/repo 이름으로 기록)
+    repo_names = {repo.replace("/", "_"): repo for repo in final_repositories}
+    export_datasets(
+        {"overall_scores": ("overall_repository",
+                            lambda: output_handler.overall_repository_records(user_scores, repo_names))},
+        overall_repo_dir, formats, output_handler, label="[📊 overall_repository] "
+    )
+
+
+def run_queue(
+    args: argparse.Namespace,
+    final_repositories: list[str],
+    github_token: str | None,
+    semester_start_date,
+    rate_budget: RateBudget,
+    rules: ScoringRules,
+    user_info: dict[str, str] | None,
+    output_handler: OutputHandler
+) -> None:
+    """
+    --queue: 저장소를 SQLite 작업 큐에 넣고(--worker가 아닌 경우) 이 프로세스의 --jobs개 스레드와 --worker 프로세스들이
+    나누어 수집합니다. 작업자는 저장소별 결과를 저장한 뒤 통합에 필요한 부분 집계와 점수 합계만 큐에 기록하고,
+    큐를 만든 프로세스는 모든 저장소가 끝나면 큐에 기록된 부분 결과를 합쳐 통합 결과를 만듭니다.
+    """
+    queue = WorkQueue(args.queue, lease_seconds=args.lease)
+    if not args.worker:
+        queue.enqueue(final_repositories)
+        log(f"📥 작업 큐({args.queue})에 저장소 {len(final_repositories)}개를 넣었습니다.", force=True)
+
+    stop_event = threading.Event()
+    # 차트 생성은 스레드 안전하지 않으므로 저장소별 결과 저장은 한 번에 하나씩
+    output_lock = threading.Lock()
+
+    def process(repo: str) -> dict | None:
+        log(f"🧺 작업 큐에서 가져옴: {repo}", force=True)
+        with memory_phase("collect", repo):
+            analyzer = load_or_collect(repo, args, github_token, semester_start_date, rate_budget, stop_event, rules)
+        if analyzer is None:
+            return None
+        repo_scores = analyzer.calculate_scores(user_info, top=args.top, include_others=args.others,
+                                                start=args.date_from, end=args.date_to)
+        with output_lock:
+            write_repo_outputs(repo, repo_scores, analyzer, args, output_handler, semester_start_date, user_info)
+        return {
+            'partial': PartialAggregate.from_analyzer(repo, analyzer, args.date_from, args.date_to).to_dict(),
+            'totals': analyzer.calculate_totals(user_info, args.date_from, args.date_to),
+        }
+
+    with ThreadPoolExecutor(max_workers=args.jobs) as executor:
+        futures = [
+            executor.submit(run_worker, queue, process, stop_event, min(5, args.lease / 3))
+            for _ in range(args.jobs)
+        ]
+        try:
+            processed = sum(future.result() for future in futures)
+        except KeyboardInterrupt:
+            # 처리 중이던 저장소는 작업 기간이 지나면 다른 작업자가 다시 처리
+            logging.warning("⏹️ 중단 요청을 받았습니다. 처리 중인 저장소는 다른 작업자가 다시 처리합니다.")
+            stop_event.set()
+            executor.shutdown(wait=True, cancel_futures=True)
+            sys.exit(130)
+    log(f"✅ 이 프로세스에서 저장소 {processed}개를 처리했습니다. {queue.counts()}", force=True)
+    if args.worker:
+        return
+
+    failures = queue.failures()
+    if failures:
+        for repo, error in failures.items():
+            logging.error(f"❌ 저장소 '{repo}' 처리 실패: {error}")
+        if args.replay:
+            logging.error(f"ℹ️ 녹화되지 않은 요청 때문에 실패했다면 --record로 녹화 파일({args.replay})을 다시 녹화하세요.")
+        logging.error("❌ 처리하지 못한 저장소가 있어 통합 결과를 생성하지 않고 종료합니다.")
+        sys.exit(1)
+
+    # 큐에 기록된 부분 결과로 통합 (저장소별 결과는 작업자가 이미 저장함)
+    results = queue.results()
+    partials = {repo: PartialAggregate.from_dict(results[repo]['partial'], rules.categories) for repo in final_repositories}
+    all_repo_scores = {repo.replace('/', '_'): results[repo]['totals'] for repo in final_repositories}
+    analyzers = {}
+    for repo in final_repositories:
+        analyzers[repo] = RepoAnalyzer(repo, theme=args.theme, check_exists=False, rules=rules)
+        # 통합 타임라인은 이슈/PR별 반영 내역이 필요하므로 작업자가 출력 디렉토리에 저장한 캐시에서 불러옴
+        cache_path = cache_path_for(args.output, repo)
+        if args.timeline and os.path.exists(cache_path):
+            analyzers[repo].load_cache(cache_path)
+    write_outputs(final_repositories, [], analyzers, partials, all_repo_scores, args,
+                  output_handler, rules, user_info, semester_start_date, github_token)
+
+
+def finish_memory_profiling(path: str) -> None:
+    """--memprofile 보고서를 저장하고 요약을 출력합니다. (종료 시 호출)"""
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    report = stop_memory_profiling(path)
+    if report is None:
+        return
+    for line in summary_lines(report):
+        log(line, force=True)
+    log(f"🧠 메모리 사용량 보고서 저장 완료: {path}", force=True)
+
+
+def main() -> None:
+    """Main execution function"""
+    configure_logging()
+    args = parse_arguments()
+    try:
+        run(args)
+    except CassetteMissError as e:
+        # --replay 중 녹화 파일에 없는 요청: 다른 오류처럼 안내하고 종료 (추적 정보 없이)
+        logging.error(f"❌ {e}")
+        logging.error(f"❌ 녹화 파일({args.replay})에 없는 요청이어서 재생할 수 없습니다. --record로 녹화 파일을 다시 녹화하세요.")
+        sys.exit(1)
+
+
+def run(args: argparse.Namespace) -> None:
+    """명령행 인자에 따라 저장소를 수집하고 결과를 저장합니다."""
+    common_utils.is_verbose = args.verbose
+
+    # --memprofile: 종료할 때(중간에 종료되는 경우 포함) 단계별 메모리 사용량 보고서 저장
+    if args.memprofile is not None:
+        start_memory_profiling()
+        atexit.register(finish_memory_profiling, args.memprofile or os.path.join(args.output, "memprofile.json"))
+
+    # --record / --replay: 이후 모든 GitHub API 요청(retry_request)을 녹화하거나 녹화본으로 재생
+    if args.record or args.replay:
+        try:
+            cassette = Cassette(args.record or args.replay, 'record' if args.record else 'replay', args.replay_latency)
+        except FileNotFoundError as e:
+            logging.error(f"❌ {e}")
+            sys.exit(1)
+        use_cassette(cassette)
+        # 중간에 종료되더라도 녹화 파일이 온전히 닫히도록 등록
+        atexit.register(cassette.close)
+        log(f"📼 API 응답 {'녹화' if args.record else '재생'} 모드: {cassette.path}", force=True)
+
+    # --http-cache: 반복 실행 시 유효 기간 안의 응답은 네트워크 없이 사용
+    if args.http_cache is not None:
+        http_cache_dir = args.http_cache or os.path.join(args.output, "http_cache")
+        use_http_cache(HttpCache(http_cache_dir, max_bytes=args.http_cache_size * 1024 * 1024))
+    token_value = args.token
+    if not args.token:
+        token_value = os.getenv('GITHUB_TOKEN')
+    elif args.token == '-':
+        token_value = sys.stdin.readline().strip()
+
+    # 쉼표로 구분된 여러 토큰은 토큰 풀로 함께 사용
+    tokens = list(dict.fromkeys(t.strip() for t in (token_value or "").split(",") if t.strip()))
+    # --local은 API 요청을 하지 않으므로 토큰도 사용하지 않음
+    if args.local:
+        tokens = []
+    github_token = tokens[0] if tokens else None
+    for token in tokens:
+        try:
+            validate_token(token)
+        except AuthenticationError as e:
+            logging.error(str(e))
+            sys.exit(1)
+
+    # --check-limit 옵션 처리: 이 옵션이 있으면 repository 인자 없이 실행됨.
+    if args.check_limit:
+        for token in tokens or [None]:
+            check_rate_limit(token=token)
+        sys.exit(0)
+
+    # 모든 저장소 수집이 함께 쓰는 요청 한도 (토큰이 여러 개면 토큰별 한도를 따로 관리)
+    rate_budget = TokenPool(tokens) if len(tokens) > 1 else RateBudget()
+    if len(tokens) > 1:
+        log(f"🔑 토큰 {len(tokens)}개를 함께 사용합니다.", force=True)
+
+    # --user와 저장소 하나만 지정한 경우: 해당 사용자의 점수와 등수만 출력 (토큰, 녹화/재생, HTTP 캐시 설정은 그대로 사용)
+    if args.user and args.repository and not args.local:
+        try:
+            handle_individual_user_mode(args, github_token, rate_budget)
+        except ReposcoreError as e:
+            logging.error(f"❌ {e}")
+            sys.exit(1)
+        sys.exit(0)
+
+    # --user-info 옵션으로 지정된 파일이 존재하는지, JSON 파싱이 가능한지 검증
+    if args.user_info:
+        # 1) 파일 존재 여부 확인
+        if not os.path.isfile(args.user_info):
+            logging.error("❌ 사용자 정보 파일을 찾을 수 없습니다.")
+            sys.exit(1)
+        # 2) JSON 문법 오류 확인
+        try:
+            with open(args.user_info, "r", encoding="utf-8") as f:
+                user_info = json.load(f)
+        except json.JSONDecodeError:
+            logging.error("❌ 사용자 정보 파일이 올바른 JSON 형식이 아닙니다.")
+            sys.exit(1)
+    else:
+        user_info = None
+
+    # --rules 점수 규칙은 수집 전에 한 번만 컴파일해 모든 저장소에 사용
+    rules = load_scoring_rules(args.rules)
+    if args.enrich:
+        rules = rules.with_enrichment()
+    if args.local:
+        rules = rules.with_commit_categories()
+        try:
+            open_repo(args.local).close()
+        except ValueError as e:
+            logging.error(f"❌ {e}")
+            sys.exit(1)
+
+    repositories: list[str] = args.repository or ([local_repo_name(args.local)] if args.local else [])
+    # 쉼표로 여러 저장소가 입력된 경우 분리
+    final_repositories = list(dict.fromkeys(
+        [r.strip() for repo in repositories for r in repo.split(",") if r.strip()]
+    ))
+
+    # --org: 조직의 저장소 중 패턴과 일치하는 저장소를 찾아 추가 (존재 여부 확인 불필요)
+    discovered_repositories = set()
+    if args.org:
+        session = requests.Session()
+        if github_token:
+            session.headers.update({'Authorization': f'Bearer {github_token}'})
+        discovered = list_org_repos(args.org, args.pattern, session=session, rate_budget=rate_budget)
+        log(f"🔎 '{args.org}'에서 '{args.pattern}'과 일치하는 저장소 {len(discovered)}개를 찾았습니다.", force=True)
+        discovered_repositories = set(discovered)
+        final_repositories = list(dict.fromkeys(final_repositories + discovered))
+
+    if not final_repositories and not args.worker:
+        logging.error("❌ 분석할 저장소가 없습니다.")
+        sys.exit(1)
+
+    # 학기 시작일 설정은 collect 전에!
+    semester_start_date = None
+    if args.weekly_chart or args.timeline:
+        if not args.semester_start:
+            logging.error("❌ --weekly-chart 또는 --timeline 사용 시 --semester-start 날짜를 반드시 지정해야 합니다.")
+            sys.exit(1)
+        try:
+            semester_start_date = datetime.strptime(args.semester_start, "%Y-%m-%d").date()
+        except ValueError:
+            logging.error("❌ 학기 시작일 형식이 잘못되었습니다. YYYY-MM-DD 형식으로 입력해 주세요.")
+            sys.exit(1)
+
+    # 각 저장소 유효성 검사
+    for repo in final_repositories:
+        if repo in discovered_repositories or args.local:
+            continue
+        if not validate_repo_format(repo):
+            logging.error(f"오류: 저장소 '{repo}'는 'owner/repo' 형식으로 입력해야 합니다. 예) 'oss2025hnu/reposcore-py'")
+            sys.exit(1)
+        if not check_github_repo_exists(repo):
+            logging.warning(f"입력한 저장소 '{repo}'가 깃허브에 존재하지 않을 수 있음.")
+            sys.exit(1)
+
+    if final_repositories:
+        log(f"저장소 분석 시작: {', '.join(final_repositories)}", force=True)
+
+    partials: dict[str, PartialAggregate] = {}
+    all_repo_scores = {}
+    formats = resolve_formats(args)
+    output_handler = OutputHandler(theme=args.theme)
+
+    # parquet은 선택 의존성(pyarrow)이 필요하므로 수집 전에 미리 확인
+    if FORMAT_PARQUET in formats and importlib.util.find_spec("pyarrow") is None:
+        logging.error("❌ parquet 형식으로 저장하려면 pyarrow가 필요합니다. (pip install pyarrow)")
+        sys.exit(1)
+
+    # --queue: 저장소별 수집은 작업 큐를 통해 이 프로세스와 --worker 프로세스들이 나누어 처리
+    if args.queue:
+        run_queue(args, final_repositories, github_token, semester_start_date, rate_budget, rules, user_info,
+                  output_handler)
+        return
+
+    # 1단계: 저장소별 데이터 수집 (캐시 또는 API) - 최대 --jobs 개를 동시에 수집
+    stop_event = threading.Event()
+    analyzers: dict[str, RepoAnalyzer] = {}
+    progress = ProgressReporter(len(final_repositories), rate_budget, sys.stderr if args.progress else None,
+                                args.status_file, args.status_interval)
+
+    def collect(repo: str) -> RepoAnalyzer | None:
+        with memory_phase("collect", repo):
+            return load_or_collect(repo, args, github_token, semester_start_date, rate_budget, stop_event, rules, progress)
+
+    with progress, ThreadPoolExecutor(max_workers=min(args.jobs, len(final_repositories))) as executor:
+        futures = {
+            executor.submit(collect, repo): repo
+            for repo in final_repositories
+        }
+        try:
+            for done, future in enumerate(as_completed(futures), start=1):
+                repo = futures[future]
+                try:
+                    analyzer = future.result()
+                except CassetteMissError:
+                    # 녹화 파일을 다시 녹화해야 하므로 나머지 수집을 멈추고 main()에서 안내
+                    stop_event.set()
+                    executor.shutdown(wait=True, cancel_futures=True)
+                    raise
+                except Exception as e:
+                    # 요청 실패 외의 오류(캐시 파일 접근 실패, 예상하지 못한 응답 등)도 저장소별로 보고하고 종료
+                    logging.error(f"❌ 저장소 '{repo}' 수집 중 오류 발생: {str(e)}")
+                    logging.error("❌ 결과 파일을 생성하지 않고 종료합니다.")
+                    analyzer = None
+                else:
+                    if analyzer is None:
+                        logging.error(f"❌ 저장소 '{repo}' 수집 중 GitHub API 요청에 실패했습니다. 결과 파일을 생성하지 않고 종료합니다.")
+                        logging.error("ℹ️ 인증 없이 실행한 경우 요청 횟수 제한(403)일 수 있습니다. --token 옵션을 사용해보세요.")
+                if analyzer is None:
+                    if args.checkpoint_interval > 0:
+                        logging.info("ℹ️ 수집한 페이지까지는 체크포인트로 저장되어, 다시 실행하면 이어서 수집합니다.")
+                    stop_event.set()
+                    executor.shutdown(wait=True, cancel_futures=True)
+                    sys.exit(1)
+                analyzers[repo] = analyzer
+                progress.finish(repo)
+                log(f"[{done}/{len(final_repositories)}] 수집 완료: {repo}", force=True)
+        except KeyboardInterrupt:
+            # 수집 중인 스레드는 현재 페이지를 마치고 체크포인트를 저장한 뒤 종료
+            logging.warning("⏹️ 중단 요청을 받았습니다. 진행 중인 수집의 체크포인트를 저장한 뒤 종료합니다.")
+            stop_event.set()
+            executor.shutdown(wait=True, cancel_futures=True)
+            sys.exit(130)
+
+    write_outputs(final_repositories, final_repositories, analyzers, partials, all_repo_scores, args,
+                  output_handler, rules, user_info, semester_start_date, github_token)
+
+    # --webhook: 이후 변경 사항은 웹훅 이벤트로 받아 해당 저장소 결과와 통합 결과만 갱신
+    if args.webhook is not None:
+        def on_update(repo: str, analyzer: RepoAnalyzer) -> None:
+            # 웹훅이 캐시에서 다시 불러온 analyzer일 수 있으므로 교체한 뒤 통합 결과까지 다시 만듦 (이벤트는 하나씩 처리됨)
+            analyzers[repo] = analyzer
+            write_outputs(final_repositories, [repo], analyzers, partials, all_repo_scores, args,
+                          output_handler, rules, user_info, semester_start_date, github_token)
+
+        receiver = WebhookReceiver(
+            args.output,
+            secret=args.webhook_secret or os.getenv('GITHUB_WEBHOOK_SECRET'),
+            repositories=final_repositories,
+            semester_start_date=semester_start_date,
+            on_update=on_update,
+            rules=rules,
+            token=github_token
+        )
+        receiver.serve(port=args.webhook)
+
+    # --watch: 수집한 analyzer와 세션을 유지한 채 주기마다 변경된 항목만 반영하고 바뀐 저장소 결과만 다시 저장
+    if args.watch is not None:
+        def on_change(changed: list[str]) -> None:
+            write_outputs(final_repositories, changed, analyzers, partials, all_repo_scores, args,
+                          output_handler, rules, user_info, semester_start_date, github_token)
+
+        watcher = RepoWatcher(analyzers, args.output, args.watch, on_change, max_workers=args.jobs)
+        watcher.run()
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+import json
+import os
+from collections import defaultdict
+from collections.abc import Iterable, Mapping
+from datetime import date
+
+from .cache_file import read_cache
+from .participants import ParticipantTable, PARTICIPANT_KEYS
+
+
+class PartialAggregate:
+    """
+    저장소(또는 저장소 묶음) 하나의 집계 결과.
+
+    참여자별 활동 카운트(ParticipantTable)와 주차별 PR/이슈 히스토그램, 그리고 어떤 저장소들이
+    합쳐진 결과인지를 함께 가지고 있습니다. merge는 결합 법칙을 만족하므로 저장소별 결과를
+    어떤 순서·묶음으로 합쳐도 같은 통합 결과가 나옵니다. (여러 프로세스의 결과를 나누어 합칠 때도 사용 가능)
+    """
+
+    def __init__(
+        self,
+        repos: Iterable[str] = (),
+        participants: ParticipantTable | None = None,
+        weekly: Mapping[int, Mapping[str, int]] | None = None
+    ):
+        self.repos = tuple(repos)
+        self.participants = participants if participants is not None else ParticipantTable()
+        self.weekly = defaultdict(lambda: {'pr': 0, 'issue': 0})
+        for week, counts in (weekly or {}).items():
+            self.weekly[int(week)] = {'pr': counts.get('pr', 0), 'issue': counts.get('issue', 0)}
+
+    @classmethod
+    def from_analyzer(cls, repo: str, analyzer, start: date | None = None, end: date | None = None) -> 'PartialAggregate':
+        """
+        수집(또는 캐시 로드)이 끝난 RepoAnalyzer에서 부분 집계를 만듭니다. (추가 I/O 없음)
+        start/end가 주어지면 참여자별 카운트는 [start, end) 기간의 활동만 셉니다.
+        """
+        return cls((repo,), analyzer.participants_between(start, end).copy(), analyzer.weekly_activity)
+
+    @classmethod
+    def from_dict(cls, data: dict, keys: Iterable[str] | None = None) -> 'PartialAggregate':
+        """
+        to_dict() 또는 캐시 파일 형식의 딕셔너리로부터 부분 집계를 만듭니다.
+        집계 항목은 data의 'keys', keys 인자, 참여자 행의 항목 순으로 정하고, 모두 없으면 기본 집계 항목을 씁니다.
+        """
+        participants = data.get('participants', {})
+        keys = data.get('keys') or keys or next((tuple(row) for row in participants.values()), PARTICIPANT_KEYS)
+        return cls(
+            data.get('repos', ()),
+            ParticipantTable.from_dict(participants, tuple(keys)),
+            data.get('weekly_activity', {})
+        )
+
+    def to_dict(self) -> dict:
+        """JSON으로 저장할 수 있는 딕셔너리 (집계 항목과 저장소 목록 포함)"""
+        return {
+            'repos': list(self.repos),
+            'keys': list(self.participants.count_keys()),
+            'participants': self.participants.to_dict(),
+            'weekly_activity': {week: dict(counts) for week, counts in sorted(self.weekly.items())},
+        }
+
+    @classmethod
+    def load(cls, path: str, repo: str | None = None, keys: Iterable[str] | None = None) -> 'PartialAggregate':
+        """부분 집계 파일(또는 저장소 캐시 파일)을 불러옵니다."""
+        data = read_cache(path)
+        if repo is not None and 'repos' not in data:
+            data['repos'] = [repo]
+        return cls.from_dict(data, keys)
+
+    def save(self, path: str) -> None:
+        """부분 집계를 JSON으로 저장합니다. (중간에 끊겨도 파일이 깨지지 않도록 임시 파일 후 교체)"""
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, path)
+
+    def add(self, other: 'PartialAggregate') -> 'PartialAggregate':
+        """다른 부분 집계를 이 부분 집계에 더합니다. (제자리 연산, self 반환)"""
+        self.repos += tuple(repo for repo in other.repos if repo not in self.repos)
+        self.participants.add_counts(other.participants)
+        for week, counts in other.weekly.items():
+            self.weekly[week]['pr'] += counts.get('pr', 0)
+            self.weekly[week]['issue'] += counts.get('issue', 0)
+        return self
+
+    def merge(self, other: 'PartialAggregate') -> 'PartialAggregate':
+        """두 부분 집계를 합친 새 부분 집계를 반환합니다. (원본은 변경하지 않음)"""
+        return PartialAggregate(self.repos, self.participants.copy(), self.weekly).add(other)
+
+    __add__ = merge
+
+    @classmethod
+    def combine(cls, partials: Iterable['PartialAggregate'], keys: Iterable[str] | None = None) -> 'PartialAggregate':
+        """
+        여러 부분 집계를 하나로 합칩니다. (저장소 순서가 결과의 저장소 순서로 유지됨)
+        결과 하나에 차례로 더하므로 입력 부분 집계는 변경하지 않고 복사도 결과 하나만 만듭니다.
+        keys는 결과의 집계 항목이며, 주어지지 않으면 첫 부분 집계의 집계 항목을 씁니다. (부분 집계가 없을 때도 사용)
+        """
+        partials = list(partials)
+        if keys is None:
+            keys = partials[0].participants.count_keys() if partials else PARTICIPANT_KEYS
+        combined = cls(participants=ParticipantTable(tuple(keys)))
+        for partial in partials:
+            combined.add(partial)
+        return combined
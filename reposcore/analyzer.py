@@ -1,18 +1,43 @@
 #!/usr/bin/env python3
+import hashlib
 import json
 import requests
-from datetime import datetime, timezone
+from datetime import date, datetime, timezone
 from zoneinfo import ZoneInfo
 from collections import defaultdict
+import numpy as np
 
-from .common_utils import log, is_verbose
+from .common_utils import log, is_verbose, OTHERS_NAME, rank_order
 from .github_utils import *
 from .theme_manager import ThemeManager 
+from .participants import ParticipantTable
+from .date_index import DailyCountIndex, kst_day
+from .scoring import ScoringRules, DEFAULT_SCORING_RULES
+from .enrichment import fetch_pr_details
+from .local_repo import iter_commits
+from .errors import RepositoryNotFoundError
+from .cache_file import (
+    CacheFormatError, read_cache, write_cache, cache_age, cache_lock, cache_policy, cache_sync_time, iso_to_epoch
+)
 
 import logging
-import sys
 import os
 
+logger = logging.getLogger(__name__)
+
+# 캐시를 다시 수집하지 않고 사용하는 시간 (초)
+CACHE_TTL = 3600
+
+
+def cache_policy_for(rules: ScoringRules, semester_start: date | None = None) -> str:
+    """점수 규칙과 학기 시작일로 만든 집계 기준 지문 (16자리 16진수). 캐시/체크포인트가 같은 기준으로 만들어졌는지 확인할 때 사용"""
+    text = f"{rules.fingerprint}|{semester_start.isoformat() if semester_start else ''}"
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()[:16]
+
+
+# 집계 기준이 기록되지 않은 이전 캐시/체크포인트는 기본 규칙, 학기 시작일 없이 만든 것으로 간주
+LEGACY_CACHE_POLICY = cache_policy_for(ScoringRules())
+
 ERROR_MESSAGES = {
     401: "❌ 인증 실패: 잘못된 GitHub 토큰입니다. 토큰 값을 확인해 주세요.",
     403: ("⚠️ 요청 실패 (403): GitHub API rate limit에 도달했습니다.\n"
@@ -39,50 +64,87 @@ def get_emoji(score):
 
 class RepoAnalyzer:
     """Class to analyze repository participation for scoring"""
-    # 점수 가중치
-    SCORE_WEIGHTS = {
-        'feat_bug_pr': 3,
-        'doc_pr': 2,
-        'typo_pr': 1,
-        'feat_bug_is': 2,
-        'doc_is': 1
-    }
+    # 점수 가중치 (기본 점수 규칙의 가중치, 저장소별 규칙은 rules 인자로 지정)
+    SCORE_WEIGHTS = DEFAULT_SCORING_RULES['weights']
     
     # 사용자 제외 목록
     EXCLUDED_USERS = {"kyahnu", "kyagrd"}
 
-    def __init__(self, repo_path: str, token: str | None = None, theme: str = 'default'):
+    def __init__(
+        self,
+        repo_path: str,
+        token: str | None = None,
+        theme: str = 'default',
+        check_exists: bool = True,
+        rules: ScoringRules | None = None
+    ):
         # 테스트용 저장소나 통합 분석용 저장소 식별
         self._is_test_repo = repo_path == "dummy/repo"
         self._is_multiple_repos = repo_path == "multiple_repos"
         
         # 테스트용이나 통합 분석용이 아닌 경우에만 실제 저장소 존재 여부 확인
-        if not self._is_test_repo and not self._is_multiple_repos:
+        if check_exists and not self._is_test_repo and not self._is_multiple_repos:
             if not check_github_repo_exists(repo_path):
-                logging.error(f"입력한 저장소 '{repo_path}'가 GitHub에 존재하지 않습니다.")
-                sys.exit(1)
+                raise RepositoryNotFoundError(repo_path)
         elif self._is_test_repo:
             log(f"ℹ️ [TEST MODE] '{repo_path}'는 테스트용 저장소로 간주합니다.", force=True)
         elif self._is_multiple_repos:
             log(f"ℹ️ [통합 분석] 여러 저장소의 통합 분석을 수행합니다.", force=True)
 
         self.repo_path = repo_path
-        self.participants: dict[str, dict[str, int]] = {}
+        # 점수 규칙 (라벨 → 집계 항목, 가중치, 상한). participants의 집계 항목도 규칙을 따름
+        self.rules = rules or ScoringRules()
+        self.participants = ParticipantTable(self.rules.categories)
         self.weekly_activity = defaultdict(lambda: {'pr': 0, 'issue': 0})
         self.semester_start_date = None
-
-        self.score = self.SCORE_WEIGHTS.copy()
+        # 이슈/PR 번호별 반영 내역: [작성자, PR 여부, 점수 반영 여부, 라벨 목록, 생성 시각]
+        self.items: dict[int, list] = {}
+        # 병합된 PR 번호별 상세 정보: [추가 줄 수, 삭제 줄 수, 병합한 사용자, 리뷰어 목록] (--enrich)
+        self.pr_details: dict[int, list] = {}
+        # 로컬 저장소 커밋 카운트: (login, KST 날짜 번호, 집계 항목 번호) → 커밋 수 (--local)
+        self.commit_days: dict[tuple[str, int, int], int] = defaultdict(int)
+        # 기간별 점수 계산용 참여자별·일별 누적 카운트 (반영 내역이 바뀌면 다시 만듦)
+        self._date_index = None
+        self._date_index_generation = 0
+
+        self.score = self.rules.weights.copy()
 
         self.theme_manager = ThemeManager()  # 테마 매니저 초기화
         self.set_theme(theme)                # 테마 설정
 
         self._data_collected = True
+        # 마지막으로 실패한 API 응답의 상태 코드 (수집 실패 원인 확인용)
+        self.last_error_status: int | None = None
         self.__previous_create_at = None
+        # 반영한 항목 중 가장 최근의 updated_at (ISO 문자열, 증분 갱신의 since 값)
+        self.last_updated: str | None = None
+
+        # 여러 저장소를 동시에 수집할 때 공유하는 요청 한도 (RateBudget)와 중단 신호 (threading.Event)
+        self.rate_budget = None
+        self.stop_event = None
+        # 수집 진행 상황을 보고할 ProgressReporter (--progress / --status-file)
+        self.progress = None
+        # 이 analyzer의 요청에만 사용할 디스크 HTTP 캐시 (없으면 use_http_cache()로 설정한 캐시)
+        self.http_cache = None
+        self._last_committed_page = 0
 
         self.SESSION = requests.Session()
         if token:
             self.SESSION.headers.update({'Authorization': f'Bearer {token}'})
 
+    @property
+    def participants(self) -> ParticipantTable:
+        """참여자별 활동 카운트 (login → {항목: 카운트}처럼 사용 가능한 ParticipantTable)"""
+        return self._participants
+
+    @participants.setter
+    def participants(self, value) -> None:
+        # 딕셔너리를 대입하는 기존 코드(캐시 로드, 테스트 등)도 그대로 동작하도록 테이블로 변환
+        if not isinstance(value, ParticipantTable):
+            value = ParticipantTable.from_dict(value, self.rules.categories)
+        self._participants = value
+        self._date_index = None
+
     @property
     def previous_create_at(self) -> int | None:
         if self.__previous_create_at is None:
@@ -92,7 +154,10 @@ class RepoAnalyzer:
 
     @previous_create_at.setter
     def previous_create_at(self, value):
-        self.__previous_create_at = datetime.fromtimestamp(value, tz=timezone.utc)
+        if value is None:
+            self.__previous_create_at = None
+        else:
+            self.__previous_create_at = datetime.fromtimestamp(value, tz=timezone.utc)
 
     def set_theme(self, theme_name: str) -> None:
         if theme_name in self.theme_manager.themes:
@@ -101,35 +166,81 @@ class RepoAnalyzer:
             raise ValueError(f"지원하지 않는 테마입니다: {theme_name}")
 
     def _handle_api_error(self, status_code: int) -> bool:
+        if status_code != 200:
+            self.last_error_status = status_code
         if status_code in ERROR_MESSAGES:
-            logging.error(ERROR_MESSAGES[status_code])
+            logger.error(ERROR_MESSAGES[status_code])
             self._data_collected = False
             return True
         elif status_code != 200:
-            logging.warning(f"⚠️ GitHub API 요청 실패: {status_code}")
+            logger.warning(f"⚠️ GitHub API 요청 실패: {status_code}")
             self._data_collected = False
             return True
         return False
 
-    def collect_PRs_and_issues(self) -> None:
+    def collect_PRs_and_issues(self, checkpoint_path: str | None = None, checkpoint_interval: int = 10) -> None:
         """
         하나의 API 호출로 GitHub 이슈 목록을 가져오고,
         pull_request 필드가 있으면 PR로, 없으면 issue로 간주.
         PR의 경우, 실제로 병합된 경우만 점수에 반영.
         이슈는 open / reopened / completed 상태만 점수에 반영합니다.
+
+        checkpoint_path가 주어지면 checkpoint_interval 페이지마다, 그리고 요청 실패나 중단(Ctrl-C) 시
+        진행 상태를 저장하고, 다음 실행에서는 마지막으로 저장된 페이지 다음부터 이어서 수집합니다.
         """
         # 테스트용 저장소나 통합 분석용인 경우 API 호출을 건너뜁니다
         if self._is_test_repo:
-            logging.info(f"ℹ️ [TEST MODE] '{self.repo_path}'는 테스트용 저장소입니다. 실제 GitHub API 호출을 수행하지 않습니다.")
+            logger.info(f"ℹ️ [TEST MODE] '{self.repo_path}'는 테스트용 저장소입니다. 실제 GitHub API 호출을 수행하지 않습니다.")
             return
         elif self._is_multiple_repos:
-            logging.info(f"ℹ️ [통합 분석] 통합 분석을 위한 저장소입니다. API 호출을 건너뜁니다.")
+            logger.info(f"ℹ️ [통합 분석] 통합 분석을 위한 저장소입니다. API 호출을 건너뜁니다.")
             return
             
         page = 1
         per_page = 100
 
+        if checkpoint_path:
+            last_page = self._load_checkpoint(checkpoint_path)
+            if last_page:
+                log(f"⏯️ 체크포인트에서 이어서 수집합니다: {self.repo_path} ({last_page + 1}페이지부터)", force=True)
+                page = last_page + 1
+
+        try:
+            self._collect_pages(page, per_page, checkpoint_path, checkpoint_interval)
+        except KeyboardInterrupt:
+            if checkpoint_path:
+                # 진행 중이던 페이지는 다음 실행에서 다시 받아도 update_item이 항목 번호로 교체하므로 중복 집계되지 않음
+                self._save_checkpoint(checkpoint_path, self._last_committed_page)
+                log(f"💾 수집을 중단합니다. 체크포인트 저장 완료: {checkpoint_path}", force=True)
+            raise
+
+        if not self._data_collected:
+            return
+        if checkpoint_path and os.path.exists(checkpoint_path):
+            os.remove(checkpoint_path)
+
+        if not self.participants:
+            logger.warning("⚠️ 수집된 데이터가 없습니다. (참여자 없음)")
+            logger.info("📄 참여자는 없지만, 결과 파일은 생성됩니다.")
+        else:
+            log("\n참여자별 활동 내역 (participants 딕셔너리):", force=is_verbose)
+            for user, info in self.participants.items():
+                log(f"{user}: {info}", force=is_verbose)
+
+    def _collect_pages(self, page: int, per_page: int, checkpoint_path: str | None, checkpoint_interval: int) -> None:
+        """page부터 마지막 페이지까지 /issues 목록을 받아 반영합니다."""
+        self._last_committed_page = page - 1
+        if self.progress is not None:
+            self.progress.start(self.repo_path)
+
         while True:
+            if self.stop_event is not None and self.stop_event.is_set():
+                # 다른 저장소 수집 실패나 Ctrl-C로 전체 실행이 중단되는 경우
+                if checkpoint_path:
+                    self._save_checkpoint(checkpoint_path, self._last_committed_page)
+                self._data_collected = False
+                return
+
             url = f"https://api.github.com/repos/{self.repo_path}/issues"
 
             response = retry_request(self.SESSION,
@@ -137,12 +248,20 @@ class RepoAnalyzer:
                                     max_retries=3,
                                     params={
                                         'state': 'all',
+                                        # 생성순 오름차순: 수집 도중 새 이슈가 생겨도 이미 받은 페이지가 밀리지 않음
+                                        'sort': 'created',
+                                        'direction': 'asc',
                                         'per_page': per_page,
                                         'page': page
-                                    })
+                                    },
+                                    rate_budget=self.rate_budget,
+                                    http_cache=self.http_cache)
         
             # 🔽 에러 처리 부분 25줄 → 3줄로 리팩토링
             if self._handle_api_error(response.status_code):
+                if checkpoint_path and self._last_committed_page > 0:
+                    self._save_checkpoint(checkpoint_path, self._last_committed_page)
+                    log(f"💾 체크포인트 저장 완료: {checkpoint_path} ({self._last_committed_page}페이지까지)", force=True)
                 return
 
             items = response.json()
@@ -151,103 +270,374 @@ class RepoAnalyzer:
 
             for item in items:
                 if 'created_at' not in item:
-                    logging.warning(f"⚠️ 요청 분석 실패")
+                    logger.warning(f"⚠️ 요청 분석 실패")
                     return
 
-                server_create_datetime = datetime.fromisoformat(item['created_at'])
-
-                if self.semester_start_date:
-                    created_date = server_create_datetime.astimezone(ZoneInfo("Asia/Seoul")).date()
-                    week_index = (created_date - self.semester_start_date).days // 7 + 1
-                    if 'pull_request' in item and item.get('pull_request', {}).get('merged_at'):
-                        self.weekly_activity[week_index]['pr'] += 1
-                    elif item.get('state_reason') in ('completed', 'reopened', None):
-                        self.weekly_activity[week_index]['issue'] += 1
-
-                self.__previous_create_at = server_create_datetime if self.__previous_create_at is None else max(self.__previous_create_at,server_create_datetime)
-
-                author = item.get('user', {}).get('login', 'Unknown')
-                if author not in self.participants:
-                    self.participants[author] = {
-                        'p_enhancement': 0,
-                        'p_bug': 0,
-                        'p_documentation': 0,
-                        'p_typo' : 0,
-                        'i_enhancement': 0,
-                        'i_bug': 0,
-                        'i_documentation': 0,
-                    }
-
-                labels = item.get('labels', [])
-                label_names = [label.get('name', '') for label in labels if label.get('name')]
-
-                state_reason = item.get('state_reason')
-
-                # PR 처리 (병합된 PR만)
-                if 'pull_request' in item:
-                    merged_at = item.get('pull_request', {}).get('merged_at')
-                    if merged_at:
-                        for label in label_names:
-                            key = f'p_{label}'
-                            if key in self.participants[author]:
-                                self.participants[author][key] += 1
-
-                # 이슈 처리 (open / reopened / completed 만 포함, not planned 제외)
-                else:
-                    if state_reason in ('completed', 'reopened', None):
-                        for label in label_names:
-                            key = f'i_{label}'
-                            if key in self.participants[author]:
-                                self.participants[author][key] += 1
+                self.update_item(item)
+
+            self._last_committed_page = page
+            if checkpoint_path and checkpoint_interval and page % checkpoint_interval == 0:
+                self._save_checkpoint(checkpoint_path, page)
 
             # 다음 페이지 검사
             link_header = response.headers.get('link', '')
+            if self.progress is not None:
+                self.progress.update(self.repo_path, page, last_page_number(link_header), len(items))
             if 'rel="next"' in link_header:
                 page += 1
             else:
                 break
 
-        if not self.participants:
-            logging.warning("⚠️ 수집된 데이터가 없습니다. (참여자 없음)")
-            logging.info("📄 참여자는 없지만, 결과 파일은 생성됩니다.")
+    def collect_updates(self) -> int:
+        """
+        마지막 반영 이후(last_updated부터) 변경된 이슈/PR만 updated_at 순으로 받아 반영합니다. (--watch)
+        since는 경계 시각을 포함하므로 이미 반영한 항목이 다시 오더라도 내역이 같으면 무시합니다.
+        실제로 반영 내역이 바뀐 항목 수를 반환하며, 요청이 실패하면 -1을 반환합니다.
+        """
+        if self._is_test_repo or self._is_multiple_repos:
+            return 0
+
+        url = f"https://api.github.com/repos/{self.repo_path}/issues"
+        params = {'state': 'all', 'sort': 'updated', 'direction': 'asc', 'per_page': 100}
+        if self.last_updated:
+            params['since'] = self.last_updated
+        changed = 0
+        page = 1
+        while True:
+            response = retry_request(self.SESSION, url, max_retries=3, params=dict(params, page=page),
+                                     rate_budget=self.rate_budget, http_cache=self.http_cache)
+            if self._handle_api_error(response.status_code):
+                self._data_collected = True
+                return -1
+            for item in response.json():
+                if 'created_at' in item and self.update_item(item):
+                    changed += 1
+            if 'rel="next"' not in response.headers.get('link', ''):
+                return changed
+            page += 1
+
+    def has_changes_since(self, watermark: int) -> bool | None:
+        """
+        요청 한 번으로 watermark(마지막으로 반영한 updated_at, epoch 초) 이후 바뀐 이슈/PR이 있는지 확인합니다.
+        가장 최근에 바뀐 항목 하나만 받아 비교하며, 요청이 실패하면 None을 반환합니다.
+        """
+        url = f"https://api.github.com/repos/{self.repo_path}/issues"
+        params = {'state': 'all', 'sort': 'updated', 'direction': 'desc', 'per_page': 1}
+        response = retry_request(self.SESSION, url, max_retries=1, params=params,
+                                 rate_budget=self.rate_budget, http_cache=self.http_cache)
+        if response.status_code != 200:
+            logger.debug(f"변경 여부 확인 실패: {self.repo_path} (status code: {response.status_code})")
+            return None
+        items = response.json()
+        return bool(items) and iso_to_epoch(items[0].get('updated_at')) > watermark
+
+    def _make_record(self, item: dict) -> list:
+        """
+        /issues 항목 하나를 반영 내역으로 변환합니다.
+        PR은 병합된 경우만, 이슈는 open / reopened / completed 상태만 점수에 반영합니다.
+        """
+        author = item.get('user', {}).get('login', 'Unknown')
+        is_pr = 'pull_request' in item
+        if is_pr:
+            counted = bool(item.get('pull_request', {}).get('merged_at'))
         else:
-            self.participants = {
-                user: info for user, info in self.participants.items()
-                if user not in self.EXCLUDED_USERS
-            }
-            log("\n참여자별 활동 내역 (participants 딕셔너리):", force=is_verbose)
-            for user, info in self.participants.items():
-                log(f"{user}: {info}", force=is_verbose)
+            counted = item.get('state_reason') in self.rules.valid_issue_states
+        labels = [label.get('name', '') for label in item.get('labels', []) if label.get('name')]
+        created = int(datetime.fromisoformat(item['created_at']).timestamp())
+        return [author, is_pr, counted, labels, created]
+
+    def _apply_record(self, record: list, sign: int = 1) -> None:
+        """반영 내역을 participants와 weekly_activity에 더하거나(sign=1) 뺍니다(sign=-1)."""
+        author, is_pr, counted, labels, created = record
+        self._date_index = None
+
+        if self.semester_start_date and counted:
+            created_date = datetime.fromtimestamp(created, tz=ZoneInfo("Asia/Seoul")).date()
+            week_index = (created_date - self.semester_start_date).days // 7 + 1
+            self.weekly_activity[week_index]['pr' if is_pr else 'issue'] += sign
+
+        if author in self.EXCLUDED_USERS:
+            return
+        participant_id = self.participants.add(author)
+        if not counted:
+            return
+
+        # 규칙에서 미리 만든 라벨 → 집계 항목 번호 표로 바로 찾음
+        label_index = self.rules.label_index(is_pr)
+        for label in labels:
+            index = label_index.get(label)
+            if index is not None:
+                self.participants.increment(participant_id, index, sign)
+
+    def _detail_counts(self, record: list, details: list):
+        """
+        병합된 PR의 상세 정보가 더하는 (login, 집계 항목 번호, 값) 목록.
+        변경 줄 수는 작성자에게, 리뷰와 병합은 작성자 본인이 아닌 경우 해당 사용자에게 셉니다.
+        """
+        author, is_pr, counted = record[0], record[1], record[2]
+        if not (is_pr and counted):
+            return
+        additions, deletions, merged_by, reviewers = details
+        enrichment = self.rules.enrichment
+        if 'changed_lines' in enrichment and author not in self.EXCLUDED_USERS:
+            yield author, enrichment['changed_lines'], additions + deletions
+        if 'merge' in enrichment and merged_by and merged_by != author and merged_by not in self.EXCLUDED_USERS:
+            yield merged_by, enrichment['merge'], 1
+        if 'review' in enrichment:
+            for reviewer in reviewers:
+                if reviewer != author and reviewer not in self.EXCLUDED_USERS:
+                    yield reviewer, enrichment['review'], 1
+
+    def _apply_details(self, record: list, details: list, sign: int = 1) -> None:
+        """PR 상세 정보를 participants에 더하거나(sign=1) 뺍니다(sign=-1)."""
+        self._date_index = None
+        for login, index, amount in self._detail_counts(record, details):
+            self.participants.increment(self.participants.add(login), index, sign * amount)
+
+    def set_pr_details(self, number: int, details: list) -> None:
+        """PR 하나의 상세 정보를 반영합니다. (이미 반영된 정보가 있으면 교체)"""
+        record = self.items.get(number)
+        previous = self.pr_details.get(number)
+        if record is not None and previous is not None:
+            self._apply_details(record, previous, -1)
+        self.pr_details[number] = details
+        if record is not None:
+            self._apply_details(record, details)
+
+    def _drop_pr_details(self, number: int, record: list) -> None:
+        """항목이 바뀌거나 삭제되면 상세 정보도 되돌리고 지워 다음 enrich_pull_requests에서 다시 조회하게 합니다."""
+        details = self.pr_details.pop(number, None)
+        if details is not None:
+            self._apply_details(record, details, -1)
+
+    def enrich_pull_requests(self, batch_size: int | None = None) -> int:
+        """
+        상세 정보가 없는 병합된 PR의 리뷰, 변경 줄 수, 병합 정보를 GraphQL로 여러 PR씩 묶어 조회해
+        점수 규칙의 PR 상세 정보 집계 항목(review / merge / changed_lines)에 반영합니다.
+        새로 반영한 PR 수를 반환합니다.
+        """
+        if not self.rules.enrichment or self._is_test_repo or self._is_multiple_repos:
+            return 0
+        numbers = [number for number, record in self.items.items()
+                   if record[1] and record[2] and number not in self.pr_details]
+        if not numbers:
+            return 0
+        if 'Authorization' not in self.SESSION.headers:
+            logger.warning("⚠️ GitHub GraphQL API는 토큰이 필요합니다. PR 상세 정보 조회를 건너뜁니다.")
+            return 0
+
+        kwargs = {'batch_size': batch_size} if batch_size else {}
+        details = fetch_pr_details(self.SESSION, self.repo_path, sorted(numbers), rate_budget=self.rate_budget, **kwargs)
+        for number, pr_details in details.items():
+            self.set_pr_details(number, pr_details)
+        log(f"🔍 PR 상세 정보 반영: {self.repo_path} ({len(details)}/{len(numbers)}개)", force=True)
+        return len(details)
+
+    def collect_local_commits(self, path: str, rev: str = "HEAD") -> int:
+        """
+        로컬 clone의 커밋 기록을 git log로 하나씩 읽어 점수 규칙의 커밋 집계 항목(commit / merge_commit /
+        co_authored)에 반영합니다. API 요청을 하지 않으며, 커밋별 내역 대신 (참여자, 날짜)별 카운트만 남기므로
+        커밋 수와 관계없이 메모리 사용량은 참여자 수 × 활동 일수에 비례합니다. 읽은 커밋 수를 반환합니다.
+        """
+        kinds = self.rules.commit_kinds
+        self._date_index = None
+        num_commits = 0
+        for commit in iter_commits(path, rev):
+            num_commits += 1
+            day = kst_day(commit.created)
+            counts = [(commit.author, 'merge_commit' if commit.is_merge else 'commit')]
+            counts.extend((login, 'co_authored') for login in commit.co_authors)
+            for login, kind in counts:
+                if kind not in kinds or login in self.EXCLUDED_USERS:
+                    continue
+                self.participants.increment(self.participants.add(login), kinds[kind])
+                self.commit_days[(login, day, kinds[kind])] += 1
+        log(f"📂 로컬 저장소 커밋 {num_commits}개 반영: {path}", force=True)
+        return num_commits
+
+    def update_item(self, item: dict) -> bool:
+        """
+        이슈/PR 항목을 반영합니다. 이미 반영된 번호라면 이전 내역을 빼고 새 내역으로 교체하므로
+        같은 항목에 대한 웹훅 이벤트가 여러 번 들어와도 중복 집계되지 않습니다.
+        반영 내역이 바뀌었으면 True를 반환합니다. (같은 내역이면 집계와 PR 상세 정보를 그대로 둠)
+        """
+        record = self._make_record(item)
+        updated_at = item.get('updated_at')
+        if updated_at and (self.last_updated is None or updated_at > self.last_updated):
+            self.last_updated = updated_at
+        number = item.get('number')
+        if number is not None:
+            previous = self.items.get(number)
+            if previous == record:
+                return False
+            if previous is not None:
+                self._drop_pr_details(number, previous)
+                self._apply_record(previous, -1)
+            self.items[number] = record
+        self._apply_record(record)
+
+        server_create_datetime = datetime.fromtimestamp(record[4], tz=timezone.utc)
+        if self.__previous_create_at is None or server_create_datetime > self.__previous_create_at:
+            self.__previous_create_at = server_create_datetime
+        return True
+
+    def remove_item(self, number: int) -> None:
+        """삭제되거나 이전(transfer)된 이슈/PR의 반영 내역을 되돌립니다."""
+        record = self.items.pop(number, None)
+        if record is not None:
+            self._drop_pr_details(number, record)
+            self._apply_record(record, -1)
+
+    def rename_label(self, old_name: str, new_name: str | None) -> None:
+        """라벨 이름 변경(new_name) 또는 삭제(None)를 이미 반영된 항목들에 적용합니다."""
+        for record in self.items.values():
+            labels = record[3]
+            if old_name not in labels:
+                continue
+            self._apply_record(record, -1)
+            record[3] = [label for label in labels if label != old_name]
+            if new_name:
+                record[3].append(new_name)
+            self._apply_record(record)
+
+    @property
+    def policy(self) -> str:
+        """현재 점수 규칙과 학기 시작일의 집계 기준 지문 (캐시/체크포인트에 함께 저장)"""
+        return cache_policy_for(self.rules, self.semester_start_date)
+
+    def _state_to_dict(self) -> dict:
+        """캐시/체크포인트에 저장할 수집 상태"""
+        return {
+            'policy': self.policy,
+            'update_time': self.previous_create_at,
+            'last_updated': self.last_updated,
+            'participants': self.participants.to_dict(),
+            'weekly_activity': dict(self.weekly_activity),
+            'items': self.items,
+            'pr_details': self.pr_details,
+        }
+
+    def _load_state(self, state: dict) -> None:
+        self._date_index = None
+        self.participants = state['participants']
+        self.previous_create_at = state.get('update_time')
+        self.last_updated = state.get('last_updated')
+        for week, counts in state.get('weekly_activity', {}).items():
+            self.weekly_activity[int(week)] = counts
+        self.items = {int(number): record for number, record in state.get('items', {}).items()}
+        self.pr_details = {int(number): details for number, details in state.get('pr_details', {}).items()}
+
+    def load_cache(self, cache_path: str) -> bool:
+        """
+        캐시 파일에서 participants, weekly_activity, 반영 내역을 불러옵니다. (이전 JSON 캐시도 가능)
+        이슈/PR별 반영 내역(items)이 없는 예전 캐시는 이후 갱신에서 같은 항목을 다시 더하게 되고,
+        다른 점수 규칙/학기 시작일로 만든 캐시는 participants가 items와 다른 기준으로 집계되어 있으므로
+        불러오지 않고 False를 반환합니다. (전체를 다시 수집해야 함)
+        """
+        state = read_cache(cache_path)
+        if 'items' not in state or state.get('policy', LEGACY_CACHE_POLICY) != self.policy:
+            return False
+        self._load_state(state)
+        return True
+
+    def save_cache(self, cache_path: str) -> None:
+        """participants, weekly_activity, 반영 내역을 캐시 파일로 저장합니다. (저장 시각은 헤더에 기록)"""
+        write_cache(cache_path, self._state_to_dict())
+
+    def sync_cache(self, cache_path: str, seen_sync_time: float | None) -> float | None:
+        """
+        갱신한 반영 내역을 캐시 파일 잠금(cache_lock) 안에서 저장하고 캐시의 저장 시각을 반환합니다. (--watch, ReposcoreClient)
+        seen_sync_time(이 analyzer가 마지막으로 불러오거나 저장한 시각) 이후 다른 실행이 캐시를 저장했으면 그 캐시를 불러와
+        이후 바뀐 항목만 다시 반영한 뒤 저장하므로, 더 새로운 캐시(웹훅으로 반영한 삭제 등)를 덮어쓰지 않습니다.
+        """
+        with cache_lock(cache_path):
+            sync_time = cache_sync_time(cache_path)
+            if sync_time is not None and sync_time != seen_sync_time:
+                try:
+                    reloaded = self.load_cache(cache_path)
+                except (CacheFormatError, ValueError):
+                    reloaded = False
+                if reloaded:
+                    log(f"🔄 다른 실행이 저장한 캐시 파일({os.path.basename(cache_path)})을 불러와 이어서 갱신합니다.", force=True)
+                    if self.collect_updates() < 0:
+                        # 불러온 캐시 그대로이므로 저장하지 않음 (다음 갱신에서 다시 시도)
+                        return sync_time
+                    self.enrich_pull_requests()
+            self.save_cache(cache_path)
+            return cache_sync_time(cache_path)
+
+    def _save_checkpoint(self, checkpoint_path: str, page: int) -> None:
+        """page까지 처리한 수집 상태를 체크포인트로 저장합니다. (중간에 끊겨도 파일이 깨지지 않도록 임시 파일 후 교체)"""
+        state = self._state_to_dict()
+        state.update({
+            'repo': self.repo_path,
+            'page': page,
+        })
+        tmp_path = f"{checkpoint_path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(state, f, ensure_ascii=False)
+        os.replace(tmp_path, checkpoint_path)
+
+    def _load_checkpoint(self, checkpoint_path: str) -> int:
+        """
+        체크포인트가 있으면 수집 상태를 복원하고 마지막으로 저장된 페이지 번호를 반환합니다.
+        체크포인트가 없거나 다른 저장소/점수 규칙/학기 시작일의 것이면 0을 반환합니다.
+        """
+        if not os.path.exists(checkpoint_path):
+            return 0
+        try:
+            with open(checkpoint_path, "r", encoding="utf-8") as f:
+                state = json.load(f)
+        except json.JSONDecodeError:
+            logger.warning(f"⚠️ 체크포인트 파일({checkpoint_path})이 손상되어 처음부터 수집합니다.")
+            return 0
 
-    def _extract_pr_counts(self, activities: dict) -> tuple[int, int, int, int, int]:
-        """PR 관련 카운트 추출"""
-        p_f = activities.get('p_enhancement', 0)
-        p_b = activities.get('p_bug', 0)
-        p_d = activities.get('p_documentation', 0)
-        p_t = activities.get('p_typo', 0)
-        p_fb = p_f + p_b
-        return p_f, p_b, p_d, p_t, p_fb
-
-    def _extract_issue_counts(self, activities: dict) -> tuple[int, int, int, int]:
-        """이슈 관련 카운트 추출"""
-        i_f = activities.get('i_enhancement', 0)
-        i_b = activities.get('i_bug', 0)
-        i_d = activities.get('i_documentation', 0)
-        i_fb = i_f + i_b
-        return i_f, i_b, i_d, i_fb
+        if state.get('repo') != self.repo_path or state.get('policy', LEGACY_CACHE_POLICY) != self.policy:
+            return 0
+        self._load_state(state)
+        return state.get('page', 0)
+
+    @property
+    def date_index(self) -> DailyCountIndex:
+        """
+        반영 내역으로 만든 참여자별·일별 누적 카운트 인덱스 (처음 사용할 때 한 번 만듦)
+        인덱스의 행은 participants의 id 순서이므로 참여자 삭제로 id 배치가 바뀌면 다시 만듭니다.
+        """
+        if self._date_index is None or self._date_index_generation != self.participants.generation:
+            extra = [
+                (login, kst_day(self.items[number][4]), index, amount)
+                for number, details in self.pr_details.items() if number in self.items
+                for login, index, amount in self._detail_counts(self.items[number], details)
+            ]
+            extra.extend((login, day, index, amount) for (login, day, index), amount in self.commit_days.items())
+            self._date_index = DailyCountIndex.from_records(
+                self.items.values(), self.participants.logins, self.rules, self.EXCLUDED_USERS, extra
+            )
+            self._date_index_generation = self.participants.generation
+        return self._date_index
+
+    def participants_between(self, start: date | None = None, end: date | None = None) -> ParticipantTable:
+        """
+        [start, end) 기간(KST 날짜 기준)에 생성된 이슈/PR만 센 참여자별 카운트를 반환합니다.
+        기간이 주어지지 않으면 전체 기간의 participants를 그대로 반환합니다.
+        """
+        if start is None and end is None:
+            return self.participants
+        counts = self.date_index.window_counts(len(self.participants), start, end)
+        return ParticipantTable.from_columns(self.participants.logins, counts, self.participants.count_keys())
 
     def _calculate_valid_counts(self, p_fb: int, p_d: int, p_t: int, i_fb: int, i_d: int) -> tuple[int, int]:
-        """유효한 카운트 계산"""
-        p_valid = p_fb + min(p_d + p_t, 3 * max(p_fb, 1))
-        i_valid = min(i_fb + i_d, 4 * p_valid)
+        """유효한 카운트 계산 (참여자 전체의 카운트 배열도 한 번에 계산 가능)"""
+        p_valid = p_fb + np.minimum(p_d + p_t, self.rules.doc_typo_cap * np.maximum(p_fb, 1))
+        i_valid = np.minimum(i_fb + i_d, self.rules.issue_cap * p_valid)
         return p_valid, i_valid
 
     def _calculate_adjusted_counts(self, p_fb: int, p_d: int, p_valid: int, i_fb: int, i_valid: int) -> tuple[int, int, int, int, int]:
-        """조정된 카운트 계산"""
-        p_fb_at = min(p_fb, p_valid)
-        p_d_at = min(p_d, p_valid - p_fb_at)
+        """조정된 카운트 계산 (참여자 전체의 카운트 배열도 한 번에 계산 가능)"""
+        p_fb_at = np.minimum(p_fb, p_valid)
+        p_d_at = np.minimum(p_d, p_valid - p_fb_at)
         p_t_at = p_valid - p_fb_at - p_d_at
-        i_fb_at = min(i_fb, i_valid)
+        i_fb_at = np.minimum(i_fb, i_valid)
         i_d_at = i_valid - i_fb_at
         return p_fb_at, p_d_at, p_t_at, i_fb_at, i_d_at
 
@@ -272,52 +662,157 @@ class RepoAnalyzer:
             "total": total
         }
 
-    def _finalize_scores(self, scores: dict, total_score_sum: float, user_info: dict | None = None) -> dict[str, dict[str, float]]:
-        """최종 점수 계산 및 정렬"""
-        # 비율 계산
-        for participant in scores:
-            total = scores[participant]["total"]
-            rate = (total / total_score_sum) * 100 if total_score_sum > 0 else 0
-            scores[participant]["rate"] = round(rate, 1)
+    def _score_columns(
+        self,
+        user_info: dict[str, str] | None = None,
+        start: date | None = None,
+        end: date | None = None
+    ) -> tuple[list[str], dict[str, np.ndarray]]:
+        """
+        참여자 이름 목록과 항목별 점수 배열을 계산합니다.
+        user_info가 주어지면 매핑된 참여자만 매핑된 이름으로 남기고,
+        start/end가 주어지면 [start, end) 기간의 활동만으로 계산합니다.
+        """
+        table = self.participants_between(start, end)
+        counts = np.zeros((len(table), len(table.count_keys())), dtype=np.int64)
+        for index, key in enumerate(table.count_keys()):
+            counts[:, index] = table.column(key)
+        score_columns = self._score_counts(counts)
+        names = table.logins
 
         # 사용자 정보 매핑 (제공된 경우)
         if user_info:
-            scores = {user_info[k]: scores.pop(k) for k in list(scores.keys()) if user_info.get(k) and scores.get(k)}
+            names, indices = self._map_user_info(names, user_info)
+            score_columns = {c: v[indices] for c, v in score_columns.items()}
 
-        return dict(sorted(scores.items(), key=lambda x: x[1]["total"], reverse=True))
+        return names, score_columns
 
-    def calculate_scores(self, user_info: dict[str, str] | None = None) -> dict[str, dict[str, float]]:
-        """참여자별 점수 계산"""
-        scores = {}
-        total_score_sum = 0
+    def _score_counts(self, counts: np.ndarray) -> dict[str, np.ndarray]:
+        """(참여자, 집계 항목) 카운트 행렬로부터 항목별 점수 배열을 계산합니다."""
+        # 참여자별로 반복하지 않고 점수 규칙의 그룹 행렬로 참여자 전체의 그룹별 카운트를 한 번에 계산
+        p_fb, p_d, p_t, i_fb, i_d = self.rules.group_counts(counts).T
 
-        for participant, activities in self.participants.items():
-            # PR 카운트 추출
-            p_f, p_b, p_d, p_t, p_fb = self._extract_pr_counts(activities)
-            
-            # 이슈 카운트 추출
-            i_f, i_b, i_d, i_fb = self._extract_issue_counts(activities)
-            
-            # 유효 카운트 계산
-            p_valid, i_valid = self._calculate_valid_counts(p_fb, p_d, p_t, i_fb, i_d)
-            
-            # 조정된 카운트 계산
-            p_fb_at, p_d_at, p_t_at, i_fb_at, i_d_at = self._calculate_adjusted_counts(
-                p_fb, p_d, p_valid, i_fb, i_valid
-            )
-            
-            # 총점 계산
-            total = self._calculate_total_score(p_fb_at, p_d_at, p_t_at, i_fb_at, i_d_at)
-            
-            scores[participant] = self._create_score_dict(p_fb_at, p_d_at, p_t_at, i_fb_at, i_d_at, total)
-            total_score_sum += total
+        # 유효 카운트 계산
+        p_valid, i_valid = self._calculate_valid_counts(p_fb, p_d, p_t, i_fb, i_d)
 
-        # 사용자 정보 매핑 (제공된 경우)
-        if user_info:
-            scores = {user_info[k]: scores.pop(k) for k in list(scores.keys()) if user_info.get(k) and scores.get(k)}
+        # 조정된 카운트 계산
+        p_fb_at, p_d_at, p_t_at, i_fb_at, i_d_at = self._calculate_adjusted_counts(
+            p_fb, p_d, p_valid, i_fb, i_valid
+        )
 
-        return dict(sorted(scores.items(), key=lambda x: x[1]["total"], reverse=True))
+        # 총점 계산
+        total = self._calculate_total_score(p_fb_at, p_d_at, p_t_at, i_fb_at, i_d_at)
+
+        score_columns = self._create_score_dict(p_fb_at, p_d_at, p_t_at, i_fb_at, i_d_at, total)
+        return {c: np.broadcast_to(v, (len(counts),)) for c, v in score_columns.items()}
+
+    @staticmethod
+    def _map_user_info(logins: list[str], user_info: dict[str, str]) -> tuple[list[str], np.ndarray]:
+        """user_info에 매핑된 참여자의 이름 목록과 원래 id 배열을 반환합니다."""
+        selected = {}
+        for index, login in enumerate(logins):
+            name = user_info.get(login)
+            if name:
+                selected[name] = index
+        return list(selected), np.fromiter(selected.values(), dtype=np.intp, count=len(selected))
+
+    def calculate_scores(
+        self,
+        user_info: dict[str, str] | None = None,
+        top: int | None = None,
+        include_others: bool = False,
+        start: date | None = None,
+        end: date | None = None
+    ) -> dict[str, dict[str, float]]:
+        """
+        참여자별 점수 계산 (총점 내림차순)
+        top이 주어지면 상위 top명만 반환하고, include_others이면 나머지 참여자의 합계를 OTHERS_NAME 행으로 덧붙입니다.
+        start/end가 주어지면 [start, end) 기간(KST 날짜 기준)에 생성된 이슈/PR만 점수에 반영합니다.
+        """
+        names, score_columns = self._score_columns(user_info, start, end)
+        order = rank_order(score_columns['total'], top)
+
+        categories = list(score_columns)
+        rows = zip(*(score_columns[c][order].tolist() for c in categories))
+        scores = {names[index]: dict(zip(categories, row)) for index, row in zip(order.tolist(), rows)}
+
+        if include_others and len(order) < len(names):
+            rest = np.ones(len(names), dtype=bool)
+            rest[order] = False
+            scores[OTHERS_NAME] = {c: score_columns[c][rest].sum().item() for c in categories}
+
+        return scores
+
+    def calculate_totals(
+        self,
+        user_info: dict[str, str] | None = None,
+        start: date | None = None,
+        end: date | None = None
+    ) -> dict[str, float]:
+        """참여자별 총점만 정렬 없이 계산합니다. (저장소별 총점 합산용)"""
+        names, score_columns = self._score_columns(user_info, start, end)
+        return dict(zip(names, score_columns['total'].tolist()))
+
+    def get_user_rank(
+        self,
+        name: str,
+        user_info: dict[str, str] | None = None,
+        start: date | None = None,
+        end: date | None = None
+    ) -> tuple[int, float, int] | None:
+        """
+        사용자 한 명의 (등수, 총점, 전체 참여자 수)를 전체 정렬 없이 계산합니다.
+        사용자를 찾을 수 없으면 None을 반환합니다.
+        """
+        names, score_columns = self._score_columns(user_info, start, end)
+        if name not in names:
+            return None
+        index = names.index(name)
+        total = score_columns['total']
+        user_total = total[index]
+        rank = int((total > user_total).sum() + (total[:index] == user_total).sum()) + 1
+        return rank, user_total.item(), len(names)
     
+    def score_timeline(self, user_info: dict[str, str] | None = None) -> tuple[list[str], list[int], np.ndarray, np.ndarray]:
+        """
+        학기 주차별 누적 총점과 등수를 계산합니다. (학기 시작일 설정 필요)
+        반영 내역을 주차별로 한 번 나눠 둔 뒤 주차 순서대로 카운트를 누적하면서 매 주차 전체 참여자의
+        점수(상한 규칙 적용)와 등수를 한 번에 계산하므로, 주차마다 calculate_scores를 다시 실행하지 않습니다.
+        반환값: (참여자 이름 목록, 주차 목록, 총점 행렬[주차, 참여자], 등수 행렬[주차, 참여자])
+        """
+        if not self.semester_start_date:
+            raise ValueError("점수 타임라인을 계산하려면 학기 시작일이 필요합니다.")
+
+        table = self.participants
+        names, indices = table.logins, None
+        if user_info:
+            names, indices = self._map_user_info(names, user_info)
+
+        participant_ids, days, counts = self.date_index.rows()
+        if len(days) == 0:
+            return names, [], np.zeros((0, len(names))), np.zeros((0, len(names)), dtype=np.int64)
+
+        # (날짜, 참여자) 행을 주차별로 나눔 (weekly_activity와 같은 주차 계산, 학기 전 활동은 0주차 이하)
+        row_weeks = (days - self.semester_start_date.toordinal()) // 7 + 1
+        weeks = list(range(min(int(row_weeks.min()), 1), int(row_weeks.max()) + 1))
+        order = np.argsort(row_weeks, kind='stable')
+        bounds = np.searchsorted(row_weeks[order], np.arange(weeks[0], weeks[-1] + 2))
+
+        cumulative = np.zeros((len(table), len(table.count_keys())), dtype=np.int64)
+        totals = np.zeros((len(weeks), len(names)))
+        ranks = np.zeros((len(weeks), len(names)), dtype=np.int64)
+        for week_index in range(len(weeks)):
+            rows = order[bounds[week_index]:bounds[week_index + 1]]
+            np.add.at(cumulative, participant_ids[rows], counts[rows])
+            total = self._score_counts(cumulative)['total']
+            if indices is not None:
+                total = total[indices]
+            totals[week_index] = total
+            # 동점이면 먼저 등장한 참여자가 앞 (get_user_rank와 같은 규칙)
+            ranks[week_index, np.argsort(-total, kind='stable')] = np.arange(1, len(names) + 1)
+
+        return names, weeks, totals, ranks
+
     def set_semester_start_date(self, date: datetime.date) -> None:
         """--semester-start 옵션에서 받은 학기 시작일 저장"""
         self.semester_start_date = date
@@ -347,16 +842,14 @@ class RepoAnalyzer:
 
         return averages
 
-    def is_cache_update_required(self, cache_path: str) -> bool:
-        """캐시 업데이트 필요 여부 확인"""
-        if not os.path.exists(cache_path):
-            return True
+    def cache_matches_policy(self, cache_path: str) -> bool:
+        """캐시가 지금과 같은 점수 규칙/학기 시작일로 만들어졌는지 헤더만 읽어 확인합니다. (기록이 없으면 LEGACY_CACHE_POLICY로 간주)"""
+        return (cache_policy(cache_path) or LEGACY_CACHE_POLICY) == self.policy
 
-        try:
-            with open(cache_path, 'r', encoding='utf-8') as f:
-                cache_data = json.load(f)
-                cached_timestamp = cache_data.get('update_time', 0)
-                current_timestamp = int(datetime.now(timezone.utc).timestamp())
-                return current_timestamp - cached_timestamp > 3600  # 1시간
-        except (json.JSONDecodeError, KeyError):
-            return True
+    def is_cache_update_required(self, cache_path: str) -> bool:
+        """
+        캐시 업데이트 필요 여부 확인 (캐시를 저장한 지 CACHE_TTL초가 지났거나 점수 규칙/학기 시작일이 다르면 필요)
+        캐시 파일의 헤더만 읽으므로 캐시 크기와 관계없이 바로 판단하며, 헤더가 없는 이전 JSON 캐시는 항상 갱신합니다.
+        """
+        age = cache_age(cache_path)
+        return age is None or age > CACHE_TTL or not self.cache_matches_policy(cache_path)
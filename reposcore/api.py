@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+import os
+import threading
+from collections.abc import Iterable
+from datetime import date
+
+import requests
+
+from .aggregate import PartialAggregate
+from .analyzer import RepoAnalyzer
+from .cache_file import cache_lock, cache_path_for, cache_sync_time, migrate_legacy_cache
+from .errors import RepositoryNotFoundError, error_for_status
+from .github_utils import RateBudget, TokenPool, validate_repo_format
+from .http_cache import HttpCache
+from .output_handler import OutputHandler
+from .scoring import ScoringRules
+
+# render()에서 지원하는 출력 형식
+RENDER_FORMATS = ('table', 'text', 'chart')
+
+
+class ReposcoreClient:
+    """
+    reposcore를 다른 프로그램 안에서 사용하기 위한 API.
+
+    명령행 인자, sys.exit, 로그 출력 설정 없이 결과를 반환하고, 실패하면 reposcore.errors의 예외를 발생시킵니다.
+    클라이언트 하나가 HTTP 세션, 요청 한도, 저장소별 수집 결과를 유지하므로 같은 클라이언트로 다시 호출하면
+    전체를 다시 수집하지 않고 바뀐 이슈/PR만 받아 갱신합니다. (여러 스레드에서 함께 사용 가능)
+
+    session에는 requests.Session과 같은 get/post를 가진 HTTP 클라이언트를, http_cache에는 HttpCache를 넣을 수 있고,
+    cache_dir을 주면 저장소별 수집 결과를 그 디렉토리의 캐시 파일로 저장하고 다음 실행에서 이어서 사용합니다.
+    """
+
+    def __init__(
+        self,
+        token: str | Iterable[str] | None = None,
+        *,
+        session: requests.Session | None = None,
+        rules: ScoringRules | None = None,
+        http_cache: HttpCache | None = None,
+        cache_dir: str | None = None,
+        rate_budget: RateBudget | None = None,
+        semester_start: date | None = None,
+        theme: str = 'default'
+    ):
+        tokens = [t.strip() for t in token.split(",") if t.strip()] if isinstance(token, str) else list(token or [])
+        self.session = session if session is not None else requests.Session()
+        if tokens and 'Authorization' not in self.session.headers:
+            self.session.headers['Authorization'] = f'Bearer {tokens[0]}'
+        if rate_budget is None:
+            rate_budget = TokenPool(tokens) if len(tokens) > 1 else RateBudget()
+        self.rate_budget = rate_budget
+        self.rules = rules or ScoringRules()
+        self.http_cache = http_cache
+        self.cache_dir = cache_dir
+        self.semester_start = semester_start
+        self.theme = theme
+        self.output_handler = OutputHandler(theme=theme)
+        self._analyzers: dict[str, RepoAnalyzer] = {}
+        self._locks: dict[str, threading.Lock] = {}
+        # 저장소별로 마지막으로 불러오거나 저장한 캐시의 저장 시각 (cache_dir을 함께 쓰는 다른 실행이 그 뒤에 저장했는지 확인용)
+        self._sync_times: dict[str, float | None] = {}
+        self._lock = threading.Lock()
+
+    def _repo_lock(self, repo: str) -> threading.Lock:
+        with self._lock:
+            return self._locks.setdefault(repo, threading.Lock())
+
+    def _new_analyzer(self, repo: str) -> RepoAnalyzer:
+        analyzer = RepoAnalyzer(repo, theme=self.theme, check_exists=False, rules=self.rules)
+        analyzer.SESSION = self.session
+        analyzer.rate_budget = self.rate_budget
+        analyzer.http_cache = self.http_cache
+        if self.semester_start:
+            analyzer.set_semester_start_date(self.semester_start)
+        return analyzer
+
+    @staticmethod
+    def _raise_for_failure(repo: str, analyzer: RepoAnalyzer) -> None:
+        status_code = analyzer.last_error_status
+        if status_code == 404:
+            raise RepositoryNotFoundError(repo)
+        raise error_for_status(status_code, f"'{repo}' 수집 중 GitHub API 요청이 실패했습니다. (status code: {status_code})")
+
+    def _save(self, repo: str, analyzer: RepoAnalyzer) -> None:
+        """처음 수집한 저장소의 캐시를 저장합니다. (collect()에서 이미 cache_lock을 잡은 상태로 호출)"""
+        if self.cache_dir:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            cache_path = cache_path_for(self.cache_dir, repo)
+            analyzer.save_cache(cache_path)
+            self._sync_times[repo] = cache_sync_time(cache_path)
+
+    def _save_refreshed(self, repo: str, analyzer: RepoAnalyzer) -> None:
+        """갱신한 저장소의 캐시를 잠금 안에서 저장합니다. (그사이 다른 실행이 저장한 캐시가 있으면 이어서 반영)"""
+        if self.cache_dir:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            cache_path = cache_path_for(self.cache_dir, repo)
+            self._sync_times[repo] = analyzer.sync_cache(cache_path, self._sync_times.get(repo))
+
+    def collect(self, repo: str, refresh: bool = True) -> RepoAnalyzer:
+        """
+        저장소의 이슈/PR을 수집한 RepoAnalyzer를 반환합니다.
+        처음 호출하면 전체를 수집하고(cache_dir에 캐시가 있으면 불러온 뒤 바뀐 항목만), 이후 호출에서는
+        refresh=True이면 마지막으로 반영한 이후 바뀐 항목만 받아 갱신합니다.
+        """
+        if not validate_repo_format(repo):
+            raise ValueError(f"저장소는 'owner/repo' 형식이어야 합니다: {repo}")
+
+        with self._repo_lock(repo):
+            analyzer = self._analyzers.get(repo)
+            if analyzer is None:
+                analyzer = self._new_analyzer(repo)
+                if self.cache_dir:
+                    # 같은 cache_dir을 쓰는 다른 프로세스가 이 저장소를 수집 중이면 끝날 때까지 기다렸다가 그 캐시에서 이어서 갱신
+                    os.makedirs(self.cache_dir, exist_ok=True)
+                    with cache_lock(cache_path_for(self.cache_dir, repo)):
+                        self._collect_new(repo, analyzer)
+                else:
+                    self._collect_new(repo, analyzer)
+                self._analyzers[repo] = analyzer
+            elif refresh:
+                changed = analyzer.collect_updates()
+                if changed < 0:
+                    self._raise_for_failure(repo, analyzer)
+                changed += analyzer.enrich_pull_requests()
+                if changed:
+                    self._save_refreshed(repo, analyzer)
+            return analyzer
+
+    def _collect_new(self, repo: str, analyzer: RepoAnalyzer) -> None:
+        """처음 사용하는 저장소를 캐시(있으면 불러온 뒤 바뀐 항목만) 또는 전체 수집으로 채우고 캐시를 저장합니다."""
+        cache_path = cache_path_for(self.cache_dir, repo) if self.cache_dir else None
+        if cache_path:
+            migrate_legacy_cache(cache_path)
+        if cache_path and os.path.exists(cache_path) and analyzer.load_cache(cache_path):
+            changed = analyzer.collect_updates()
+        else:
+            analyzer.collect_PRs_and_issues()
+            changed = 0 if analyzer._data_collected else -1
+        if changed < 0:
+            self._raise_for_failure(repo, analyzer)
+        analyzer.enrich_pull_requests()
+        self._save(repo, analyzer)
+
+    def score(
+        self,
+        repo: str,
+        user_info: dict[str, str] | None = None,
+        top: int | None = None,
+        include_others: bool = False,
+        start: date | None = None,
+        end: date | None = None
+    ) -> dict[str, dict[str, float]]:
+        """저장소 하나의 참여자별 점수를 반환합니다. (아직 수집하지 않은 저장소만 수집)"""
+        analyzer = self.collect(repo, refresh=False)
+        return analyzer.calculate_scores(user_info, top=top, include_others=include_others, start=start, end=end)
+
+    def aggregate(self, repos: Iterable[str], start: date | None = None, end: date | None = None) -> PartialAggregate:
+        """여러 저장소의 참여자별 카운트와 주차별 활동을 합친 결과를 반환합니다."""
+        repos = list(dict.fromkeys(repos))
+        partials = [PartialAggregate.from_analyzer(repo, self.collect(repo, refresh=False), start, end) for repo in repos]
+        return PartialAggregate.combine(partials, self.rules.categories)
+
+    def score_overall(
+        self,
+        repos: Iterable[str],
+        user_info: dict[str, str] | None = None,
+        top: int | None = None,
+        include_others: bool = False,
+        start: date | None = None,
+        end: date | None = None
+    ) -> dict[str, dict[str, float]]:
+        """여러 저장소의 활동을 합쳐 계산한 참여자별 통합 점수를 반환합니다."""
+        overall = self.aggregate(repos, start, end)
+        analyzer = RepoAnalyzer("multiple_repos", theme=self.theme, check_exists=False, rules=self.rules)
+        analyzer.participants = overall.participants
+        return analyzer.calculate_scores(user_info, top=top, include_others=include_others)
+
+    def render(
+        self,
+        scores: dict[str, dict[str, float]],
+        output_dir: str,
+        formats: Iterable[str] = RENDER_FORMATS,
+        show_grade: bool = False,
+        page_size: int | None = None
+    ) -> list[str]:
+        """점수를 score.csv / score.txt / 차트 이미지로 output_dir에 저장하고 만든 파일 경로 목록을 반환합니다."""
+        formats = set(formats)
+        unknown = formats - set(RENDER_FORMATS)
+        if unknown:
+            raise ValueError(f"지원하지 않는 출력 형식입니다: {', '.join(sorted(unknown))}")
+        os.makedirs(output_dir, exist_ok=True)
+        paths = []
+        if 'table' in formats:
+            paths.append(os.path.join(output_dir, "score.csv"))
+            self.output_handler.generate_count_csv(scores, save_path=paths[-1])
+        if 'text' in formats:
+            paths.append(os.path.join(output_dir, "score.txt"))
+            self.output_handler.generate_text(scores, paths[-1])
+        if 'chart' in formats:
+            chart_path = os.path.join(output_dir, "chart_grade.png" if show_grade else "chart.png")
+            paths.extend(self.output_handler.generate_chart(scores, save_path=chart_path, show_grade=show_grade,
+                                                            page_size=page_size))
+        return paths
@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+import json
+import logging
+import mmap
+import os
+import struct
+import threading
+import time
+import zlib
+from collections.abc import Iterator
+from contextlib import contextmanager
+from datetime import datetime
+from typing import NamedTuple
+
+from .common_utils import log
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+# 저장소 캐시 파일 형식
+#   [헤더 64바이트][zlib으로 압축한 JSON 수집 상태]
+# 헤더만 읽으면 캐시를 언제 저장했는지, 어디까지 반영했는지 알 수 있으므로
+# 캐시 갱신 여부를 판단할 때 본문을 읽거나 해제하지 않습니다.
+MAGIC = b"RSCACHE\0"
+FORMAT_VERSION = 1
+# magic, 형식 버전, 예약, 저장 시각(UTC epoch 초), 마지막 반영 updated_at(epoch 초, 없으면 0),
+# 항목 수, 본문 길이, 본문 CRC32, 집계 기준 지문(점수 규칙 + 학기 시작일, 없으면 0) (나머지는 0으로 채움)
+_HEADER = struct.Struct("<8sHHdqQQIQ")
+HEADER_SIZE = 64
+
+COMPRESS_LEVEL = 6
+
+
+class CacheFormatError(ValueError):
+    """캐시 파일이 이 형식이 아니거나 손상된 경우"""
+
+
+class CacheHeader(NamedTuple):
+    version: int
+    sync_time: float
+    last_updated: int
+    item_count: int
+    body_length: int
+    checksum: int
+    policy: int
+
+
+def _parse_header(data: bytes) -> CacheHeader:
+    if len(data) < HEADER_SIZE or data[:len(MAGIC)] != MAGIC:
+        raise CacheFormatError("reposcore 캐시 파일이 아닙니다.")
+    _, version, _, sync_time, last_updated, item_count, body_length, checksum, policy = _HEADER.unpack_from(data)
+    if version != FORMAT_VERSION:
+        raise CacheFormatError(f"지원하지 않는 캐시 형식 버전입니다: {version}")
+    return CacheHeader(version, sync_time, last_updated, item_count, body_length, checksum, policy)
+
+
+def cache_path_for(output_dir: str, repo: str) -> str:
+    """저장소별 캐시 파일 경로 (예: results/cache_oss2025hnu_reposcore-py.bin)"""
+    return os.path.join(output_dir, f"cache_{repo.replace('/', '_')}.bin")
+
+
+def iso_to_epoch(value: str | None) -> int:
+    """ISO 8601 시각(예: 2025-03-10T01:00:00Z)을 epoch 초로 변환합니다. (없으면 0)"""
+    if not value:
+        return 0
+    return int(datetime.fromisoformat(value.replace('Z', '+00:00')).timestamp())
+
+
+def read_header(path: str) -> CacheHeader:
+    """캐시 파일의 헤더(HEADER_SIZE 바이트)만 읽습니다. 형식이 다르면 CacheFormatError를 발생시킵니다."""
+    with open(path, 'rb') as f:
+        return _parse_header(f.read(HEADER_SIZE))
+
+
+def write_cache(path: str, state: dict, sync_time: float | None = None) -> CacheHeader:
+    """
+    수집 상태를 헤더 + 압축 본문 형식으로 저장하고 기록한 헤더를 반환합니다.
+    같은 디렉토리의 임시 파일에 쓴 뒤 교체하므로 다른 프로세스가 동시에 읽어도 쓰다 만 파일을 보지 않습니다.
+    """
+    body = zlib.compress(json.dumps(state, ensure_ascii=False, separators=(',', ':')).encode('utf-8'), COMPRESS_LEVEL)
+    header = CacheHeader(
+        FORMAT_VERSION,
+        time.time() if sync_time is None else sync_time,
+        iso_to_epoch(state.get('last_updated')),
+        len(state.get('items', ())),
+        len(body),
+        zlib.crc32(body),
+        int(state['policy'], 16) if state.get('policy') else 0
+    )
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(_HEADER.pack(MAGIC, header.version, 0, *header[1:]).ljust(HEADER_SIZE, b"\0"))
+            f.write(body)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    return header
+
+
+@contextmanager
+def cache_lock(path: str) -> Iterator[bool]:
+    """
+    캐시 파일별 잠금 (path + '.lock' 파일에 flock). 다른 프로세스/스레드가 잠그고 있으면 풀릴 때까지 기다립니다.
+    기다렸는지 여부를 반환하므로, 기다린 경우 그동안 다른 쪽이 저장한 캐시를 다시 확인해서 사용할 수 있습니다.
+    fcntl이 없는 환경(Windows)에서는 잠그지 않습니다. (교체 방식 저장이므로 파일이 깨지지는 않음)
+    """
+    if fcntl is None:
+        yield False
+        return
+    with open(f"{path}.lock", 'a') as lock_file:
+        try:
+            fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            waited = False
+        except BlockingIOError:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            waited = True
+        try:
+            yield waited
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+class CacheFile:
+    """
+    캐시 파일을 메모리 매핑으로 여는 클래스.
+    열 때는 헤더만 확인하므로 header의 저장 시각, 항목 수 등은 본문을 풀지 않고 볼 수 있습니다.
+    load()는 매핑된 영역에서 본문 전체의 체크섬 검사, 압축 해제, JSON 파싱을 한 번에 합니다. (일부만 푸는 기능은 없음)
+    """
+
+    def __init__(self, path: str):
+        with open(path, 'rb') as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            self.header = _parse_header(self._mmap[:HEADER_SIZE])
+            if len(self._mmap) < HEADER_SIZE + self.header.body_length:
+                raise CacheFormatError("캐시 파일이 중간에 잘렸습니다.")
+        except CacheFormatError:
+            self.close()
+            raise
+
+    def load(self) -> dict:
+        """본문을 검증하고 풀어서 수집 상태 딕셔너리를 반환합니다."""
+        with memoryview(self._mmap)[HEADER_SIZE:HEADER_SIZE + self.header.body_length] as body:
+            if zlib.crc32(body) != self.header.checksum:
+                raise CacheFormatError("캐시 파일의 체크섬이 맞지 않습니다.")
+            return json.loads(zlib.decompress(body))
+
+    def close(self) -> None:
+        self._mmap.close()
+
+    def __enter__(self) -> 'CacheFile':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def read_cache(path: str) -> dict:
+    """
+    캐시 파일의 수집 상태를 읽습니다. 본문 전체를 풀어 파싱하므로 갱신 여부만 확인할 때는 cache_age 등 헤더 함수를 사용합니다.
+    이전 버전에서 JSON으로 저장한 캐시나 부분 집계 파일도 그대로 읽습니다.
+    """
+    with open(path, 'rb') as f:
+        is_binary = f.read(len(MAGIC)) == MAGIC
+    if not is_binary:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    with CacheFile(path) as cache:
+        return cache.load()
+
+
+def migrate_json_cache(json_path: str, path: str) -> CacheHeader:
+    """
+    이전 버전의 JSON 캐시(json_path)를 이 형식(path)으로 옮기고 JSON 파일은 삭제합니다.
+    JSON 파일을 마지막으로 수정한 시각을 저장 시각으로 기록하므로 캐시 유효 시간은 그대로 이어집니다.
+    """
+    with open(json_path, 'r', encoding='utf-8') as f:
+        state = json.load(f)
+    header = write_cache(path, state, sync_time=os.path.getmtime(json_path))
+    try:
+        os.remove(json_path)
+    except FileNotFoundError:  # 다른 실행이 동시에 옮긴 경우
+        pass
+    return header
+
+
+def migrate_legacy_cache(path: str) -> bool:
+    """
+    path에 캐시가 없고 같은 이름의 이전 버전 JSON 캐시(cache_<저장소>.json)만 있으면 이 형식으로 옮기고 True를 반환합니다.
+    읽을 수 없는 JSON 캐시는 그대로 두고 경고만 남깁니다. (같은 캐시의 cache_lock 안에서 호출)
+    """
+    json_path = f"{os.path.splitext(path)[0]}.json"
+    if os.path.exists(path) or not os.path.exists(json_path):
+        return False
+    try:
+        migrate_json_cache(json_path, path)
+    except FileNotFoundError:  # 다른 실행이 이미 옮긴 경우
+        return False
+    except (OSError, ValueError) as e:
+        logger.warning(f"⚠️ 이전 JSON 캐시({os.path.basename(json_path)})를 옮기지 못했습니다: {e}")
+        return False
+    log(f"📦 이전 JSON 캐시({os.path.basename(json_path)})를 {os.path.basename(path)}로 옮겼습니다.", force=True)
+    return True
+
+
+def cache_age(path: str, now: float | None = None) -> float | None:
+    """캐시를 저장한 지 몇 초가 지났는지 헤더만 읽어 반환합니다. (이 형식의 캐시가 아니면 None)"""
+    sync_time = cache_sync_time(path)
+    if sync_time is None:
+        return None
+    return (time.time() if now is None else now) - sync_time
+
+
+def cache_sync_time(path: str) -> float | None:
+    """캐시를 저장한 시각(epoch 초)을 헤더만 읽어 반환합니다. (이 형식의 캐시가 아니면 None)"""
+    try:
+        return read_header(path).sync_time
+    except (OSError, CacheFormatError):
+        return None
+
+
+def cache_watermark(path: str) -> int | None:
+    """캐시에 마지막으로 반영한 updated_at(epoch 초)을 헤더만 읽어 반환합니다. (알 수 없으면 None)"""
+    try:
+        return read_header(path).last_updated or None
+    except (OSError, CacheFormatError):
+        return None
+
+
+def cache_policy(path: str) -> str | None:
+    """캐시를 만든 집계 기준 지문(RepoAnalyzer.policy)을 헤더만 읽어 반환합니다. (기록이 없거나 이 형식이 아니면 None)"""
+    try:
+        policy = read_header(path).policy
+    except (OSError, CacheFormatError):
+        return None
+    return f"{policy:016x}" if policy else None
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+import gzip
+import json
+import os
+import threading
+import time
+from collections import defaultdict
+
+import requests
+
+from .response_record import response_from_record, response_record
+
+# 녹화 파일 이름 (요청/응답 한 쌍을 한 줄의 JSON으로, gzip 압축)
+CASSETTE_FILE = "cassette.jsonl.gz"
+
+
+class CassetteMissError(LookupError):
+    """재생 모드에서 녹화되지 않은 요청을 보낸 경우"""
+
+
+def request_key(url: str, params: dict | None = None) -> str:
+    """URL과 쿼리 인자로 요청을 구분하는 키 (인자 순서와 무관, 인증 헤더는 포함하지 않음)"""
+    if not params:
+        return url
+    query = "&".join(f"{key}={params[key]}" for key in sorted(params))
+    return f"{url}?{query}"
+
+
+class Cassette:
+    """
+    GitHub API 응답을 녹화(record)하거나 녹화된 응답을 재생(replay)하는 클래스.
+
+    녹화 모드에서는 retry_request가 받은 모든 응답(상태 코드, 헤더, 본문)을 받은 순서대로 저장하고,
+    재생 모드에서는 같은 요청에 대해 녹화된 응답을 같은 순서로 돌려줍니다. 녹화된 응답보다 요청이 많으면
+    마지막 응답을 반복합니다. latency를 주면 재생할 때마다 그만큼 대기해 네트워크 지연을 흉내 냅니다.
+    """
+
+    def __init__(self, directory: str, mode: str, latency: float = 0.0):
+        if mode not in ('record', 'replay'):
+            raise ValueError(f"지원하지 않는 모드입니다: {mode}")
+        self.directory = directory
+        self.mode = mode
+        self.latency = latency
+        self.path = os.path.join(directory, CASSETTE_FILE)
+        self._lock = threading.Lock()
+        self._file = None
+        self._responses: dict[str, list[dict]] = defaultdict(list)
+        self._positions: dict[str, int] = defaultdict(int)
+
+        if mode == 'record':
+            os.makedirs(directory, exist_ok=True)
+            self._file = gzip.open(self.path, 'wt', encoding='utf-8')
+        else:
+            if not os.path.exists(self.path):
+                raise FileNotFoundError(f"녹화 파일이 없습니다: {self.path}")
+            with gzip.open(self.path, 'rt', encoding='utf-8') as f:
+                for line in f:
+                    entry = json.loads(line)
+                    self._responses[entry['key']].append(entry)
+
+    @property
+    def recording(self) -> bool:
+        return self.mode == 'record'
+
+    def record(self, url: str, params: dict | None, response: requests.Response) -> None:
+        """응답 하나를 녹화 파일에 추가합니다."""
+        entry = {'key': request_key(url, params), **response_record(response)}
+        with self._lock:
+            self._file.write(json.dumps(entry, ensure_ascii=False) + "\n")
+
+    def play(self, url: str, params: dict | None = None) -> requests.Response:
+        """녹화된 응답을 순서대로 돌려줍니다."""
+        key = request_key(url, params)
+        with self._lock:
+            entries = self._responses.get(key)
+            if not entries:
+                raise CassetteMissError(f"녹화되지 않은 요청입니다: {key}")
+            position = self._positions[key]
+            self._positions[key] = min(position + 1, len(entries) - 1)
+            entry = entries[position]
+
+        if self.latency:
+            time.sleep(self.latency)
+
+        return response_from_record(entry, key)
+
+    def close(self) -> None:
+        if self._file is not None:
+            with self._lock:
+                self._file.close()
+                self._file = None
@@ -1,17 +1,39 @@
 import sys
 import logging
 
-from datetime import datetime
+import numpy as np
+
+from collections import defaultdict
 
 is_verbose = False
 
-# logging 모듈 기본 설정 (analyzer.py와 동일한 설정)
-logging.basicConfig(
-    stream=sys.stdout,
-    level=logging.INFO,
-    format='[%(asctime)s] [%(levelname)s] %(message)s',
-    datefmt='%Y-%m-%d %H:%M:%S'
-)
+# --top 사용 시 상위 N명 외 나머지 참여자의 합계 행 이름 (GitHub 사용자명에 쓸 수 없는 문자로 구분)
+OTHERS_NAME = "(others)"
+
+LOG_DATE_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+# 라이브러리로 사용할 때는 아무것도 출력하지 않도록 패키지 로거에는 NullHandler만 둠
+# (CLI는 configure_logging()으로 출력을 설정)
+logging.getLogger("reposcore").addHandler(logging.NullHandler())
+# log()로 출력하는 진행 메시지용 로거 (로그 수준 없이 시각만 붙여 출력)
+_console = logging.getLogger("reposcore.console")
+_console.propagate = False
+_console.addHandler(logging.NullHandler())
+
+
+def configure_logging() -> None:
+    """CLI 실행 시 로그와 진행 메시지를 표준 출력으로 출력하도록 설정합니다."""
+    logging.basicConfig(
+        stream=sys.stdout,
+        level=logging.INFO,
+        format='[%(asctime)s] [%(levelname)s] %(message)s',
+        datefmt=LOG_DATE_FORMAT
+    )
+    if not any(isinstance(handler, logging.StreamHandler) for handler in _console.handlers):
+        handler = logging.StreamHandler(sys.stdout)
+        handler.setFormatter(logging.Formatter('[%(asctime)s] %(message)s', datefmt=LOG_DATE_FORMAT))
+        _console.addHandler(handler)
+    _console.setLevel(logging.INFO)
 
 # 등수를 영어 서수로 변환하는 함수
 def get_ordinal_suffix(rank):
@@ -29,5 +51,41 @@ def get_ordinal_suffix(rank):
 # -v or --vebose 옵션에 따라 로그를 다르게 출력하는 함수
 def log(message: str, force: bool = False):
     if is_verbose or force:
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        print(f"[{timestamp}] {message}")
\ No newline at end of file
+        _console.info(message)
+
+
+def rank_order(total: np.ndarray, top: int | None = None) -> np.ndarray:
+    """
+    총점 내림차순 인덱스를 반환합니다. (동점이면 먼저 등장한 참여자가 앞)
+    top이 주어지면 전체를 정렬하지 않고 부분 선택(argpartition)으로 상위 top명만 골라 정렬합니다.
+    """
+    if top is None or top >= len(total):
+        return np.argsort(-total, kind='stable')
+    if top <= 0:
+        return np.empty(0, dtype=np.intp)
+
+    threshold = total[np.argpartition(-total, top - 1)[:top]].min()
+    above = np.flatnonzero(total > threshold)
+    ties = np.flatnonzero(total == threshold)[:top - len(above)]
+    candidates = np.concatenate([above, ties])
+    return candidates[np.argsort(-total[candidates], kind='stable')]
+
+
+# 점수 딕셔너리에서 상위 top명만 고르는 함수 (rank_order와 같은 부분 선택)
+def select_top_scores(
+    scores: dict[str, dict[str, float]],
+    top: int | None = None,
+    include_others: bool = False,
+    key: str = "total"
+) -> dict[str, dict[str, float]]:
+    names = list(scores)
+    total = np.fromiter((scores[name][key] for name in names), dtype=float, count=len(names))
+    selected = {names[index]: scores[names[index]] for index in rank_order(total, top).tolist()}
+    if include_others and len(selected) < len(scores):
+        others = defaultdict(int)
+        for name, score in scores.items():
+            if name not in selected:
+                for category, value in score.items():
+                    others[category] += value
+        selected[OTHERS_NAME] = dict(others)
+    return selected
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+from collections.abc import Iterable
+from datetime import date, datetime
+from zoneinfo import ZoneInfo
+
+import numpy as np
+
+from .scoring import ScoringRules
+
+KST = ZoneInfo("Asia/Seoul")
+
+# (참여자 id, 날짜) 쌍을 하나의 정수로 합칠 때 쓰는 날짜 범위 (date.toordinal() 최댓값 + 1)
+_DAY_SPAN = date.max.toordinal() + 1
+
+
+def kst_day(timestamp: int) -> int:
+    """유닉스 타임스탬프를 KST 기준 날짜 번호(date.toordinal())로 변환"""
+    return datetime.fromtimestamp(timestamp, tz=KST).date().toordinal()
+
+
+class DailyCountIndex:
+    """
+    참여자별·일별 누적 활동 카운트 인덱스.
+
+    점수에 반영되는 이슈/PR을 (참여자 id, 날짜) 순으로 정렬한 뒤 항목별 누적합을 저장해 두므로,
+    임의의 기간 [start, end)의 카운트는 참여자마다 경계 위치 두 곳의 누적합 차이로 바로 구할 수 있습니다.
+    경계 위치는 참여자 전체에 대해 한 번의 searchsorted로 찾습니다.
+    """
+
+    def __init__(self, keys: tuple[str, ...], positions: np.ndarray, counts: np.ndarray):
+        self.keys_ = tuple(keys)
+        # (참여자 id * _DAY_SPAN + 날짜) 오름차순
+        self._positions = positions
+        # _prefix[i]: 앞의 i개 (참여자, 날짜) 행의 항목별 카운트 합
+        self._prefix = np.zeros((len(positions) + 1, len(self.keys_)), dtype=np.int64)
+        np.cumsum(counts, axis=0, out=self._prefix[1:])
+
+    @classmethod
+    def from_records(
+        cls,
+        records: Iterable[list],
+        logins: list[str],
+        rules: ScoringRules,
+        excluded_users: set[str] = frozenset(),
+        extra: Iterable[tuple[str, int, int, int]] = ()
+    ) -> 'DailyCountIndex':
+        """
+        RepoAnalyzer의 반영 내역([작성자, PR 여부, 점수 반영 여부, 라벨 목록, 생성 시각])으로 인덱스를 만듭니다.
+        logins는 ParticipantTable의 id 순서 login 목록이며, 라벨은 점수 규칙의 집계 항목으로 셉니다.
+        extra는 라벨 외의 카운트(PR 상세 정보, 커밋)로, (login, KST 날짜 번호, 집계 항목 번호, 값) 목록입니다.
+        """
+        ids = {login: participant_id for participant_id, login in enumerate(logins)}
+        keys = rules.categories
+        positions, columns, amounts = [], [], []
+        for author, is_pr, counted, labels, created in records:
+            participant_id = ids.get(author)
+            if not counted or participant_id is None or author in excluded_users:
+                continue
+            position = participant_id * _DAY_SPAN + kst_day(created)
+            label_index = rules.label_index(is_pr)
+            for label in labels:
+                index = label_index.get(label)
+                if index is not None:
+                    positions.append(position)
+                    columns.append(index)
+                    amounts.append(1)
+        for login, day, index, amount in extra:
+            participant_id = ids.get(login)
+            if participant_id is not None:
+                positions.append(participant_id * _DAY_SPAN + day)
+                columns.append(index)
+                amounts.append(amount)
+
+        # 같은 (참여자, 날짜)의 항목들을 한 행으로 모음
+        unique_positions, rows = np.unique(np.array(positions, dtype=np.int64), return_inverse=True)
+        counts = np.zeros((len(unique_positions), len(keys)), dtype=np.int64)
+        np.add.at(counts, (rows, np.array(columns, dtype=np.intp)), np.array(amounts, dtype=np.int64))
+        return cls(keys, unique_positions, counts)
+
+    def rows(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """(참여자 id 배열, 날짜 번호 배열, 항목별 카운트 행렬)을 (참여자, 날짜) 순으로 반환합니다."""
+        return self._positions // _DAY_SPAN, self._positions % _DAY_SPAN, np.diff(self._prefix, axis=0)
+
+    def window_counts(self, num_participants: int, start: date | None = None, end: date | None = None) -> dict[str, np.ndarray]:
+        """
+        id 0 ~ num_participants-1 참여자의 [start, end) 기간 항목별 카운트 배열을 반환합니다.
+        start나 end가 None이면 그쪽 기간 제한이 없습니다.
+        """
+        base = np.arange(num_participants, dtype=np.int64) * _DAY_SPAN
+        first_day = start.toordinal() if start else 0
+        last_day = end.toordinal() if end else _DAY_SPAN
+        low = np.searchsorted(self._positions, base + first_day, side='left')
+        high = np.searchsorted(self._positions, base + last_day, side='left')
+        counts = self._prefix[high] - self._prefix[low]
+        return {key: counts[:, index] for index, key in enumerate(self.keys_)}
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+import logging
+
+import requests
+
+from .github_utils import RateBudget, retry_request
+
+logger = logging.getLogger(__name__)
+
+GRAPHQL_URL = "https://api.github.com/graphql"
+
+# 요청 한 번에 조회하는 PR 수 (PR마다 리뷰를 최대 REVIEWS_PER_PR개까지 가져오므로 노드 수 제한 안에서 정함)
+PR_BATCH_SIZE = 50
+REVIEWS_PER_PR = 100
+
+# 리뷰어로 인정하지 않는 리뷰 상태 (제출되지 않은 리뷰)
+_IGNORED_REVIEW_STATES = {'PENDING'}
+
+_PR_DETAILS_FRAGMENT = f"""
+fragment details on PullRequest {{
+  additions
+  deletions
+  mergedBy {{ login }}
+  reviews(first: {REVIEWS_PER_PR}) {{ totalCount nodes {{ state author {{ login }} }} }}
+}}
+"""
+
+
+def build_query(numbers: list[int]) -> str:
+    """PR 번호마다 별칭(pr<번호>)을 붙여 여러 PR을 한 번에 조회하는 GraphQL 쿼리를 만듭니다."""
+    fields = "\n".join(f"    pr{number}: pullRequest(number: {number}) {{ ...details }}" for number in numbers)
+    return (
+        "query($owner: String!, $name: String!) {\n"
+        "  repository(owner: $owner, name: $name) {\n"
+        f"{fields}\n"
+        "  }\n"
+        "}\n" + _PR_DETAILS_FRAGMENT
+    )
+
+
+def parse_pull_request(node: dict) -> list:
+    """GraphQL PR 노드를 상세 정보 [추가 줄 수, 삭제 줄 수, 병합한 사용자, 리뷰어 목록]으로 변환합니다."""
+    reviews = node.get('reviews') or {}
+    reviewers = {
+        review['author']['login']
+        for review in reviews.get('nodes') or []
+        if review.get('author') and review.get('state') not in _IGNORED_REVIEW_STATES
+    }
+    merged_by = (node.get('mergedBy') or {}).get('login')
+    return [node.get('additions', 0), node.get('deletions', 0), merged_by, sorted(reviewers)]
+
+
+def fetch_pr_details(
+    session: requests.Session,
+    repo: str,
+    numbers: list[int],
+    batch_size: int = PR_BATCH_SIZE,
+    rate_budget: RateBudget | None = None
+) -> dict[int, list]:
+    """
+    PR 번호 목록의 리뷰, 변경 줄 수, 병합 정보를 batch_size개씩 GraphQL 요청 한 번으로 조회합니다.
+    PR마다 /pulls/{n}, /pulls/{n}/reviews를 따로 요청하는 대신 요청 수가 PR 수 / batch_size로 줄어듭니다.
+    요청이 실패하면 그때까지 받은 결과만 반환합니다.
+    """
+    owner, name = repo.split('/', 1)
+    details: dict[int, list] = {}
+    for start in range(0, len(numbers), batch_size):
+        batch = numbers[start:start + batch_size]
+        response = retry_request(
+            session, GRAPHQL_URL, max_retries=3, rate_budget=rate_budget,
+            json_body={'query': build_query(batch), 'variables': {'owner': owner, 'name': name}}
+        )
+        data = response.json().get('data') if response.status_code == 200 else None
+        if not data or not data.get('repository'):
+            logger.warning(f"⚠️ PR 상세 정보 조회 실패: {repo} (status code: {response.status_code})")
+            break
+        for number in batch:
+            node = data['repository'].get(f"pr{number}")
+            if node is None:
+                continue
+            if (node.get('reviews') or {}).get('totalCount', 0) > REVIEWS_PER_PR:
+                logger.debug(f"PR #{number}의 리뷰가 {REVIEWS_PER_PR}개를 넘어 처음 {REVIEWS_PER_PR}개만 반영합니다.")
+            details[number] = parse_pull_request(node)
+    return details
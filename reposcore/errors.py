@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+
+
+class ReposcoreError(Exception):
+    """reposcore에서 발생하는 모든 예외의 기반 클래스"""
+
+
+class RepositoryNotFoundError(ReposcoreError):
+    """저장소가 존재하지 않거나 접근할 수 없는 경우"""
+
+    def __init__(self, repo: str):
+        super().__init__(f"저장소 '{repo}'가 GitHub에 존재하지 않습니다.")
+        self.repo = repo
+
+
+class GitHubAPIError(ReposcoreError):
+    """GitHub API 요청이 실패한 경우 (status_code: 마지막 응답의 HTTP 상태 코드)"""
+
+    def __init__(self, message: str, status_code: int | None = None):
+        super().__init__(message)
+        self.status_code = status_code
+
+
+class AuthenticationError(GitHubAPIError):
+    """토큰이 잘못되었거나 만료된 경우 (401)"""
+
+
+class RateLimitError(GitHubAPIError):
+    """API 요청 한도를 모두 사용한 경우 (403 / 429)"""
+
+
+def error_for_status(status_code: int, message: str) -> GitHubAPIError:
+    """HTTP 상태 코드에 맞는 예외 객체를 만듭니다."""
+    if status_code == 401:
+        return AuthenticationError(message, status_code)
+    if status_code in (403, 429):
+        return RateLimitError(message, status_code)
+    return GitHubAPIError(message, status_code)
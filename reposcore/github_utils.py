@@ -1,25 +1,50 @@
 import re
-import sys
+import json
+import hashlib
 import time
+import fnmatch
+import threading
 import requests
 import logging
 
+from .cassette import Cassette
+from .http_cache import HttpCache, cache_key
+from .errors import AuthenticationError
+
+logger = logging.getLogger(__name__)
+
+# 다시 요청해도 결과가 같으므로 재시도하지 않는 응답 상태 코드 (없는 저장소/사용자)
+NON_RETRYABLE_STATUS = (404,)
+
+# --record / --replay 사용 시 모든 GitHub API 요청이 거치는 녹화/재생 객체
+_cassette: Cassette | None = None
+# --http-cache 사용 시 응답을 저장해 두는 디스크 캐시
+_http_cache: HttpCache | None = None
+
+
+def use_cassette(cassette: Cassette | None) -> None:
+    """retry_request가 사용할 녹화/재생 객체를 설정합니다. (None이면 해제)"""
+    global _cassette
+    _cassette = cassette
+
+def use_http_cache(cache: HttpCache | None) -> None:
+    """retry_request가 사용할 디스크 HTTP 캐시를 설정합니다. (None이면 해제)"""
+    global _http_cache
+    _http_cache = cache
+
+
 def validate_repo_format(repo: str) -> bool:
     pattern = r'^[\w\-]+/[\w\-]+$'
-    if re.fullmatch(pattern, repo):
-        return True
-    else:
-        print("저장소 형식이 올바르지 않습니다. 'owner/repo' 형식으로 입력해주세요.")
-        return False
+    return re.fullmatch(pattern, repo) is not None
 
 def validate_token(github_token: str) -> None:
+    """토큰으로 /user를 요청해 유효한지 확인합니다. 유효하지 않으면 AuthenticationError를 발생시킵니다."""
     headers = {}
     if github_token:
         headers["Authorization"] = f"token {github_token}"
-    response = requests.get("https://api.github.com/user", headers=headers)
+    response = retry_request(requests.Session(), "https://api.github.com/user", max_retries=1, headers=headers)
     if response.status_code != 200:
-        logging.error('❌ 인증 실패: 잘못된 GitHub 토큰입니다. 토큰 값을 확인해 주세요.')
-        sys.exit(1)
+        raise AuthenticationError('❌ 인증 실패: 잘못된 GitHub 토큰입니다. 토큰 값을 확인해 주세요.', response.status_code)
 
 def check_github_repo_exists(repo: str) -> bool:
     """
@@ -28,17 +53,17 @@ def check_github_repo_exists(repo: str) -> bool:
     API 요청을 통해 저장소가 실제로 존재하는지 확인합니다.
     """
     url = f"https://api.github.com/repos/{repo}"
-    response = requests.get(url)
+    response = retry_request(requests.Session(), url, max_retries=1)
 
     if response.status_code == 200:
         return True
     elif response.status_code == 403:
-        logging.warning("⚠️ GitHub API 요청 실패: 403 (요청 횟수 초과 또는 인증 오류)")
-        logging.info("ℹ️ 해결 방법: --token 옵션 또는 GITHUB_TOKEN 환경 변수 사용")
+        logger.warning("⚠️ GitHub API 요청 실패: 403 (요청 횟수 초과 또는 인증 오류)")
+        logger.info("ℹ️ 해결 방법: --token 옵션 또는 GITHUB_TOKEN 환경 변수 사용")
     elif response.status_code == 404:
-        logging.warning(f"⚠️ 저장소 '{repo}'가 존재하지 않습니다.")
+        logger.warning(f"⚠️ 저장소 '{repo}'가 존재하지 않습니다.")
     else:
-        logging.warning(f"⚠️ 요청 실패: HTTP 상태 코드 {response.status_code}")
+        logger.warning(f"⚠️ 요청 실패: HTTP 상태 코드 {response.status_code}")
 
     return False
 
@@ -48,15 +73,171 @@ def check_rate_limit(token: str | None = None) -> None:
     headers = {}
     if token:
         headers["Authorization"] = f"token {token}"
-    response = requests.get("https://api.github.com/rate_limit", headers=headers)
+    response = retry_request(requests.Session(), "https://api.github.com/rate_limit", max_retries=1, headers=headers)
     if response.status_code == 200:
         data = response.json()
         core = data.get("resources", {}).get("core", {})
         remaining = core.get("remaining", "N/A")
         limit = core.get("limit", "N/A")
-        logging.info(f"GitHub API 요청 가능 횟수: {remaining} / {limit}")
+        logger.info(f"GitHub API 요청 가능 횟수: {remaining} / {limit}")
     else:
-        logging.error(f"API 요청 제한 정보를 가져오는데 실패했습니다 (status code: {response.status_code}).")
+        logger.error(f"API 요청 제한 정보를 가져오는데 실패했습니다 (status code: {response.status_code}).")
+
+
+class RateBudget:
+    """
+    여러 스레드가 함께 쓰는 GitHub API 요청 한도.
+
+    응답의 X-RateLimit-Remaining / X-RateLimit-Reset 헤더로 남은 요청 수를 갱신하고,
+    남은 요청 수가 reserve 이하로 떨어지면 한도가 초기화될 때까지 요청을 대기시킵니다.
+    """
+
+    def __init__(self, reserve: int = 10):
+        self.reserve = reserve
+        self.remaining: int | None = None
+        self.reset_at: float | None = None
+        self._lock = threading.Lock()
+
+    def acquire(self) -> str | None:
+        """
+        요청 한 번을 보내기 전에 호출합니다. 한도가 부족하면 초기화 시각까지 대기합니다.
+        요청에 사용할 토큰을 반환합니다. (None이면 세션에 설정된 인증 정보를 그대로 사용)
+        """
+        while True:
+            with self._lock:
+                if self.remaining is None or self.remaining > self.reserve:
+                    if self.remaining is not None:
+                        self.remaining -= 1
+                    return
+                wait = (self.reset_at or time.time()) - time.time()
+                if wait <= 0:
+                    # 초기화 시각이 지났으면 다음 응답 헤더로 다시 갱신될 때까지 제한하지 않음
+                    self.remaining = None
+                    return
+            logger.warning(f"⏳ API 요청 한도가 부족합니다. {int(wait) + 1}초 후 재개합니다.")
+            time.sleep(min(wait + 1, 60))
+
+    def update(self, headers, token: str | None = None) -> None:
+        """응답 헤더의 한도 정보를 반영합니다."""
+        remaining = headers.get('X-RateLimit-Remaining')
+        reset = headers.get('X-RateLimit-Reset')
+        with self._lock:
+            if remaining is not None:
+                self.remaining = int(remaining)
+            if reset is not None:
+                self.reset_at = float(reset)
+
+
+def is_rate_limited(response: requests.Response) -> bool:
+    """토큰의 요청 한도를 모두 써서 거절된 응답인지 확인합니다."""
+    return response.status_code in (403, 429) and response.headers.get('X-RateLimit-Remaining') == '0'
+
+
+class TokenPool(RateBudget):
+    """
+    여러 GitHub 토큰을 함께 쓰는 요청 한도.
+
+    토큰마다 응답 헤더의 남은 요청 수와 초기화 시각을 따로 기록하고, 요청마다 남은 요청 수가 가장 많은
+    토큰을 골라 줍니다. 한 토큰의 한도가 소진되면 다른 토큰으로 넘어가며, 모든 토큰이 소진된 경우에만
+    가장 먼저 초기화되는 시각까지 대기합니다.
+    """
+
+    # 아직 응답을 받지 않은 토큰의 남은 요청 수 추정값 (GitHub 토큰당 시간당 한도)
+    UNKNOWN_REMAINING = 5000
+
+    def __init__(self, tokens: list[str], reserve: int = 10):
+        # 남은 요청 수와 초기화 시각은 토큰별로 기록하므로 RateBudget.__init__은 호출하지 않음
+        self.reserve = reserve
+        self._lock = threading.Lock()
+        self.tokens = list(dict.fromkeys(tokens))
+        if not self.tokens:
+            raise ValueError("토큰이 하나 이상 필요합니다.")
+        self._remaining: dict[str, int | None] = {token: None for token in self.tokens}
+        self._reset_at: dict[str, float | None] = {token: None for token in self.tokens}
+
+    @property
+    def remaining(self) -> int | None:
+        """모든 토큰의 남은 요청 수 합계 (아직 모르는 토큰은 제외, 모두 모르면 None)"""
+        known = [value for value in self._remaining.values() if value is not None]
+        return sum(known) if known else None
+
+    def acquire(self) -> str:
+        while True:
+            with self._lock:
+                now = time.time()
+                best, best_remaining = None, -1
+                for token in self.tokens:
+                    remaining = self._remaining[token]
+                    reset_at = self._reset_at[token]
+                    if remaining is not None and remaining <= self.reserve and reset_at is not None and reset_at <= now:
+                        # 초기화 시각이 지났으면 다음 응답 헤더로 다시 갱신될 때까지 제한하지 않음
+                        self._remaining[token] = remaining = None
+                    if remaining is not None and remaining <= self.reserve:
+                        continue
+                    headroom = self.UNKNOWN_REMAINING if remaining is None else remaining
+                    if headroom > best_remaining:
+                        best, best_remaining = token, headroom
+                if best is not None:
+                    if self._remaining[best] is not None:
+                        self._remaining[best] -= 1
+                    return best
+                wait = min((reset_at or now) for reset_at in self._reset_at.values()) - now
+            logger.warning(f"⏳ 모든 토큰의 API 요청 한도가 부족합니다. {int(wait) + 1}초 후 재개합니다.")
+            time.sleep(min(max(wait, 0) + 1, 60))
+
+    def update(self, headers, token: str | None = None) -> None:
+        if token not in self._remaining:
+            return
+        remaining = headers.get('X-RateLimit-Remaining')
+        reset = headers.get('X-RateLimit-Reset')
+        with self._lock:
+            if remaining is not None:
+                self._remaining[token] = int(remaining)
+            if reset is not None:
+                self._reset_at[token] = float(reset)
+
+
+# Link 헤더의 마지막 페이지 링크 (예: <https://api.github.com/...&page=34>; rel="last")
+_LAST_PAGE_LINK = re.compile(r'<[^>]*[?&]page=(\d+)[^>]*>;\s*rel="last"')
+
+
+def last_page_number(link_header: str) -> int | None:
+    """응답의 Link 헤더에서 마지막 페이지 번호를 찾습니다. (마지막 페이지의 응답처럼 rel="last"가 없으면 None)"""
+    match = _LAST_PAGE_LINK.search(link_header or '')
+    return int(match.group(1)) if match else None
+
+
+def list_org_repos(
+    org: str,
+    pattern: str = "*",
+    session: requests.Session | None = None,
+    rate_budget: RateBudget | None = None
+) -> list[str]:
+    """
+    /orgs/{org}/repos 를 페이지 단위로 조회해 이름이 pattern(glob)과 일치하는 저장소 목록을 반환합니다.
+    org가 조직이 아닌 사용자 계정이면 /users/{org}/repos 로 조회합니다.
+    """
+    session = session or requests.Session()
+    repos = []
+    url = f"https://api.github.com/orgs/{org}/repos"
+    page = 1
+    while True:
+        response = retry_request(session, url, params={'per_page': 100, 'page': page, 'type': 'all'},
+                                 rate_budget=rate_budget)
+        if response.status_code == 404 and page == 1 and '/orgs/' in url:
+            url = f"https://api.github.com/users/{org}/repos"
+            continue
+        if response.status_code != 200:
+            logger.error(f"❌ '{org}'의 저장소 목록을 가져오지 못했습니다 (status code: {response.status_code}).")
+            return repos
+
+        items = response.json()
+        repos.extend(item['full_name'] for item in items if fnmatch.fnmatch(item['name'], pattern))
+
+        if 'rel="next"' in response.headers.get('link', ''):
+            page += 1
+        else:
+            return repos
 
 
 def retry_request(
@@ -65,18 +246,95 @@ def retry_request(
     max_retries: int = 3,
     retry_delay: float = 1,
     params: dict[str, str] | None = None,
-    headers: dict[str, str] | None = None
+    headers: dict[str, str] | None = None,
+    rate_budget: RateBudget | None = None,
+    json_body: dict | None = None,
+    http_cache: HttpCache | None = None
 ) -> requests.Response:
     """
-    주어진 URL에 대해 최대 max_retries 횟수만큼 요청을 재시도합니다.
+    주어진 URL에 대해 최대 max_retries 횟수만큼 요청을 재시도합니다. (404처럼 NON_RETRYABLE_STATUS인 응답은 바로 반환)
+    json_body가 주어지면 GET 대신 본문을 담은 POST 요청(GraphQL)을 보냅니다. (디스크 캐시는 사용하지 않음)
+    rate_budget이 주어지면 요청마다 한도를 확인하고 응답 헤더로 갱신합니다.
+    rate_budget이 TokenPool이면 요청마다 여유가 가장 많은 토큰을 사용하고, 한도가 소진된 토큰으로 거절되면
+    (재시도 횟수에 포함하지 않고) 다른 토큰으로 바로 다시 요청합니다.
+    http_cache가 주어지거나 use_http_cache()로 캐시가 설정되어 있으면 유효 기간 안의 응답은 네트워크 없이 돌려주고, 유효 기간이 지난 응답은
+    조건부 요청(ETag / Last-Modified)으로 재검증합니다.
+    use_cassette()로 녹화/재생 객체가 설정되어 있으면 받은 응답을 모두 녹화하거나, 네트워크 대신 녹화된 응답을 재생합니다.
     """
+    cassette = _cassette
+    replaying = cassette is not None and not cassette.recording
+    http_cache = None if replaying or json_body is not None else (http_cache or _http_cache)
+    # 녹화/재생 시 POST 요청은 본문의 해시로 구분
+    cassette_params = params
+    if json_body is not None:
+        body = json.dumps(json_body, sort_keys=True).encode('utf-8')
+        cassette_params = dict(params or {}, body=hashlib.sha256(body).hexdigest())
     response = None
-    for i in range(max_retries):
-        response = session.get(url, params=params, headers=headers)
-        if response.status_code == 200:
+    attempt = 0
+    failovers = 0
+    while attempt < max_retries:
+        token = None
+        if replaying:
+            response = cassette.play(url, cassette_params)
+        else:
+            response, token, cached = _send_request(session, url, params, headers, rate_budget, http_cache, json_body)
+            if cassette is not None:
+                cassette.record(url, cassette_params, response)
+            if cached:
+                return response
+        # GraphQL은 REST와 별도의 한도(X-RateLimit-Resource: graphql)를 쓰므로 REST 한도에 반영하지 않음
+        if rate_budget and response.headers.get('X-RateLimit-Resource', 'core') != 'graphql':
+            rate_budget.update(response.headers, token)
+        if response.status_code == 200 or response.status_code in NON_RETRYABLE_STATUS:
             return response
-        elif i < max_retries - 1:
+        if token and is_rate_limited(response) and failovers < len(rate_budget.tokens):
+            failovers += 1
+            logger.warning("⚠️ 토큰의 API 요청 한도가 소진되어 다른 토큰으로 다시 요청합니다.")
+            continue
+        attempt += 1
+        if attempt < max_retries and not replaying:
             time.sleep(retry_delay)
 
     return response
 
+
+def _send_request(
+    session: requests.Session,
+    url: str,
+    params: dict[str, str] | None,
+    headers: dict[str, str] | None,
+    rate_budget: RateBudget | None,
+    http_cache: HttpCache | None,
+    json_body: dict | None = None
+) -> tuple[requests.Response, str | None, bool]:
+    """
+    요청 한 번을 보내고 (응답, 사용한 토큰, 네트워크 없이 캐시에서 응답했는지)를 반환합니다.
+    디스크 캐시가 있으면 캐시를 먼저 확인합니다.
+    """
+    request_headers = dict(headers or {})
+    entry, key = None, None
+    if http_cache is not None:
+        # 인증 정보별로 따로 저장 (같은 URL이라도 토큰에 따라 응답이 다를 수 있음)
+        auth = request_headers.get('Authorization') or getattr(session, 'headers', {}).get('Authorization')
+        key = cache_key(url, params, auth)
+        entry = http_cache.lookup(key)
+        if entry is not None and http_cache.is_fresh(entry):
+            return http_cache.to_response(entry), None, True
+        if entry is not None:
+            request_headers.update(http_cache.conditional_headers(entry))
+
+    # 캐시에서 응답하지 못한 경우에만 요청 한도를 사용
+    token = rate_budget.acquire() if rate_budget else None
+    if token:
+        request_headers['Authorization'] = f'Bearer {token}'
+    if json_body is not None:
+        response = session.post(url, params=params, json=json_body, headers=request_headers or headers)
+    else:
+        response = session.get(url, params=params, headers=request_headers or headers)
+
+    if http_cache is not None:
+        if response.status_code == 304 and entry is not None:
+            # 저장된 본문을 쓰되 한도 정보는 304 응답의 헤더로 갱신됨
+            return http_cache.revalidated(key, entry, response), token, False
+        http_cache.store(key, url, response)
+    return response, token, False
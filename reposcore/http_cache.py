@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+import gzip
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from .response_record import response_from_record, response_record
+
+# 캐시 파일 확장자 (응답 한 건당 파일 하나, gzip 압축 JSON)
+ENTRY_SUFFIX = ".json.gz"
+
+
+def cache_key(url: str, params: dict | None, auth: str | None) -> str:
+    """URL, 쿼리 인자, 인증 정보로 만든 캐시 키 (토큰은 해시로만 사용하고 저장하지 않음)"""
+    query = "&".join(f"{key}={params[key]}" for key in sorted(params)) if params else ""
+    identity = hashlib.sha256((auth or "").encode('utf-8')).hexdigest()
+    return hashlib.sha256(f"{url}?{query}#{identity}".encode('utf-8')).hexdigest()
+
+
+def parse_max_age(cache_control: str | None) -> int | None:
+    """
+    Cache-Control 헤더에서 응답을 재검증 없이 쓸 수 있는 시간(초)을 구합니다.
+    no-store면 None(저장 안 함), no-cache면 0(항상 재검증)을 반환합니다.
+    """
+    directives = {part.strip().lower() for part in (cache_control or "").split(",")}
+    if "no-store" in directives:
+        return None
+    if "no-cache" in directives:
+        return 0
+    match = re.search(r"max-age=(\d+)", cache_control or "")
+    return int(match.group(1)) if match else 0
+
+
+class HttpCache:
+    """
+    GitHub API 응답을 디스크에 저장해 두는 HTTP 캐시.
+
+    Cache-Control의 max-age 동안은 네트워크 없이 저장된 응답을 돌려주고, 그 이후에는 ETag /
+    Last-Modified로 조건부 요청을 보내 304 응답이면 저장된 본문을 다시 씁니다. (GitHub는 304 응답을
+    요청 한도에서 차감하지 않음) 전체 크기가 max_bytes를 넘으면 가장 오래 사용하지 않은 항목부터 삭제합니다.
+    """
+
+    def __init__(self, directory: str, max_bytes: int = 100 * 1024 * 1024):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+        # 키 → (파일 크기, 마지막 사용 시각)
+        self._index: dict[str, tuple[int, float]] = {}
+        for name in os.listdir(directory):
+            if name.endswith(ENTRY_SUFFIX):
+                stat = os.stat(os.path.join(directory, name))
+                self._index[name[:-len(ENTRY_SUFFIX)]] = (stat.st_size, stat.st_mtime)
+        self.total_bytes = sum(size for size, _ in self._index.values())
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key + ENTRY_SUFFIX)
+
+    def lookup(self, key: str) -> dict | None:
+        """저장된 항목을 반환합니다. (없으면 None)"""
+        with self._lock:
+            if key not in self._index:
+                return None
+            try:
+                with gzip.open(self._path(key), 'rt', encoding='utf-8') as f:
+                    entry = json.load(f)
+            except (OSError, ValueError):
+                self._remove(key)
+                return None
+            self._touch(key)
+        return entry
+
+    @staticmethod
+    def is_fresh(entry: dict) -> bool:
+        return time.time() < entry['stored_at'] + entry['max_age']
+
+    @staticmethod
+    def conditional_headers(entry: dict) -> dict[str, str]:
+        """저장된 항목을 재검증하기 위한 조건부 요청 헤더"""
+        stored = CaseInsensitiveDict(entry['headers'])
+        headers = {}
+        if stored.get('ETag'):
+            headers['If-None-Match'] = stored['ETag']
+        if stored.get('Last-Modified'):
+            headers['If-Modified-Since'] = stored['Last-Modified']
+        return headers
+
+    @staticmethod
+    def to_response(entry: dict) -> requests.Response:
+        return response_from_record(entry, entry['url'])
+
+    def store(self, key: str, url: str, response: requests.Response) -> None:
+        """200 응답을 저장합니다. (no-store이거나 검증할 방법도 유효 기간도 없는 응답은 저장하지 않음)"""
+        max_age = parse_max_age(response.headers.get('Cache-Control'))
+        if response.status_code != 200 or max_age is None:
+            return
+        if not max_age and not (response.headers.get('ETag') or response.headers.get('Last-Modified')):
+            return
+        entry = {
+            'url': url,
+            **response_record(response),
+            'stored_at': time.time(),
+            'max_age': max_age,
+        }
+        self._write(key, entry)
+
+    def revalidated(self, key: str, entry: dict, response: requests.Response) -> requests.Response:
+        """304 응답을 받은 항목의 유효 기간을 갱신하고 저장된 응답을 반환합니다."""
+        max_age = parse_max_age(response.headers.get('Cache-Control'))
+        entry['stored_at'] = time.time()
+        entry['max_age'] = max_age or 0
+        # 한도 정보 등은 새 응답의 헤더를 사용
+        headers = CaseInsensitiveDict(entry['headers'])
+        for name in ('X-RateLimit-Remaining', 'X-RateLimit-Reset', 'ETag', 'Cache-Control'):
+            if name in response.headers:
+                headers[name] = response.headers[name]
+        entry['headers'] = dict(headers)
+        self._write(key, entry)
+        return self.to_response(entry)
+
+    def _write(self, key: str, entry: dict) -> None:
+        path = self._path(key)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with gzip.open(tmp_path, 'wt', encoding='utf-8') as f:
+            json.dump(entry, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+        size = os.path.getsize(path)
+        with self._lock:
+            previous = self._index.get(key)
+            self.total_bytes += size - (previous[0] if previous else 0)
+            self._index[key] = (size, time.time())
+            self._evict()
+
+    def _touch(self, key: str) -> None:
+        size, _ = self._index[key]
+        self._index[key] = (size, time.time())
+        try:
+            os.utime(self._path(key))
+        except OSError:
+            pass
+
+    def _remove(self, key: str) -> None:
+        size, _ = self._index.pop(key)
+        self.total_bytes -= size
+        try:
+            os.remove(self._path(key))
+        except OSError:
+            pass
+
+    def _evict(self) -> None:
+        """전체 크기가 max_bytes 이하가 될 때까지 가장 오래 사용하지 않은 항목부터 삭제 (LRU)"""
+        if self.total_bytes <= self.max_bytes:
+            return
+        for key, _ in sorted(self._index.items(), key=lambda item: item[1][1]):
+            if self.total_bytes <= self.max_bytes:
+                break
+            self._remove(key)
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+import re
+from collections.abc import Iterator
+from typing import NamedTuple
+
+# git log 출력 형식: 필드는 0x1F, 공동 작성자는 0x1E로 구분하고 커밋 사이는 -z 옵션으로 NUL 구분
+# (%aN / %aE는 .mailmap을 적용한 작성자 이름 / 이메일)
+_FIELD_SEP = "\x1f"
+_TRAILER_SEP = "\x1e"
+LOG_FORMAT = "%H%x1f%P%x1f%aN%x1f%aE%x1f%at%x1f%(trailers:key=Co-authored-by,valueonly,separator=%x1e)"
+
+# git log 출력을 읽는 단위 (바이트)
+READ_CHUNK_SIZE = 1 << 16
+
+# GitHub noreply 이메일 (예: 12345+login@users.noreply.github.com)
+_NOREPLY_EMAIL = re.compile(r'^(?:\d+\+)?([^@]+)@users\.noreply\.github\.com$', re.IGNORECASE)
+# 공동 작성자 trailer 값 (예: Name <email>)
+_TRAILER_IDENTITY = re.compile(r'^(.*?)\s*<([^>]*)>\s*$')
+
+
+class Commit(NamedTuple):
+    sha: str
+    is_merge: bool
+    author: str
+    created: int
+    co_authors: tuple[str, ...]
+
+
+def commit_login(name: str, email: str) -> str:
+    """커밋 작성자를 참여자 이름으로 변환합니다. (GitHub noreply 이메일이면 login, 아니면 작성자 이름)"""
+    match = _NOREPLY_EMAIL.match(email.strip())
+    if match:
+        return match.group(1)
+    return name.strip() or email.strip()
+
+
+def open_repo(path: str):
+    """로컬 git 저장소를 엽니다. GitPython이 없거나 git 저장소가 아니면 ValueError를 발생시킵니다."""
+    try:
+        import git
+    except ImportError:
+        raise ValueError("--local 분석에는 GitPython과 git이 필요합니다. (pip install gitpython)") from None
+    try:
+        return git.Repo(path, search_parent_directories=False)
+    except (git.InvalidGitRepositoryError, git.NoSuchPathError):
+        raise ValueError(f"git 저장소가 아닙니다: {path}") from None
+
+
+def parse_commit(entry: str) -> Commit:
+    """LOG_FORMAT 형식의 커밋 한 건을 Commit으로 변환합니다."""
+    sha, parents, name, email, timestamp, trailers = entry.strip("\n").split(_FIELD_SEP, 5)
+    author = commit_login(name, email)
+    co_authors = []
+    for value in trailers.split(_TRAILER_SEP):
+        match = _TRAILER_IDENTITY.match(value.strip())
+        if match:
+            login = commit_login(*match.groups())
+            if login != author and login not in co_authors:
+                co_authors.append(login)
+    return Commit(sha, len(parents.split()) > 1, author, int(timestamp), tuple(co_authors))
+
+
+def iter_commits(path: str, rev: str = "HEAD") -> Iterator[Commit]:
+    """
+    로컬 저장소의 rev에서 도달할 수 있는 모든 커밋(병합 커밋 포함)을 git log 출력에서 하나씩 읽어 반환합니다.
+    출력을 일정 크기씩 나누어 읽으므로 커밋이 수십만 개여도 전체를 메모리에 올리지 않습니다.
+    """
+    repo = open_repo(path)
+    process = repo.git.log(rev, f"--format={LOG_FORMAT}", "-z", as_process=True)
+    buffer = b""
+    try:
+        while True:
+            chunk = process.stdout.read(READ_CHUNK_SIZE)
+            if not chunk:
+                break
+            *entries, buffer = (buffer + chunk).split(b"\0")
+            for entry in entries:
+                yield parse_commit(entry.decode('utf-8', errors='replace'))
+        if buffer.strip():
+            yield parse_commit(buffer.decode('utf-8', errors='replace'))
+        process.wait()
+    finally:
+        process.stdout.close()
+        repo.close()
@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+import json
+import sys
+import threading
+import time
+import tracemalloc
+from collections.abc import Iterator
+from contextlib import contextmanager, nullcontext
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+# 할당 위치를 기록할 호출 스택 깊이 (깊을수록 정확하지만 느려짐)
+TRACE_FRAMES = 1
+
+
+def max_rss() -> int | None:
+    """프로세스가 지금까지 사용한 최대 RSS (바이트, 알 수 없으면 None)"""
+    if resource is None:
+        return None
+    usage = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux는 KB, macOS는 바이트 단위
+    return usage if sys.platform == 'darwin' else usage * 1024
+
+
+def format_bytes(size: int | None) -> str:
+    if size is None:
+        return "-"
+    sign = "-" if size < 0 else ""
+    size = abs(size)
+    for unit in ("B", "KB", "MB"):
+        if size < 1024:
+            return f"{sign}{size:.0f}{unit}" if unit == "B" else f"{sign}{size:.1f}{unit}"
+        size /= 1024
+    return f"{sign}{size:.1f}GB"
+
+
+def _snapshot() -> tracemalloc.Snapshot:
+    """tracemalloc 자신의 할당을 제외한 스냅샷"""
+    return tracemalloc.take_snapshot().filter_traces([tracemalloc.Filter(False, tracemalloc.__file__)])
+
+
+def _top_sites(statistics, top: int) -> list[dict]:
+    return [
+        {
+            'site': f"{stat.traceback[0].filename}:{stat.traceback[0].lineno}",
+            'size_bytes': getattr(stat, 'size_diff', stat.size),
+            'count': getattr(stat, 'count_diff', stat.count),
+        }
+        for stat in statistics[:top]
+    ]
+
+
+class MemoryProfiler:
+    """
+    --memprofile: 단계(수집, 점수 계산, 표/텍스트/차트 저장 등)와 저장소별 메모리 사용량을 기록하는 클래스.
+
+    tracemalloc으로 파이썬 객체가 사용하는 메모리를 추적해 단계마다 최대 사용량(peak)과 단계가 끝난 뒤
+    남은 증가량(retained), 증가량이 큰 할당 위치(파일:줄)를 기록하고, 프로세스 최대 RSS도 함께 기록합니다.
+    단계가 시작하거나 끝날 때마다 그때까지의 최대 사용량을 진행 중인 모든 단계에 반영하므로
+    여러 스레드에서 단계가 겹쳐도(--jobs) 각 단계의 peak는 그 단계가 진행되는 동안의 프로세스 최대값이 됩니다.
+    """
+
+    def __init__(self, top: int = 10):
+        self.top = top
+        self.phases: list[dict] = []
+        self._active: list[dict] = []
+        self._lock = threading.Lock()
+        self._started_at = None
+
+    def start(self) -> None:
+        tracemalloc.start(TRACE_FRAMES)
+        self._started_at = time.perf_counter()
+
+    def _tick(self) -> int:
+        """마지막 확인 이후의 최대 사용량을 진행 중인 단계들에 반영하고 현재 사용량을 반환합니다."""
+        current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        for state in self._active:
+            state['peak'] = max(state['peak'], peak)
+        return current
+
+    @contextmanager
+    def phase(self, name: str, repo: str | None = None) -> Iterator[None]:
+        """with 블록 안에서 실행되는 코드의 메모리 사용량을 name 단계(저장소 repo)로 기록합니다."""
+        with self._lock:
+            # 시작 스냅샷이 차지하는 메모리는 단계가 끝날 때까지 남아 있으므로 기준값에 포함
+            snapshot = _snapshot() if self.top else None
+            current = self._tick()
+            state = {'start': current, 'peak': current, 'time': time.perf_counter(), 'snapshot': snapshot}
+            self._active.append(state)
+        try:
+            yield
+        finally:
+            with self._lock:
+                current = self._tick()
+                self._active.remove(state)
+                sites = []
+                if state['snapshot'] is not None:
+                    sites = _top_sites(_snapshot().compare_to(state['snapshot'], 'lineno'), self.top)
+                self.phases.append({
+                    'phase': name,
+                    'repo': repo,
+                    'peak_bytes': state['peak'],
+                    'peak_increase_bytes': state['peak'] - state['start'],
+                    'retained_bytes': current - state['start'],
+                    'max_rss_bytes': max_rss(),
+                    'seconds': round(time.perf_counter() - state['time'], 3),
+                    'top_sites': sites,
+                })
+
+    def report(self) -> dict:
+        """단계별 기록, 단계 종류별 요약, 현재 남아 있는 메모리의 할당 위치 상위 목록"""
+        with self._lock:
+            current = self._tick()
+            by_phase: dict[str, dict] = {}
+            for record in self.phases:
+                summary = by_phase.setdefault(record['phase'], {'count': 0, 'max_peak_increase_bytes': 0,
+                                                                 'total_retained_bytes': 0, 'seconds': 0.0})
+                summary['count'] += 1
+                summary['max_peak_increase_bytes'] = max(summary['max_peak_increase_bytes'],
+                                                         record['peak_increase_bytes'])
+                summary['total_retained_bytes'] += record['retained_bytes']
+                summary['seconds'] = round(summary['seconds'] + record['seconds'], 3)
+            retained_sites = _top_sites(_snapshot().statistics('lineno'), self.top)
+            return {
+                'seconds': round(time.perf_counter() - self._started_at, 3),
+                'traced_bytes': current,
+                'peak_bytes': max((record['peak_bytes'] for record in self.phases), default=current),
+                'max_rss_bytes': max_rss(),
+                'by_phase': by_phase,
+                'phases': list(self.phases),
+                'top_retained_sites': retained_sites,
+            }
+
+    def stop(self, path: str | None = None) -> dict:
+        """추적을 끝내고 보고서를 반환합니다. path가 주어지면 JSON으로 저장합니다."""
+        report = self.report()
+        tracemalloc.stop()
+        if path:
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(report, f, ensure_ascii=False, indent=2)
+        return report
+
+
+# --memprofile 실행 중인 프로파일러 (없으면 memory_phase는 아무것도 하지 않음)
+_profiler: MemoryProfiler | None = None
+
+
+def start_memory_profiling(top: int = 10) -> MemoryProfiler:
+    global _profiler
+    _profiler = MemoryProfiler(top)
+    _profiler.start()
+    return _profiler
+
+
+def stop_memory_profiling(path: str | None = None) -> dict | None:
+    global _profiler
+    profiler, _profiler = _profiler, None
+    return profiler.stop(path) if profiler is not None else None
+
+
+def memory_phase(name: str, repo: str | None = None):
+    """--memprofile 실행 중이면 name 단계의 메모리 사용량을 기록하는 컨텍스트 (아니면 아무것도 하지 않음)"""
+    return _profiler.phase(name, repo) if _profiler is not None else nullcontext()
+
+
+def summary_lines(report: dict, limit: int = 5) -> list[str]:
+    """보고서를 콘솔에 출력할 요약 (단계 종류별 합계, peak 증가량이 큰 단계, 남아 있는 메모리의 할당 위치)"""
+    lines = [f"🧠 메모리: 최대 {format_bytes(report['peak_bytes'])} (tracemalloc), "
+             f"최대 RSS {format_bytes(report['max_rss_bytes'])}, 종료 시 {format_bytes(report['traced_bytes'])}"]
+    for name, summary in sorted(report['by_phase'].items(), key=lambda item: -item[1]['max_peak_increase_bytes']):
+        lines.append(f"  [{name}] {summary['count']}회, 최대 증가 {format_bytes(summary['max_peak_increase_bytes'])}, "
+                     f"남은 증가량 합계 {format_bytes(summary['total_retained_bytes'])}, {summary['seconds']:.2f}초")
+    heaviest = sorted(report['phases'], key=lambda record: -record['peak_increase_bytes'])[:limit]
+    for record in heaviest:
+        target = f" {record['repo']}" if record['repo'] else ""
+        lines.append(f"  ▲ {record['phase']}{target}: 최대 증가 {format_bytes(record['peak_increase_bytes'])}, "
+                     f"남은 증가량 {format_bytes(record['retained_bytes'])}")
+        for site in record['top_sites'][:3]:
+            lines.append(f"      {site['site']}: {format_bytes(site['size_bytes'])} ({site['count']}개)")
+    for site in report['top_retained_sites'][:limit]:
+        lines.append(f"  ● {site['site']}: {format_bytes(site['size_bytes'])} ({site['count']}개)")
+    return lines
@@ -1,21 +1,39 @@
 #!/usr/bin/env python3
+import csv
 import json
 import matplotlib.font_manager as fm
 import matplotlib.pyplot as plt
 import matplotlib.cm as cm
-import pandas as pd
-from prettytable import PrettyTable
 import numpy as np
 from datetime import datetime, timezone, date
 from zoneinfo import ZoneInfo
-from prettytable import PrettyTable
+from wcwidth import wcswidth
 
 
-from .common_utils import log
+from .common_utils import log, OTHERS_NAME
+from .participants import PARTICIPANT_KEYS, ParticipantTable
 from .theme_manager import ThemeManager
 
+import html
+import multiprocessing
 import sys
 import os
+from collections.abc import Iterable, Mapping
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+
+def _render_chart_job(job: tuple) -> None:
+    """페이지 차트 한 장을 그리는 작업 (별도 프로세스에서 실행되도록 모듈 수준 함수로 정의)"""
+    kind, theme, *params = job
+    handler = OutputHandler(theme=theme)
+    if kind == 'score':
+        page_scores, page_path, show_grade, max_score, rank_offset = params
+        handler._draw_score_chart(page_scores, page_path, show_grade, max_score, rank_offset)
+    else:
+        page_scores, page_users, repo_keys, colors, page_path, max_score = params
+        handler._draw_stacked_chart(page_scores, page_users, repo_keys, colors, page_path, max_score)
+
 
 class OutputHandler:
     """Class to handle output generation for repository analysis results"""
@@ -27,11 +45,27 @@ class OutputHandler:
         'bar_height': 0.5,             # 막대 높이
         'figure_width': 12,            # 차트 너비 (텍스트 잘림 방지 위해 증가)
         'font_size': 9,                # 폰트 크기
-        'text_padding': 0.1            # 텍스트 배경 상자 패딩
+        'text_padding': 0.1,           # 텍스트 배경 상자 패딩
+        'participants_per_page': 50,   # 차트 한 장에 그리는 최대 참여자 수 (초과 시 페이지 분할)
+        'max_workers': None            # 페이지 동시 렌더링 프로세스 수 (None: CPU 수)
     }
 
     
     
+    # 분석용 내보내기(parquet, ndjson) 데이터셋별 고정 스키마: (열 이름, 타입)
+    # 저장소별 열이 늘어나지 않도록 모두 긴(long) 형식으로 저장하며, repo가 null이면 전체 저장소 통합 결과
+    # 'counts'의 카운트 열은 기본 집계 항목 기준이며, 실제로는 점수 규칙의 집계 항목으로 만듦 (counts_schema)
+    SCORE_KEYS = ('feat/bug PR', 'document PR', 'typo PR', 'feat/bug issue', 'document issue')
+    EXPORT_SCHEMAS = {
+        'scores': (('repo', 'string'), ('rank', 'int32'), ('name', 'string'), ('total', 'float64'))
+                  + tuple((key, 'float64') for key in SCORE_KEYS),
+        'counts': (('repo', 'string'), ('name', 'string')) + tuple((key, 'int32') for key in PARTICIPANT_KEYS),
+        'weekly': (('repo', 'string'), ('week', 'int32'), ('pr', 'int64'), ('issue', 'int64')),
+        'overall_repository': (('name', 'string'), ('repo', 'string'), ('score', 'float64'), ('total', 'float64')),
+    }
+    EXPORT_EXTENSIONS = {'parquet': '.parquet', 'ndjson': '.ndjson'}
+    EXPORT_BATCH_SIZE = 10000  # 한 번에 기록하는 행 수 (parquet row group 크기)
+
     # 등급 기준
     GRADE_THRESHOLDS = {
         90: 'A',
@@ -66,16 +100,12 @@ class OutputHandler:
         kst = ZoneInfo("Asia/Seoul")
         return datetime.now(tz=kst).strftime("%Y-%m-%d %H:%M:%S (KST)")
 
-    def generate_table(self, scores: dict[str, dict[str, float]], save_path) -> None:
-        """결과를 테이블 형태로 출력"""
-        timestamp = self.get_kst_timestamp()
-        table = PrettyTable()
-        table.field_names = ["참여자", "총점", "등급", "PR(기능/버그)", "PR(문서)", "PR(오타)", "이슈(기능/버그)", "이슈(문서)"]
-        
+    def _score_rows(self, scores: dict[str, dict[str, float]]):
+        """점수 딕셔너리에서 표 한 줄씩(문자열 목록)을 만들어 내는 제너레이터"""
         for name, score in scores.items():
-            # 등급 계산
-            grade = self._calculate_grade(score['total'])
-            row = [
+            # 등급 계산 (나머지 참여자 합계 행은 등급 없음)
+            grade = '-' if name == OTHERS_NAME else self._calculate_grade(score['total'])
+            yield [
                 name,
                 f"{score['total']:.1f}",
                 grade,
@@ -85,52 +115,185 @@ class OutputHandler:
                 f"{score['feat/bug issue']:.1f}",
                 f"{score['document issue']:.1f}"
             ]
-            table.add_row(row)
-        
-        with open(save_path, 'w', encoding='utf-8') as f:
-            f.write(f"=== 참여자별 점수 (분석 기준 시각: {timestamp}) ===\n\n")
-            f.write(str(table))
 
-    def generate_count_csv(self, scores: dict, save_path: str = None) -> None:
-        """결과를 CSV 파일로 출력"""
-        timestamp = self.get_kst_timestamp()
-        df = pd.DataFrame.from_dict(scores, orient='index')
-        # grade 컬럼 제거
-        df = df.drop('grade', axis=1, errors='ignore')
-        df = df.round(1)
-        df.index.name = 'name'  # 인덱스 이름을 'name'으로 설정
+    @staticmethod
+    def _center(text: str, width: int) -> str:
+        """화면 표시 폭(한글은 2칸) 기준 가운데 정렬 (str.center와 같은 규칙)"""
+        pad = width - wcswidth(text)
+        left = pad // 2 + (pad & width & 1)
+        return " " * left + text + " " * (pad - left)
+
+    def _write_aligned_table(self, f, field_names: list[str], scores: dict[str, dict[str, float]]) -> None:
+        """
+        PrettyTable과 같은 모양의 표를 스트리밍으로 씁니다.
+        첫 번째 순회에서 열 너비만 계산하고, 두 번째 순회에서 한 줄씩 바로 파일에 기록하므로
+        표 전체를 메모리에 만들지 않습니다.
+        """
+        widths = [wcswidth(name) for name in field_names]
+        for row in self._score_rows(scores):
+            for i, cell in enumerate(row):
+                widths[i] = max(widths[i], wcswidth(cell))
+
+        border = "+" + "+".join("-" * (width + 2) for width in widths) + "+"
+
+        def line(cells):
+            return "|" + "|".join(f" {self._center(cell, width)} " for cell, width in zip(cells, widths)) + "|"
+
+        f.write(border + "\n")
+        f.write(line(field_names) + "\n")
+        f.write(border + "\n")
+        for row in self._score_rows(scores):
+            f.write(line(row) + "\n")
+        f.write(border)
 
-        df.to_csv(save_path, encoding='utf-8')
+    @staticmethod
+    def _format_csv_value(value):
+        """pandas의 round(1) 후 to_csv와 같은 표기 (정수는 그대로, 실수는 소수 첫째 자리 반올림)"""
+        if isinstance(value, float):
+            return round(value, 1)
+        return value
 
+    def generate_count_csv(self, scores: dict, save_path: str = None) -> None:
+        """결과를 CSV 파일로 출력 (행 단위로 바로 기록)"""
+        # 첫 번째 순회에서 열 이름만 모음 (등장 순서 유지, grade 컬럼 제거)
+        columns = {}
+        for score in scores.values():
+            for key in score:
+                if key != 'grade':
+                    columns.setdefault(key, None)
+        columns = list(columns)
+
+        with open(save_path, 'w', encoding='utf-8', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(['name'] + columns)
+            for name, score in scores.items():
+                writer.writerow([name] + [self._format_csv_value(score.get(key, '')) for key in columns])
+
+    def generate_participant_csv(self, participants: Mapping[str, Mapping[str, int]], keys: Iterable[str], save_path: str) -> None:
+        """참여자별 원본 카운트 중 keys 항목을 첫 항목의 내림차순으로 CSV 출력 (예: --local의 커밋 수)"""
+        keys = list(keys)
+        rows = sorted(
+            ([name] + [int(activities[key]) for key in keys] for name, activities in participants.items()),
+            key=lambda row: -row[1] if keys else 0
+        )
+        with open(save_path, 'w', encoding='utf-8', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(['name'] + keys)
+            writer.writerows(row for row in rows if any(row[1:]))
 
     def generate_text(self, scores: dict[str, dict[str, float]], save_path: str) -> None:
-        """PrettyTable을 사용해 참여자 점수를 표 형식으로 출력"""
+        """참여자 점수를 PrettyTable과 같은 표 형식의 텍스트로 출력"""
         timestamp = self.get_kst_timestamp()
-
-        table = PrettyTable()
-        table.field_names = [
+        field_names = [
             "Name", "Total Score", "Grade",
             "PR (Feature/Bug)", "PR (Docs)", "PR (Typos)",
             "Issue (Feature/Bug)", "Issue (Docs)"
         ]
 
-        for name, score in scores.items():
-            grade = self._calculate_grade(score["total"])
-            table.add_row([
-                name,
-                f"{score['total']:.1f}",
-                grade,
-                f"{score['feat/bug PR']:.1f}",
-                f"{score['document PR']:.1f}",
-                f"{score['typo PR']:.1f}",
-                f"{score['feat/bug issue']:.1f}",
-                f"{score['document issue']:.1f}",
-            ])
-
         with open(save_path, 'w', encoding='utf-8') as f:
             f.write(f"=== 참여자별 점수 (분석 기준 시각: {timestamp}) ===\n\n")
-            f.write(table.get_string())
+            self._write_aligned_table(f, field_names, scores)
+
 
+    @staticmethod
+    def score_records(repo: str | None, scores: dict[str, dict[str, float]]):
+        """점수 딕셔너리를 'scores' 스키마의 행으로 변환 (나머지 참여자 합계 행 제외)"""
+        for rank, (name, score) in enumerate(scores.items(), start=1):
+            if name == OTHERS_NAME:
+                continue
+            yield (repo, rank, name, float(score['total'])) + tuple(
+                float(score.get(key, 0)) for key in OutputHandler.SCORE_KEYS)
+
+    @staticmethod
+    def count_keys(participants: Mapping[str, Mapping[str, int]]) -> tuple[str, ...]:
+        """participants의 집계 항목 (ParticipantTable이면 점수 규칙의 집계 항목, --enrich / --local 항목 포함)"""
+        return participants.count_keys() if isinstance(participants, ParticipantTable) else PARTICIPANT_KEYS
+
+    @classmethod
+    def counts_schema(cls, keys: Iterable[str]) -> tuple[tuple[str, str], ...]:
+        """집계 항목 keys를 카운트 열로 갖는 'counts' 스키마"""
+        return cls.EXPORT_SCHEMAS['counts'][:2] + tuple((key, 'int32') for key in keys)
+
+    @staticmethod
+    def count_records(repo: str | None, participants: Mapping[str, Mapping[str, int]]):
+        """participants를 counts_schema(count_keys(participants)) 스키마의 행으로 변환"""
+        keys = OutputHandler.count_keys(participants)
+        for name, activities in participants.items():
+            yield (repo, name) + tuple(int(activities.get(key, 0)) for key in keys)
+
+    @staticmethod
+    def weekly_records(repo: str | None, weekly_data: Mapping[int, Mapping[str, int]]):
+        """주차별 활동량을 'weekly' 스키마의 행으로 변환 (주차 순)"""
+        for week in sorted(weekly_data, key=int):
+            counts = weekly_data[week]
+            yield (repo, int(week), int(counts.get('pr', 0)), int(counts.get('issue', 0)))
+
+    @staticmethod
+    def overall_repository_records(user_scores: dict[str, dict[str, float]], repo_names: Mapping[str, str] | None = None):
+        """
+        사용자별 저장소별 점수를 'overall_repository' 스키마의 행(사용자 × 참여 저장소)으로 변환
+        repo_names가 주어지면 열 이름(owner_repo)을 원래 저장소 이름(owner/repo)으로 바꿉니다.
+        """
+        repo_names = repo_names or {}
+        for name, score_dict in user_scores.items():
+            if name == OTHERS_NAME:
+                continue
+            total = float(score_dict['total'])
+            for repo, score in score_dict.items():
+                if repo != 'total':
+                    yield (name, repo_names.get(repo, repo), float(score), total)
+
+    @staticmethod
+    def _batches(rows: Iterable[tuple], size: int):
+        """행을 size개씩 묶어 돌려주는 제너레이터"""
+        iterator = iter(rows)
+        while batch := list(islice(iterator, size)):
+            yield batch
+
+    def export_records(
+        self,
+        dataset: str,
+        rows: Iterable[tuple],
+        save_path: str,
+        fmt: str,
+        schema: tuple[tuple[str, str], ...] | None = None
+    ) -> str:
+        """
+        행 목록을 dataset 스키마(schema가 주어지면 schema)에 맞춰 parquet 또는 ndjson 파일로 저장하고 경로를 반환합니다.
+        EXPORT_BATCH_SIZE 행씩 나누어 기록하므로 전체 행을 메모리에 올리지 않습니다.
+        save_path에 확장자가 없으면 형식에 맞는 확장자를 붙입니다.
+        """
+        if fmt not in self.EXPORT_EXTENSIONS:
+            raise ValueError(f"지원하지 않는 내보내기 형식입니다: {fmt}")
+        schema = schema or self.EXPORT_SCHEMAS[dataset]
+        if not os.path.splitext(save_path)[1]:
+            save_path += self.EXPORT_EXTENSIONS[fmt]
+
+        if fmt == 'ndjson':
+            names = [name for name, _ in schema]
+            with open(save_path, 'w', encoding='utf-8') as f:
+                for batch in self._batches(rows, self.EXPORT_BATCH_SIZE):
+                    f.write("".join(json.dumps(dict(zip(names, row)), ensure_ascii=False) + "\n" for row in batch))
+        else:
+            self._write_parquet(schema, rows, save_path)
+        return save_path
+
+    def _write_parquet(self, schema: tuple[tuple[str, str], ...], rows: Iterable[tuple], save_path: str) -> None:
+        """배치마다 row group 하나씩 parquet 파일에 기록"""
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise RuntimeError("parquet 형식으로 저장하려면 pyarrow가 필요합니다. (pip install pyarrow)") from None
+
+        arrow_schema = pa.schema([(name, pa.type_for_alias(type_name)) for name, type_name in schema])
+        with pq.ParquetWriter(save_path, arrow_schema) as writer:
+            for batch in self._batches(rows, self.EXPORT_BATCH_SIZE):
+                columns = list(zip(*batch))
+                writer.write_table(pa.Table.from_arrays(
+                    [pa.array(column, type=field.type) for column, field in zip(columns, arrow_schema)],
+                    schema=arrow_schema
+                ))
 
     def _calculate_activity_ratios(self, participant_scores: dict) -> tuple[float, float, float]:
         """활동 비율 계산"""
@@ -148,9 +311,9 @@ class OutputHandler:
 
         return pr_ratio, issue_ratio, code_ratio
 
-    def generate_chart(self, scores: dict[str, dict[str, float]], save_path: str, show_grade: bool = False) -> None:
-        """결과를 차트로 출력: PR과 이슈를 단일 스택형 막대 그래프로 통합"""
-        # Linux 환경에서 CJK 폰트 수동 설정
+    @staticmethod
+    def _setup_font() -> None:
+        """Linux 환경에서 CJK 폰트 수동 설정"""
         # OSS 한글 폰트인 본고딕, 나눔고딕, 백묵 중 순서대로 하나를 선택
         font_paths = [
             '/usr/share/fonts/truetype/nanum/NanumGothic.ttf',  # 나눔고딕
@@ -158,8 +321,6 @@ class OutputHandler:
             '/usr/share/fonts/truetype/baekmuk/baekmuk.ttf'  # 백묵
         ]
 
-        timestamp = self.get_kst_timestamp()
-
         for font_path in font_paths:
             if os.path.exists(font_path):
                 fm.fontManager.addfont(font_path)
@@ -167,6 +328,97 @@ class OutputHandler:
                 plt.rcParams['font.sans-serif'] = ['NanumGothic', 'Noto Sans CJK JP', 'Baekmuk']
                 break
 
+    @staticmethod
+    def _page_path(save_path: str, page: int) -> str:
+        """chart.png → chart_001.png"""
+        base, ext = os.path.splitext(save_path)
+        return f"{base}_{page:03d}{ext}"
+
+    @staticmethod
+    def _index_path(save_path: str) -> str:
+        """chart.png → chart_index.html"""
+        return f"{os.path.splitext(save_path)[0]}_index.html"
+
+    def _render_pages(self, jobs: list[tuple]) -> None:
+        """
+        페이지별 차트를 여러 프로세스에서 동시에 그립니다. (pyplot은 스레드 안전하지 않으므로 프로세스 사용)
+        작업 큐나 웹훅 처리 스레드에서도 호출되므로, 다른 스레드가 잡고 있던 잠금까지 복제되는 fork 대신
+        spawn으로 작업 프로세스를 시작합니다.
+        """
+        workers = min(len(jobs), self.CHART_CONFIG['max_workers'] or os.cpu_count() or 1)
+        if workers <= 1:
+            for job in jobs:
+                _render_chart_job(job)
+            return
+        with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn")) as executor:
+            list(executor.map(_render_chart_job, jobs))
+
+    def _write_chart_index(self, index_path: str, title: str, pages: list[tuple[str, int, int]]) -> None:
+        """페이지별 차트 이미지를 순위 구간과 함께 연결하는 HTML 목록 파일을 생성"""
+        timestamp = self.get_kst_timestamp()
+        with open(index_path, 'w', encoding='utf-8') as f:
+            f.write('<!DOCTYPE html>\n<html lang="ko">\n<head><meta charset="utf-8">')
+            f.write(f'<title>{html.escape(title)}</title></head>\n<body>\n')
+            f.write(f'<h1>{html.escape(title)}</h1>\n<p>분석 기준 시각: {timestamp}</p>\n<ul>\n')
+            for page_path, first_rank, last_rank in pages:
+                name = html.escape(os.path.basename(page_path))
+                f.write(f'<li><a href="#{name}">{first_rank}위 ~ {last_rank}위</a></li>\n')
+            f.write('</ul>\n')
+            for page_path, first_rank, last_rank in pages:
+                name = html.escape(os.path.basename(page_path))
+                f.write(f'<h2 id="{name}">{first_rank}위 ~ {last_rank}위</h2>\n<img src="{name}" alt="{name}">\n')
+            f.write('</body>\n</html>\n')
+
+    def generate_chart(
+        self,
+        scores: dict[str, dict[str, float]],
+        save_path: str,
+        show_grade: bool = False,
+        page_size: int | None = None
+    ) -> list[str]:
+        """
+        결과를 차트로 출력: PR과 이슈를 단일 스택형 막대 그래프로 통합
+
+        참여자가 page_size(기본값: CHART_CONFIG['participants_per_page'])명보다 많으면
+        page_size명씩 나누어 chart_001.png, chart_002.png ... 로 동시에 그리고,
+        페이지를 연결하는 chart_index.html을 함께 생성합니다. 생성한 파일 경로 목록을 반환합니다.
+        """
+        # 나머지 참여자 합계 행은 막대 길이가 다른 참여자와 비교되지 않으므로 차트에서 제외
+        scores = {name: score for name, score in scores.items() if name != OTHERS_NAME}
+        page_size = page_size or self.CHART_CONFIG['participants_per_page']
+
+        if len(scores) <= page_size:
+            self._draw_score_chart(scores, save_path, show_grade)
+            return [save_path]
+
+        # 모든 페이지가 같은 가로축 범위를 쓰도록 최대 점수를 미리 계산
+        max_score = max(score['total'] for score in scores.values())
+        names = list(scores)
+        jobs = []
+        pages = []
+        for page, start in enumerate(range(0, len(names), page_size), start=1):
+            page_scores = {name: scores[name] for name in names[start:start + page_size]}
+            page_path = self._page_path(save_path, page)
+            jobs.append(('score', self.theme_manager.current_theme, page_scores, page_path, show_grade, max_score, start))
+            pages.append((page_path, start + 1, start + len(page_scores)))
+
+        self._render_pages(jobs)
+        index_path = self._index_path(save_path)
+        self._write_chart_index(index_path, 'Repository Contribution Scores', pages)
+        return [page_path for page_path, _, _ in pages] + [index_path]
+
+    def _draw_score_chart(
+        self,
+        scores: dict[str, dict[str, float]],
+        save_path: str,
+        show_grade: bool = False,
+        max_score: float | None = None,
+        rank_offset: int | None = None
+    ) -> None:
+        """점수 차트 한 장을 그려 저장 (rank_offset이 주어지면 이름 앞에 순위 표시)"""
+        self._setup_font()
+        timestamp = self.get_kst_timestamp()
+
         # 참여자 수에 따라 차트 높이 조정
         num_participants = len(scores)
         chart_height = max(self.CHART_CONFIG['min_height'], 
@@ -206,7 +458,10 @@ class OutputHandler:
 
         # 축 설정
         ax.set_yticks(y_pos)
-        ax.set_yticklabels(participants)
+        if rank_offset is None:
+            ax.set_yticklabels(participants)
+        else:
+            ax.set_yticklabels([f"{rank_offset + i + 1}. {p}" for i, p in enumerate(participants)])
         ax.set_xlabel('Score')
         ax.set_title(
             f'Repository Contribution Scores\n(분석 기준 시각: {timestamp})',
@@ -220,7 +475,8 @@ class OutputHandler:
         ax.legend(loc='upper right', frameon=False)
 
         # 가로축 여백 조정 (텍스트 잘림 방지)
-        max_score = max(total_scores) if total_scores else 100
+        if max_score is None:
+            max_score = max(total_scores) if total_scores else 100
         ax.set_xlim(0, max_score + max_score * self.CHART_CONFIG['text_padding'])
 
         # 여백 조정
@@ -230,9 +486,15 @@ class OutputHandler:
         plt.savefig(save_path, dpi=300, bbox_inches='tight')
         plt.close() 
 
-    def generate_repository_stacked_chart(self, scores: dict, save_path: str):
+    def generate_repository_stacked_chart(self, scores: dict, save_path: str, page_size: int | None = None) -> list[str]:
+        """
+        사용자별 저장소 기여도 누적 막대 차트
+        사용자가 page_size명보다 많으면 generate_chart와 같은 방식으로 페이지를 나누어 그립니다.
+        """
+        scores = {name: score for name, score in scores.items() if name != OTHERS_NAME}
         if not scores:
-            return
+            return []
+        page_size = page_size or self.CHART_CONFIG['participants_per_page']
 
         # ✅ 모든 사용자 기준으로 저장소 키 수집
         repo_keys = set()
@@ -244,12 +506,6 @@ class OutputHandler:
         sorted_users = sorted(scores.items(), key=lambda x: x[1].get("total", 0), reverse=True)
         usernames = [user for user, _ in sorted_users]
 
-        # 저장소별 점수 추출
-        scores_by_repo = {
-            repo: [scores[user].get(repo, 0) for user in usernames]
-            for repo in repo_keys
-        }
-
         # 저장소별 색상 지정
         color_map = {
             "oss2025hnu_reposcore-py": "#6baed6",   # 파랑
@@ -257,17 +513,63 @@ class OutputHandler:
             "oss2025hnu_reposcore-cs": "#fd8d3c"    # 주황
         }
 
-        bottom = [0] * len(usernames)
+        # 그 밖의 저장소는 tab20 컬러맵을 순환하며 색상 지정
+        extra_colors = plt.get_cmap("tab20").colors
+        colors = {
+            repo: color_map.get(repo.lower(), extra_colors[index % len(extra_colors)])
+            for index, repo in enumerate(repo_keys)
+        }
+
+        if len(usernames) <= page_size:
+            self._draw_stacked_chart(scores, usernames, repo_keys, colors, save_path)
+            return [save_path]
+
+        max_score = max(score.get("total", 0) for score in scores.values())
+        jobs = []
+        pages = []
+        for page, start in enumerate(range(0, len(usernames), page_size), start=1):
+            page_users = usernames[start:start + page_size]
+            page_scores = {user: scores[user] for user in page_users}
+            page_path = self._page_path(save_path, page)
+            jobs.append(('stacked', self.theme_manager.current_theme, page_scores, page_users, repo_keys, colors, page_path, max_score))
+            pages.append((page_path, start + 1, start + len(page_users)))
+
+        self._render_pages(jobs)
+        index_path = self._index_path(save_path)
+        self._write_chart_index(index_path, "사용자별 저장소 기여도", pages)
+        return [page_path for page_path, _, _ in pages] + [index_path]
+
+    def _draw_stacked_chart(
+        self,
+        scores: dict,
+        usernames: list[str],
+        repo_keys: list[str],
+        colors: dict,
+        save_path: str,
+        max_score: float | None = None
+    ) -> None:
+        """저장소별 누적 막대 차트 한 장을 그려 저장"""
+        self._setup_font()
+
+        # 저장소별 점수 추출
+        scores_by_repo = {
+            repo: np.array([scores[user].get(repo, 0) for user in usernames], dtype=float)
+            for repo in repo_keys
+        }
+
+        bottom = np.zeros(len(usernames))
         plt.figure(figsize=(12, max(4, len(usernames) * 0.35)))
 
         for repo in repo_keys:
-            color = color_map.get(repo.lower(), "#bbbbbb")
-            plt.barh(usernames, scores_by_repo[repo], left=bottom, label=repo.upper(), color=color)
-            bottom = [b + s for b, s in zip(bottom, scores_by_repo[repo])]
+            plt.barh(usernames, scores_by_repo[repo], left=bottom, label=repo.upper(), color=colors[repo])
+            bottom += scores_by_repo[repo]
 
+        if max_score:
+            plt.xlim(0, max_score * 1.05)
         plt.xlabel("점수")
         plt.title("사용자별 저장소 기여도 (py/js/cs)")
-        plt.legend(loc="upper right")
+        # 저장소가 많으면 범례가 차트를 가리므로 여러 열로 나누어 표시
+        plt.legend(loc="upper right", ncol=max(1, len(repo_keys) // 20), fontsize="small")
         plt.tight_layout()
         plt.gca().invert_yaxis()
         plt.savefig(save_path, dpi=300, bbox_inches='tight')
@@ -295,3 +597,49 @@ class OutputHandler:
         plt.tight_layout()
         plt.savefig(save_path)
         plt.close()
+
+    def generate_timeline_csv(self, names: list[str], weeks: list[int], totals: np.ndarray, ranks: np.ndarray, save_path: str) -> None:
+        """주차별 누적 총점과 등수를 (주차, 참여자) 한 줄씩 CSV로 출력"""
+        with open(save_path, 'w', encoding='utf-8', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(['week', 'name', 'total', 'rank'])
+            for week_index, week in enumerate(weeks):
+                week_totals = totals[week_index].tolist()
+                week_ranks = ranks[week_index].tolist()
+                writer.writerows(
+                    [week, name, self._format_csv_value(total), rank]
+                    for name, total, rank in zip(names, week_totals, week_ranks)
+                )
+
+    def generate_timeline_chart(
+        self,
+        names: list[str],
+        weeks: list[int],
+        totals: np.ndarray,
+        ranks: np.ndarray,
+        save_path: str,
+        top: int = 10
+    ) -> None:
+        """마지막 주차 기준 상위 top명의 주차별 등수 변화를 선 그래프로 저장"""
+        self._setup_font()
+        theme = self.theme_manager.themes[self.theme_manager.current_theme]['chart']['style']
+
+        plt.figure(figsize=(self.CHART_CONFIG['figure_width'], 5))
+        ax = plt.gca()
+        ax.set_facecolor(theme['background'])
+        if weeks and names:
+            selected = np.argsort(ranks[-1], kind='stable')[:top]
+            colors = plt.get_cmap('tab10').colors
+            for order, index in enumerate(selected.tolist()):
+                plt.plot(weeks, ranks[:, index], marker='o', markersize=3, color=colors[order % len(colors)],
+                         label=f"{names[index]} ({totals[-1, index]:.0f}점)")
+            ax.invert_yaxis()
+            plt.xticks(weeks, [f"Week {w}" for w in weeks], rotation=45, fontsize=self.CHART_CONFIG['font_size'])
+            plt.legend(loc='upper left', bbox_to_anchor=(1.01, 1), fontsize=self.CHART_CONFIG['font_size'])
+        plt.xlabel("주차", color=theme['text'])
+        plt.ylabel("등수", color=theme['text'])
+        plt.title("주차별 누적 점수 등수 변화", color=theme['text'])
+        plt.grid(True, color=theme['grid'], alpha=0.5)
+        plt.tight_layout()
+        plt.savefig(save_path, dpi=150, bbox_inches='tight', facecolor=theme['background'])
+        plt.close()
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+import json
+import threading
+import time
+from typing import TextIO
+
+from .github_utils import RateBudget
+
+# 터미널 진행 줄을 다시 그리는 주기 (초)
+RENDER_INTERVAL = 0.5
+
+
+def format_duration(seconds: float | None) -> str:
+    """남은 시간 표시 (예: 01:05, 1:02:03, 모르면 --:--)"""
+    if seconds is None:
+        return "--:--"
+    minutes, secs = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}:{minutes:02d}:{secs:02d}" if hours else f"{minutes:02d}:{secs:02d}"
+
+
+class ProgressReporter:
+    """
+    여러 저장소 수집의 진행 상황(저장소별 페이지 / 전체 페이지, 초당 항목 수, 남은 요청 수, 남은 시간)을 보여주는 클래스.
+
+    수집 스레드는 페이지마다 update()로 숫자만 갱신하고, 출력은 별도 스레드가 주기적으로 합니다.
+    stream이 터미널이면 RENDER_INTERVAL마다 한 줄을 덮어써서 표시하고, status_path가 주어지면
+    status_interval초마다 JSON 상태 한 줄을 덧붙여 기록합니다. (진행이 없어도 기록하므로 멈춤 감지에 사용 가능)
+    전체 페이지 수는 응답의 Link 헤더(rel="last")로 알 수 있으며, 아직 시작하지 않은 저장소는
+    시작한 저장소들의 평균 페이지 수로 추정해 남은 시간을 계산합니다.
+    """
+
+    def __init__(
+        self,
+        total_repos: int,
+        rate_budget: RateBudget | None = None,
+        stream: TextIO | None = None,
+        status_path: str | None = None,
+        status_interval: float = 10
+    ):
+        self.total_repos = total_repos
+        self.rate_budget = rate_budget
+        self.stream = stream if stream is not None and stream.isatty() else None
+        self.status_path = status_path
+        self.status_interval = status_interval
+        self._repos: dict[str, dict] = {}
+        self._finished: set[str] = set()
+        self._lock = threading.Lock()
+        self._started_at = time.monotonic()
+        self._stop = threading.Event()
+        self._thread = None
+        self._status_file = None
+
+    def start(self, repo: str) -> None:
+        """저장소 수집을 시작합니다. (체크포인트에서 이어서 수집하는 경우에도 이번 실행에서 받은 페이지만 셈)"""
+        with self._lock:
+            self._repos[repo] = {'page': 0, 'last_page': None, 'pages': 0, 'items': 0}
+
+    def update(self, repo: str, page: int, last_page: int | None, items: int) -> None:
+        """page번째 페이지(items개)를 반영했음을 기록합니다. last_page는 알 수 있는 경우 전체 페이지 수"""
+        with self._lock:
+            state = self._repos.setdefault(repo, {'page': 0, 'last_page': None, 'pages': 0, 'items': 0})
+            state['page'] = page
+            state['last_page'] = last_page if last_page is not None else max(page, state['last_page'] or 0)
+            state['pages'] += 1
+            state['items'] += items
+
+    def finish(self, repo: str) -> None:
+        """저장소 하나가 끝났음을 기록합니다. (캐시에서 불러온 저장소 포함)"""
+        with self._lock:
+            self._finished.add(repo)
+
+    def snapshot(self) -> dict:
+        """현재 진행 상황"""
+        with self._lock:
+            elapsed = time.monotonic() - self._started_at
+            pages = sum(state['pages'] for state in self._repos.values())
+            items = sum(state['items'] for state in self._repos.values())
+            totals = [state['last_page'] for state in self._repos.values() if state['last_page']]
+            remaining_pages = sum(
+                max(state['last_page'] - state['page'], 0)
+                for repo, state in self._repos.items() if state['last_page'] and repo not in self._finished
+            )
+            unstarted = self.total_repos - len(self._finished | set(self._repos))
+            repos = {
+                repo: {'page': state['page'], 'last_page': state['last_page'], 'done': repo in self._finished}
+                for repo, state in self._repos.items()
+            }
+            finished = len(self._finished)
+
+        if totals:
+            remaining_pages += unstarted * sum(totals) / len(totals)
+        pages_per_sec = pages / elapsed if elapsed > 0 else 0
+        eta = remaining_pages / pages_per_sec if pages_per_sec > 0 and (totals or not unstarted) else None
+        budget = self.rate_budget
+        remaining = budget.remaining if budget is not None else None
+        return {
+            'time': time.time(),
+            'elapsed': round(elapsed, 1),
+            'repos_done': finished,
+            'repos_total': self.total_repos,
+            'pages': pages,
+            'items': items,
+            'items_per_sec': round(items / elapsed, 1) if elapsed > 0 else 0.0,
+            'rate_remaining': remaining,
+            'rate_limited': remaining is not None and remaining <= budget.reserve,
+            'eta_seconds': round(eta, 1) if eta is not None else None,
+            'repos': repos,
+        }
+
+    def render(self, snapshot: dict) -> str:
+        """터미널에 표시할 진행 줄"""
+        pages_total = sum(repo['last_page'] or repo['page'] for repo in snapshot['repos'].values())
+        parts = [
+            f"📥 저장소 {snapshot['repos_done']}/{snapshot['repos_total']}",
+            f"페이지 {snapshot['pages']}/{pages_total or '?'}",
+            f"이슈/PR {snapshot['items']}개 ({snapshot['items_per_sec']:.0f}개/s)",
+        ]
+        if snapshot['rate_remaining'] is not None:
+            parts.append(f"남은 요청 {snapshot['rate_remaining']}" + (" ⏳" if snapshot['rate_limited'] else ""))
+        parts.append(f"남은 시간 {format_duration(snapshot['eta_seconds'])}")
+        return " · ".join(parts)
+
+    def _emit(self, write_status: bool) -> None:
+        snapshot = self.snapshot()
+        if self.stream is not None:
+            # 줄 끝에서 커서를 맨 앞으로 돌려 두어 다른 로그 출력이 진행 줄 뒤에 이어 붙지 않도록 함
+            self.stream.write(f"\r\x1b[K{self.render(snapshot)}\r")
+            self.stream.flush()
+        if write_status and self._status_file is not None:
+            self._status_file.write(json.dumps(snapshot, ensure_ascii=False) + "\n")
+            self._status_file.flush()
+
+    def _run(self) -> None:
+        last_status = 0.0
+        while not self._stop.wait(RENDER_INTERVAL if self.stream is not None else self.status_interval):
+            now = time.monotonic()
+            write_status = now - last_status >= self.status_interval
+            if write_status:
+                last_status = now
+            self._emit(write_status)
+
+    def __enter__(self) -> 'ProgressReporter':
+        if self.status_path:
+            self._status_file = open(self.status_path, 'a', encoding='utf-8')
+        if self.stream is not None or self._status_file is not None:
+            self._thread = threading.Thread(target=self._run, daemon=True)
+            self._thread.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        """출력 스레드를 멈추고 마지막 상태를 기록합니다."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._emit(write_status=True)
+        if self.stream is not None:
+            self.stream.write("\n")
+            self.stream.flush()
+        if self._status_file is not None:
+            self._status_file.close()
@@ -0,0 +1,28 @@
+#!/usr/bin/env python3
+import base64
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+# 녹화 파일(cassette)과 HTTP 캐시(http_cache)가 함께 쓰는 응답 저장 형식
+#   {'status': 상태 코드, 'headers': {헤더 이름: 값}, 'body': base64로 인코딩한 본문}
+
+
+def response_record(response: requests.Response) -> dict:
+    """응답의 상태 코드, 헤더, 본문을 JSON으로 저장할 수 있는 딕셔너리로 변환합니다."""
+    return {
+        'status': response.status_code,
+        'headers': dict(response.headers),
+        'body': base64.b64encode(response.content).decode('ascii'),
+    }
+
+
+def response_from_record(record: dict, url: str) -> requests.Response:
+    """response_record로 저장한 딕셔너리를 requests.Response로 되돌립니다. (본문은 UTF-8로 해석)"""
+    response = requests.Response()
+    response.status_code = record['status']
+    response.headers = CaseInsensitiveDict(record['headers'])
+    response._content = base64.b64decode(record['body'])
+    response.encoding = 'utf-8'
+    response.url = url
+    return response
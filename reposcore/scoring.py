@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+import copy
+import hashlib
+import json
+
+import numpy as np
+
+# 점수 그룹 (출력되는 점수 항목과 가중치 이름)
+SCORE_GROUPS = ('feat_bug_pr', 'doc_pr', 'typo_pr', 'feat_bug_is', 'doc_is')
+
+# 기본 점수 규칙 (--rules 파일에서 지정한 항목만 덮어씀)
+DEFAULT_SCORING_RULES = {
+    # 점수에 반영되는 이슈 상태 (open / reopened / completed, not planned 제외)
+    'valid_issue_states': ['completed', 'reopened', None],
+    # 다른 이름의 라벨을 기존 라벨로 취급 (예: "feature" → "enhancement")
+    'label_aliases': {},
+    # 집계 항목: 종류(pr/issue), 해당 라벨, 점수 그룹 (group이 null이면 집계만 하고 점수에는 반영하지 않음)
+    'categories': {
+        'p_enhancement': {'kind': 'pr', 'labels': ['enhancement'], 'group': 'feat_bug_pr'},
+        'p_bug': {'kind': 'pr', 'labels': ['bug'], 'group': 'feat_bug_pr'},
+        'p_documentation': {'kind': 'pr', 'labels': ['documentation'], 'group': 'doc_pr'},
+        'p_typo': {'kind': 'pr', 'labels': ['typo'], 'group': 'typo_pr'},
+        'i_enhancement': {'kind': 'issue', 'labels': ['enhancement'], 'group': 'feat_bug_is'},
+        'i_bug': {'kind': 'issue', 'labels': ['bug'], 'group': 'feat_bug_is'},
+        'i_documentation': {'kind': 'issue', 'labels': ['documentation'], 'group': 'doc_is'},
+    },
+    # 점수 그룹별 가중치
+    'weights': {
+        'feat_bug_pr': 3,
+        'doc_pr': 2,
+        'typo_pr': 1,
+        'feat_bug_is': 2,
+        'doc_is': 1,
+    },
+    # 상한: 문서/오타 PR은 기능/버그 PR(최소 1)의 N배까지, 이슈는 유효 PR의 N배까지 인정
+    'caps': {
+        'doc_typo_pr_per_feat_bug_pr': 3,
+        'issues_per_valid_pr': 4,
+    },
+}
+
+# PR 상세 정보(--enrich)로 세는 집계 항목 종류: 리뷰한 PR 수, 병합한 PR 수, 병합된 PR의 변경 줄 수
+ENRICHMENT_KINDS = ('review', 'merge', 'changed_lines')
+
+# --enrich 사용 시 규칙에 없으면 추가하는 집계 항목 (기본적으로 점수에는 반영하지 않음)
+ENRICHMENT_CATEGORIES = {
+    'p_review': {'kind': 'review', 'group': None},
+    'p_merge': {'kind': 'merge', 'group': None},
+    'p_changed_lines': {'kind': 'changed_lines', 'group': None},
+}
+
+# 로컬 저장소 분석(--local)에서 커밋으로 세는 집계 항목 종류: 일반 커밋, 병합 커밋, 공동 작성(Co-authored-by) 커밋
+COMMIT_KINDS = ('commit', 'merge_commit', 'co_authored')
+
+# --local 사용 시 규칙에 없으면 추가하는 집계 항목 (기본적으로 점수에는 반영하지 않음)
+COMMIT_CATEGORIES = {
+    'c_commit': {'kind': 'commit', 'group': None},
+    'c_merge': {'kind': 'merge_commit', 'group': None},
+    'c_co_authored': {'kind': 'co_authored', 'group': None},
+}
+
+
+class ScoringRules:
+    """
+    점수 규칙 설정을 한 번 컴파일해 둔 객체.
+
+    라벨 이름은 (별칭을 풀어) 집계 항목 번호로 바로 찾는 표로, 집계 항목은 점수 그룹으로 더하는
+    0/1 행렬로 변환해 두므로 항목마다 문자열을 만들지 않고 참여자 전체를 행렬 연산 한 번으로 묶습니다.
+    """
+
+    def __init__(self, config: dict | None = None):
+        rules = copy.deepcopy(DEFAULT_SCORING_RULES)
+        for section, value in (config or {}).items():
+            if section not in rules:
+                raise ValueError(f"알 수 없는 점수 규칙 항목입니다: {section}")
+            if isinstance(rules[section], dict) and section != 'categories':
+                rules[section].update(value)
+            else:
+                rules[section] = value
+        self.config = rules
+
+        self.valid_issue_states = frozenset(rules['valid_issue_states'])
+        self.weights = {group: rules['weights'][group] for group in SCORE_GROUPS}
+        self.doc_typo_cap = rules['caps']['doc_typo_pr_per_feat_bug_pr']
+        self.issue_cap = rules['caps']['issues_per_valid_pr']
+
+        self.categories = tuple(rules['categories'])
+        self.group_matrix = np.zeros((len(self.categories), len(SCORE_GROUPS)), dtype=np.int64)
+        # 라벨 이름 → 집계 항목 번호 (PR용, 이슈용)
+        self.pr_labels: dict[str, int] = {}
+        self.issue_labels: dict[str, int] = {}
+        # PR 상세 정보 종류 → 집계 항목 번호, 커밋 종류 → 집계 항목 번호
+        self.enrichment: dict[str, int] = {}
+        self.commit_kinds: dict[str, int] = {}
+
+        for index, (category, spec) in enumerate(rules['categories'].items()):
+            kind = spec.get('kind')
+            if kind not in ('pr', 'issue') + ENRICHMENT_KINDS + COMMIT_KINDS:
+                kinds = ', '.join(repr(k) for k in ENRICHMENT_KINDS + COMMIT_KINDS)
+                raise ValueError(f"집계 항목 '{category}'의 kind는 'pr', 'issue', {kinds} 중 하나여야 합니다.")
+            group = spec.get('group')
+            if group is not None:
+                if group not in SCORE_GROUPS:
+                    raise ValueError(f"집계 항목 '{category}'의 group '{group}'은(는) 지원하지 않습니다. ({', '.join(SCORE_GROUPS)})")
+                self.group_matrix[index, SCORE_GROUPS.index(group)] = 1
+            if kind in ENRICHMENT_KINDS or kind in COMMIT_KINDS:
+                kind_index = self.enrichment if kind in ENRICHMENT_KINDS else self.commit_kinds
+                if kind in kind_index:
+                    raise ValueError(f"kind '{kind}'인 집계 항목이 여러 개 지정되었습니다.")
+                kind_index[kind] = index
+                continue
+            label_index = self.pr_labels if kind == 'pr' else self.issue_labels
+            for label in spec.get('labels', []):
+                if label in label_index:
+                    raise ValueError(f"라벨 '{label}'이(가) 여러 {kind} 집계 항목에 지정되었습니다.")
+                label_index[label] = index
+
+        for alias, label in rules['label_aliases'].items():
+            for label_index in (self.pr_labels, self.issue_labels):
+                if label in label_index:
+                    label_index.setdefault(alias, label_index[label])
+
+    @classmethod
+    def load(cls, path: str) -> 'ScoringRules':
+        """JSON 점수 규칙 파일을 읽어 컴파일합니다."""
+        with open(path, 'r', encoding='utf-8') as f:
+            return cls(json.load(f))
+
+    @property
+    def fingerprint(self) -> str:
+        """규칙 설정 전체의 지문 (16자리 16진수). 같은 규칙으로 만든 캐시인지 확인할 때 사용"""
+        text = json.dumps(self.config, sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(text.encode('utf-8')).hexdigest()[:16]
+
+    def _with_categories(self, categories: dict, kind_index: dict[str, int]) -> 'ScoringRules':
+        config = copy.deepcopy(self.config)
+        for category, spec in categories.items():
+            if spec['kind'] not in kind_index and category not in config['categories']:
+                config['categories'][category] = dict(spec)
+        return ScoringRules(config)
+
+    def with_enrichment(self) -> 'ScoringRules':
+        """PR 상세 정보 집계 항목(ENRICHMENT_CATEGORIES) 중 규칙에 없는 종류를 추가한 새 규칙을 반환합니다."""
+        return self._with_categories(ENRICHMENT_CATEGORIES, self.enrichment)
+
+    def with_commit_categories(self) -> 'ScoringRules':
+        """커밋 집계 항목(COMMIT_CATEGORIES) 중 규칙에 없는 종류를 추가한 새 규칙을 반환합니다."""
+        return self._with_categories(COMMIT_CATEGORIES, self.commit_kinds)
+
+    def label_index(self, is_pr: bool) -> dict[str, int]:
+        """PR 또는 이슈의 라벨 이름 → 집계 항목 번호 표"""
+        return self.pr_labels if is_pr else self.issue_labels
+
+    def group_counts(self, counts: np.ndarray) -> np.ndarray:
+        """(참여자, 집계 항목) 카운트 행렬을 (참여자, 점수 그룹) 카운트 행렬로 변환합니다."""
+        return counts @ self.group_matrix
@@ -1,9 +1,15 @@
-from datetime import datetime
-import sys
+import argparse
+from datetime import date, datetime
 
 def parse_semester_start(date_str):
     try:
         return datetime.strptime(date_str, '%Y-%m-%d')
     except ValueError:
-        print("Invalid semester_start date format. Expected YYYY-MM-DD.")
-        sys.exit(1)
+        raise ValueError("Invalid semester_start date format. Expected YYYY-MM-DD.") from None
+
+def parse_date_argument(date_str: str) -> date:
+    """argparse용 날짜 인자 변환 (YYYY-MM-DD)"""
+    try:
+        return datetime.strptime(date_str, '%Y-%m-%d').date()
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"날짜 형식이 잘못되었습니다: '{date_str}' (YYYY-MM-DD 형식으로 입력해 주세요)")
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable
+
+from .analyzer import RepoAnalyzer
+from .cache_file import cache_path_for, cache_sync_time
+from .common_utils import log
+
+logger = logging.getLogger(__name__)
+
+
+class RepoWatcher:
+    """
+    --watch: 프로세스를 종료하지 않고 interval초마다 저장소별 변경 사항만 받아 반영하는 클래스.
+
+    수집이 끝난 analyzer(HTTP 세션, 메모리의 participants)를 그대로 두고, 매 주기마다 마지막으로 반영한
+    updated_at 이후에 바뀐 이슈/PR만 요청합니다. 반영 내역이 바뀐 저장소가 있으면 캐시를 저장하고
+    바뀐 저장소 목록으로 on_change를 호출합니다. (토큰/저장소 확인과 전체 수집은 다시 하지 않음)
+    """
+
+    def __init__(
+        self,
+        analyzers: dict[str, RepoAnalyzer],
+        output_dir: str,
+        interval: float,
+        on_change: Callable[[list[str]], None],
+        max_workers: int | None = None,
+        stop_event: threading.Event | None = None
+    ):
+        self.analyzers = analyzers
+        self.output_dir = output_dir
+        self.interval = interval
+        self.on_change = on_change
+        self.max_workers = max_workers
+        self.stop_event = stop_event or threading.Event()
+        # 저장소별로 마지막으로 불러오거나 저장한 캐시의 저장 시각 (다른 실행이 그 뒤에 저장했는지 확인용)
+        self._sync_times = {repo: cache_sync_time(cache_path_for(output_dir, repo)) for repo in analyzers}
+
+    def refresh(self, repo: str) -> int:
+        """저장소 하나의 변경 사항을 반영하고 바뀐 항목 수를 반환합니다."""
+        analyzer = self.analyzers[repo]
+        changed = analyzer.collect_updates()
+        if changed < 0:
+            logger.warning(f"⚠️ 변경 사항을 가져오지 못했습니다: {repo} (다음 주기에 다시 시도합니다)")
+            return 0
+        # 새로 병합된 PR의 상세 정보 (--enrich)
+        changed += analyzer.enrich_pull_requests()
+        if changed:
+            # 같은 캐시를 쓰는 명령줄 실행이나 웹훅이 그사이 저장한 캐시가 있으면 이어서 반영한 뒤 저장
+            cache_path = cache_path_for(self.output_dir, repo)
+            self._sync_times[repo] = analyzer.sync_cache(cache_path, self._sync_times.get(repo))
+        return changed
+
+    def poll_once(self) -> list[str]:
+        """모든 저장소의 변경 사항을 동시에 확인하고, 바뀐 저장소 목록을 저장소 순서대로 반환합니다."""
+        repos = list(self.analyzers)
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            counts = list(executor.map(self.refresh, repos))
+        for repo, count in zip(repos, counts):
+            if count:
+                log(f"🔄 변경 사항 {count}건 반영: {repo}", force=True)
+        return [repo for repo, count in zip(repos, counts) if count]
+
+    def run(self) -> None:
+        """stop_event가 설정되거나 Ctrl-C를 누를 때까지 interval초마다 poll_once를 실행합니다."""
+        log(f"👀 {self.interval:g}초마다 변경 사항을 확인합니다. (Ctrl-C로 종료)", force=True)
+        try:
+            while not self.stop_event.wait(self.interval):
+                changed = self.poll_once()
+                if changed:
+                    self.on_change(changed)
+                else:
+                    log("변경 사항 없음")
+        except KeyboardInterrupt:
+            log("변경 사항 확인을 종료합니다.", force=True)
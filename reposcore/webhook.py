@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+import hashlib
+import hmac
+import json
+import logging
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable
+
+from .analyzer import RepoAnalyzer
+from .cache_file import cache_lock, cache_path_for, cache_sync_time, migrate_legacy_cache
+from .common_utils import log
+from .errors import error_for_status
+from .scoring import ScoringRules
+
+logger = logging.getLogger(__name__)
+
+# 처리하는 GitHub 웹훅 이벤트 종류
+SUPPORTED_EVENTS = ('issues', 'pull_request', 'label')
+
+
+def verify_signature(secret: str | None, body: bytes, signature: str | None) -> bool:
+    """
+    X-Hub-Signature-256 헤더를 검증합니다.
+    secret이 설정되지 않은 경우 서명 검사를 생략합니다.
+    """
+    if not secret:
+        return True
+    if not signature or not signature.startswith('sha256='):
+        return False
+    expected = hmac.new(secret.encode('utf-8'), body, hashlib.sha256).hexdigest()
+    return hmac.compare_digest(f"sha256={expected}", signature)
+
+
+def pull_request_to_item(pull_request: dict) -> dict:
+    """pull_request 이벤트의 PR 객체를 /issues 응답 항목과 같은 형태로 변환합니다."""
+    return {
+        'number': pull_request.get('number'),
+        'created_at': pull_request.get('created_at'),
+        'user': pull_request.get('user') or {},
+        'labels': pull_request.get('labels', []),
+        'state_reason': None,
+        'pull_request': {'merged_at': pull_request.get('merged_at')},
+    }
+
+
+class WebhookReceiver:
+    """
+    GitHub 웹훅 이벤트를 받아 저장소별 캐시의 participants와 weekly_activity에 반영하는 클래스.
+    캐시는 cache_lock으로 잠근 채 갱신하므로 같은 출력 디렉토리를 쓰는 명령줄 실행과 동시에 사용해도 됩니다.
+    """
+
+    def __init__(
+        self,
+        output_dir: str,
+        secret: str | None = None,
+        repositories: list[str] | None = None,
+        semester_start_date=None,
+        on_update: Callable[[str, RepoAnalyzer], None] | None = None,
+        rules: ScoringRules | None = None,
+        token: str | None = None
+    ):
+        self.output_dir = output_dir
+        self.secret = secret
+        self.repositories = set(repositories) if repositories else None
+        self.semester_start_date = semester_start_date
+        self.on_update = on_update
+        self.rules = rules
+        self.token = token
+        self.analyzers: dict[str, RepoAnalyzer] = {}
+        # 저장소별로 마지막으로 불러오거나 저장한 캐시의 저장 시각 (다른 실행이 그 뒤에 저장했는지 확인용)
+        self._sync_times: dict[str, float | None] = {}
+        self._lock = threading.Lock()
+
+    def get_analyzer(self, repo: str) -> RepoAnalyzer:
+        """
+        저장소의 analyzer를 반환합니다. 처음 요청된 저장소이거나 다른 실행이 그사이 캐시를 저장했으면
+        캐시 파일에서 (다시) 불러옵니다.
+        """
+        cache_path = cache_path_for(self.output_dir, repo)
+        sync_time = cache_sync_time(cache_path)
+        if repo not in self.analyzers or (sync_time is not None and sync_time != self._sync_times.get(repo)):
+            self.analyzers[repo] = self._load_analyzer(repo, cache_path)
+            self._sync_times[repo] = sync_time
+        return self.analyzers[repo]
+
+    def _load_analyzer(self, repo: str, cache_path: str) -> RepoAnalyzer:
+        analyzer = RepoAnalyzer(repo, token=self.token, check_exists=False, rules=self.rules)
+        if self.semester_start_date:
+            analyzer.set_semester_start_date(self.semester_start_date)
+        migrate_legacy_cache(cache_path)
+        if os.path.exists(cache_path) and not analyzer.load_cache(cache_path):
+            # 이슈/PR별 반영 내역이 없거나 다른 집계 기준으로 만든 캐시에 이벤트를 더하면 집계가 어긋나므로 전체를 다시 수집
+            log(f"🔄 캐시 파일({os.path.basename(cache_path)})에 이슈/PR별 반영 내역이 없거나 점수 규칙/학기 시작일이 달라 전체를 다시 수집합니다.", force=True)
+            analyzer.collect_PRs_and_issues()
+            if not analyzer._data_collected:
+                status_code = analyzer.last_error_status
+                raise error_for_status(status_code, f"'{repo}' 수집 중 GitHub API 요청이 실패했습니다. (status code: {status_code})")
+        return analyzer
+
+    def handle_event(self, event: str, payload: dict) -> str | None:
+        """
+        이벤트 하나를 해당 저장소의 집계에 반영하고 캐시를 갱신합니다.
+        반영된 저장소 이름을 반환하며, 처리 대상이 아닌 이벤트는 None을 반환합니다.
+        """
+        if event not in SUPPORTED_EVENTS:
+            return None
+        repo = payload.get('repository', {}).get('full_name')
+        if not repo or (self.repositories is not None and repo not in self.repositories):
+            return None
+
+        action = payload.get('action')
+        cache_path = cache_path_for(self.output_dir, repo)
+        os.makedirs(self.output_dir, exist_ok=True)
+        # 같은 캐시를 갱신하는 명령줄 실행(--use-cache, cron 등)과 번갈아 쓰지 않도록 캐시 파일 잠금
+        with self._lock, cache_lock(cache_path):
+            analyzer = self.get_analyzer(repo)
+
+            if event == 'issues':
+                issue = payload.get('issue', {})
+                if action in ('deleted', 'transferred'):
+                    analyzer.remove_item(issue.get('number'))
+                else:
+                    analyzer.update_item(issue)
+            elif event == 'pull_request':
+                analyzer.update_item(pull_request_to_item(payload.get('pull_request', {})))
+            elif event == 'label':
+                label_name = payload.get('label', {}).get('name')
+                if action == 'deleted':
+                    analyzer.rename_label(label_name, None)
+                elif action == 'edited':
+                    old_name = payload.get('changes', {}).get('name', {}).get('from')
+                    if not old_name:
+                        return None
+                    analyzer.rename_label(old_name, label_name)
+                else:
+                    return None
+
+            analyzer.save_cache(cache_path)
+            self._sync_times[repo] = cache_sync_time(cache_path)
+
+            if self.on_update:
+                self.on_update(repo, analyzer)
+
+        log(f"🔔 웹훅 이벤트 반영 완료: {repo} ({event}/{action})")
+        return repo
+
+    def make_handler(self) -> type[BaseHTTPRequestHandler]:
+        """이 receiver에 연결된 HTTP 요청 핸들러 클래스를 생성합니다."""
+        receiver = self
+
+        class WebhookRequestHandler(BaseHTTPRequestHandler):
+            def do_POST(self) -> None:
+                length = int(self.headers.get('Content-Length', 0))
+                body = self.rfile.read(length)
+
+                if not verify_signature(receiver.secret, body, self.headers.get('X-Hub-Signature-256')):
+                    self._respond(401, "invalid signature")
+                    return
+                try:
+                    payload = json.loads(body)
+                except json.JSONDecodeError:
+                    self._respond(400, "invalid JSON payload")
+                    return
+
+                event = self.headers.get('X-GitHub-Event', '')
+                try:
+                    repo = receiver.handle_event(event, payload)
+                except Exception as e:
+                    logger.error(f"❌ 웹훅 이벤트 처리 중 오류 발생: {str(e)}")
+                    self._respond(500, "failed to apply event")
+                    return
+                if repo is None:
+                    self._respond(202, "ignored")
+                else:
+                    self._respond(200, f"applied to {repo}")
+
+            def _respond(self, status: int, message: str) -> None:
+                body = message.encode('utf-8')
+                self.send_response(status)
+                self.send_header('Content-Type', 'text/plain; charset=utf-8')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format: str, *args) -> None:
+                log(f"[webhook] {format % args}")
+
+        return WebhookRequestHandler
+
+    def make_server(self, host: str = '127.0.0.1', port: int = 8080) -> ThreadingHTTPServer:
+        """웹훅 수신 서버를 생성합니다. (port=0이면 임의의 빈 포트 사용)"""
+        return ThreadingHTTPServer((host, port), self.make_handler())
+
+    def serve(self, host: str = '127.0.0.1', port: int = 8080) -> None:
+        """웹훅 수신 서버를 실행합니다. (Ctrl-C로 종료)"""
+        server = self.make_server(host, port)
+        log(f"📡 웹훅 수신 대기 중: http://{server.server_address[0]}:{server.server_address[1]}/", force=True)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            log("웹훅 수신 서버를 종료합니다.", force=True)
+        finally:
+            server.server_close()
@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+import json
+import logging
+import os
+import socket
+import sqlite3
+import threading
+import time
+from collections.abc import Iterable
+from typing import Callable
+
+logger = logging.getLogger(__name__)
+
+# 작업(저장소) 상태
+PENDING = 'pending'
+CLAIMED = 'claimed'
+DONE = 'done'
+FAILED = 'failed'
+
+# 작업자가 저장소 하나를 가져간 뒤 갱신 없이 유지되는 시간 (초). 지나면 다른 작업자가 다시 가져감
+DEFAULT_LEASE_SECONDS = 300
+# 저장소 하나를 시도하는 최대 횟수 (실패하거나 작업자가 응답하지 않은 경우 포함)
+MAX_ATTEMPTS = 3
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    repo TEXT PRIMARY KEY,
+    position INTEGER NOT NULL,
+    status TEXT NOT NULL,
+    worker TEXT,
+    lease_until REAL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    error TEXT,
+    result TEXT
+)
+"""
+
+
+def default_worker_id() -> str:
+    """작업자 식별자 (호스트 이름:프로세스 번호:스레드 번호)"""
+    return f"{socket.gethostname()}:{os.getpid()}:{threading.get_ident()}"
+
+
+class WorkQueue:
+    """
+    --queue: 저장소 목록을 여러 작업자 프로세스(같은 컴퓨터 또는 파일을 공유하는 여러 컴퓨터)가 나누어 처리하기 위한 SQLite 작업 큐.
+
+    작업자는 claim()으로 저장소 하나를 lease_seconds 동안 가져가고, 처리 중에는 renew()로 기간을 늘리며,
+    끝나면 complete()로 부분 결과를 기록합니다. 작업자가 종료되어 기간이 지난 저장소는 다른 작업자가 다시 가져갑니다.
+    연결은 호출마다 새로 열므로 여러 스레드/프로세스에서 함께 사용할 수 있습니다.
+    """
+
+    def __init__(self, path: str, lease_seconds: float = DEFAULT_LEASE_SECONDS, max_attempts: int = MAX_ATTEMPTS):
+        self.path = path
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self._execute(_SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        # isolation_level=None: 트랜잭션은 BEGIN IMMEDIATE로 직접 시작 (다른 작업자와 동시에 같은 저장소를 가져가지 않도록)
+        return sqlite3.connect(self.path, timeout=30, isolation_level=None)
+
+    def _execute(self, sql: str, params: tuple = ()) -> int:
+        conn = self._connect()
+        try:
+            return conn.execute(sql, params).rowcount
+        finally:
+            conn.close()
+
+    def enqueue(self, repos: Iterable[str]) -> None:
+        """저장소들을 큐에 넣습니다. 이미 있는 저장소는 이전 결과를 지우고 다시 대기 상태로 만듭니다."""
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            for position, repo in enumerate(repos):
+                conn.execute(
+                    "INSERT INTO jobs (repo, position, status) VALUES (?, ?, ?) "
+                    "ON CONFLICT(repo) DO UPDATE SET position = excluded.position, status = excluded.status, "
+                    "worker = NULL, lease_until = NULL, attempts = 0, error = NULL, result = NULL",
+                    (repo, position, PENDING)
+                )
+            conn.execute("COMMIT")
+        finally:
+            conn.close()
+
+    def claim(self, worker: str) -> str | None:
+        """
+        대기 중이거나 기간이 지난 저장소 하나를 worker가 가져가고 저장소 이름을 반환합니다. (없으면 None)
+        기간이 지난 저장소 중 최대 시도 횟수를 채운 것은 실패로 처리합니다.
+        """
+        now = time.time()
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            conn.execute(
+                "UPDATE jobs SET status = ?, error = ? WHERE status = ? AND lease_until < ? AND attempts >= ?",
+                (FAILED, "작업자가 응답하지 않았습니다.", CLAIMED, now, self.max_attempts)
+            )
+            row = conn.execute(
+                "SELECT repo FROM jobs WHERE status = ? OR (status = ? AND lease_until < ?) ORDER BY position LIMIT 1",
+                (PENDING, CLAIMED, now)
+            ).fetchone()
+            if row:
+                conn.execute(
+                    "UPDATE jobs SET status = ?, worker = ?, lease_until = ?, attempts = attempts + 1 WHERE repo = ?",
+                    (CLAIMED, worker, now + self.lease_seconds, row[0])
+                )
+            conn.execute("COMMIT")
+            return row[0] if row else None
+        finally:
+            conn.close()
+
+    def renew(self, repo: str, worker: str) -> bool:
+        """worker가 가진 저장소의 기간을 늘립니다. 이미 다른 작업자에게 넘어갔으면 False를 반환합니다."""
+        return self._execute(
+            "UPDATE jobs SET lease_until = ? WHERE repo = ? AND worker = ? AND status = ?",
+            (time.time() + self.lease_seconds, repo, worker, CLAIMED)
+        ) == 1
+
+    def complete(self, repo: str, worker: str, result: dict) -> bool:
+        """처리 결과를 기록합니다. 기간이 지나 다른 작업자에게 넘어간 경우 기록하지 않고 False를 반환합니다."""
+        return self._execute(
+            "UPDATE jobs SET status = ?, lease_until = NULL, error = NULL, result = ? "
+            "WHERE repo = ? AND worker = ? AND status = ?",
+            (DONE, json.dumps(result, ensure_ascii=False), repo, worker, CLAIMED)
+        ) == 1
+
+    def fail(self, repo: str, worker: str, error: str) -> None:
+        """처리 실패를 기록합니다. 최대 시도 횟수 전이면 다시 대기 상태로 돌립니다."""
+        self._execute(
+            "UPDATE jobs SET status = CASE WHEN attempts >= ? THEN ? ELSE ? END, worker = NULL, lease_until = NULL, "
+            "error = ? WHERE repo = ? AND worker = ? AND status = ?",
+            (self.max_attempts, FAILED, PENDING, error, repo, worker, CLAIMED)
+        )
+
+    def counts(self) -> dict[str, int]:
+        """상태별 저장소 수"""
+        conn = self._connect()
+        try:
+            return dict(conn.execute("SELECT status, COUNT(*) FROM jobs GROUP BY status").fetchall())
+        finally:
+            conn.close()
+
+    def is_finished(self) -> bool:
+        """저장소가 하나 이상 있고 모두 완료 또는 실패했는지 여부"""
+        counts = self.counts()
+        return bool(counts) and not counts.get(PENDING) and not counts.get(CLAIMED)
+
+    def results(self) -> dict[str, dict]:
+        """완료된 저장소별 처리 결과 (큐에 넣은 순서)"""
+        conn = self._connect()
+        try:
+            rows = conn.execute("SELECT repo, result FROM jobs WHERE status = ? ORDER BY position", (DONE,)).fetchall()
+        finally:
+            conn.close()
+        return {repo: json.loads(result) for repo, result in rows}
+
+    def failures(self) -> dict[str, str]:
+        """실패한 저장소별 마지막 오류 메시지"""
+        conn = self._connect()
+        try:
+            rows = conn.execute("SELECT repo, error FROM jobs WHERE status = ? ORDER BY position", (FAILED,)).fetchall()
+        finally:
+            conn.close()
+        return dict(rows)
+
+
+def run_worker(
+    queue: WorkQueue,
+    process: Callable[[str], dict | None],
+    stop_event: threading.Event | None = None,
+    poll_interval: float = 5,
+    worker: str | None = None
+) -> int:
+    """
+    큐의 저장소를 하나씩 가져가 process(repo)로 처리하고 결과를 기록합니다. 처리한 저장소 수를 반환합니다.
+    process가 None을 반환하거나 예외를 발생시키면 실패로 기록합니다. 처리 중에는 기간의 1/3마다 기간을 늘립니다.
+    가져갈 저장소가 없으면 다른 작업자가 가진 저장소가 모두 끝날 때까지 poll_interval초마다 다시 확인하고
+    (그 작업자가 종료되면 기간이 지난 뒤 대신 처리), 모든 저장소가 끝나거나 stop_event가 설정되면 종료합니다.
+    """
+    stop_event = stop_event or threading.Event()
+    worker = worker or default_worker_id()
+    processed = 0
+    while not stop_event.is_set():
+        repo = queue.claim(worker)
+        if repo is None:
+            if queue.is_finished():
+                break
+            stop_event.wait(poll_interval)
+            continue
+
+        done = threading.Event()
+
+        def keep_lease() -> None:
+            while not done.wait(queue.lease_seconds / 3):
+                if not queue.renew(repo, worker):
+                    logger.warning(f"⚠️ 작업 기간이 지나 다른 작업자에게 넘어갔습니다: {repo}")
+                    return
+
+        heartbeat = threading.Thread(target=keep_lease, daemon=True)
+        heartbeat.start()
+        try:
+            result = process(repo)
+        except Exception as e:
+            logger.error(f"❌ 저장소 '{repo}' 처리 중 오류 발생: {e}")
+            result = None
+            error = str(e)
+        else:
+            error = "수집에 실패했습니다."
+        finally:
+            done.set()
+            heartbeat.join()
+
+        if result is None:
+            queue.fail(repo, worker, error)
+        elif queue.complete(repo, worker, result):
+            processed += 1
+        else:
+            logger.warning(f"⚠️ 다른 작업자가 이미 처리 중이어서 결과를 기록하지 않았습니다: {repo}")
+    return processed
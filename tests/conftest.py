@@ -0,0 +1,45 @@
+import json
+
+import requests
+
+
+def issue(number, updated_at="2025-03-10T01:00:00Z", label="bug", login="alice", merged_at=None):
+    """/issues 응답 항목 하나 (merged_at을 주면 병합된 PR)"""
+    item = {"number": number, "user": {"login": login}, "created_at": "2025-03-10T01:00:00Z",
+            "updated_at": updated_at, "labels": [{"name": label}], "state_reason": None}
+    if merged_at:
+        item["pull_request"] = {"merged_at": merged_at}
+    return item
+
+
+class IssuesSession(requests.Session):
+    """
+    저장소별 /issues 응답 흉내. since 이후에 바뀐 항목만 sort/direction 순서로 per_page개까지 돌려줍니다.
+    repos에 없는 저장소는 404, 목록 대신 "limited"인 저장소는 403으로 응답하며, 요청은 (저장소, since)로 기록합니다.
+    """
+
+    def __init__(self, repos):
+        super().__init__()
+        self.repos = repos
+        self.requests = []
+
+    def get(self, url, params=None, headers=None):
+        params = params or {}
+        repo = url.split("/repos/")[1].rsplit("/issues", 1)[0]
+        self.requests.append((repo, params.get("since")))
+        response = requests.Response()
+        response.status_code = 200
+        items = self.repos.get(repo)
+        if items is None:
+            response.status_code = 404
+            items = {"message": "Not Found"}
+        elif items == "limited":
+            response.status_code = 403
+            items = {"message": "rate limited"}
+        else:
+            items = [item for item in items if item["updated_at"] >= (params.get("since") or "")]
+            if params.get("sort") == "updated":
+                items.sort(key=lambda item: item["updated_at"], reverse=params.get("direction") == "desc")
+            items = items[:params.get("per_page", len(items))]
+        response._content = json.dumps(items).encode("utf-8")
+        return response
@@ -0,0 +1,40 @@
+from reposcore.aggregate import PartialAggregate
+from reposcore.participants import ParticipantTable
+
+
+def make_partial(repo, participants, weekly):
+    return PartialAggregate((repo,), ParticipantTable.from_dict(participants), weekly)
+
+
+def test_merge_is_associative_and_keeps_inputs():
+    a = make_partial("o/a", {"alice": {"p_bug": 1}}, {0: {"pr": 1, "issue": 0}})
+    b = make_partial("o/b", {"bob": {"i_bug": 2}, "alice": {"p_bug": 2}}, {0: {"pr": 1, "issue": 2}})
+    c = make_partial("o/c", {"carol": {"p_typo": 1}}, {3: {"pr": 0, "issue": 1}})
+
+    left = (a + b) + c
+    right = a + (b + c)
+    assert left.to_dict() == right.to_dict()
+    assert left.repos == ("o/a", "o/b", "o/c")
+    assert left.participants["alice"]["p_bug"] == 3
+    assert left.weekly[0] == {"pr": 2, "issue": 2}
+    # 원본 부분 집계는 변경되지 않아야 함
+    assert a.participants["alice"]["p_bug"] == 1
+
+    combined = PartialAggregate.combine([a, b, c])
+    assert combined.to_dict() == left.to_dict()
+    assert b.participants["alice"]["p_bug"] == 2
+
+    # 부분 집계가 없어도 주어진 집계 항목(점수 규칙)의 빈 결과를 반환
+    assert PartialAggregate.combine([], keys=("p_review",)).participants.count_keys() == ("p_review",)
+
+
+def test_partial_round_trips_through_file(tmp_path):
+    partial = make_partial("o/a", {"alice": {"p_bug": 1, "i_enhancement": 4}}, {2: {"pr": 1, "issue": 4}})
+    path = tmp_path / "partial.json"
+    partial.save(str(path))
+    assert PartialAggregate.load(str(path)).to_dict() == partial.to_dict()
+    assert not (tmp_path / "partial.json.tmp").exists()
+
+    # 'keys'가 없는 캐시 형식은 참여자 행의 항목을 집계 항목으로 사용
+    custom = PartialAggregate.from_dict({"participants": {"alice": {"p_bug": 1, "p_review": 2}}})
+    assert custom.participants.count_keys() == ("p_bug", "p_review")
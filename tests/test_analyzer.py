@@ -1,6 +1,8 @@
 import os
+import pytest
 import tempfile
 from reposcore.analyzer import RepoAnalyzer
+from reposcore.common_utils import select_top_scores
 from reposcore.output_handler import OutputHandler
 
 
@@ -121,34 +123,6 @@ def test_example_calculate_scores():
     assert scores["test_user10"]['total'] == 25, "test_user10 결과값이 일치하지 않습니다."
     assert scores["test_user11"]['total'] == 0, "test_user11 결과값이 일치하지 않습니다."
 
-def test_generate_table_creates_file():
-    output_handler = OutputHandler()
-    scores = {
-        "alice": {
-            "feat/bug PR": 9,
-            "document PR": 6,
-            "typo PR": 1,
-            "feat/bug issue": 6,
-            "document issue": 3,
-            "total": 25,
-            "grade": "A"
-        },
-        "bob": {
-            "feat/bug PR": 9,
-            "document PR": 6,
-            "typo PR": 0,
-            "feat/bug issue": 6,
-            "document issue": 3,
-            "total": 24,
-            "grade": "A"
-        }
-    }
-
-    with tempfile.TemporaryDirectory() as tmpdir:
-        filepath = os.path.join(tmpdir, "test_table.csv")
-        output_handler.generate_table(scores, save_path=filepath)
-        assert os.path.isfile(filepath), "CSV 파일이 생성되지 않았습니다."
-
 def test_generate_count_csv_creates_file():
     output_handler = OutputHandler()
     scores = {
@@ -211,3 +185,203 @@ def test_generate_chart_creates_file():
         filepath = os.path.join(tmpdir, "test_chart.png")
         output_handler.generate_chart(scores, save_path=filepath)
         assert os.path.isfile(filepath), "차트 이미지 파일이 생성되지 않았습니다."
+
+def test_collect_resumes_from_checkpoint(tmp_path, monkeypatch):
+    import reposcore.analyzer as analyzer_module
+
+    def make_item(number, login):
+        return {
+            "number": number,
+            "created_at": f"2025-03-{number:02d}T00:00:00Z",
+            "user": {"login": login},
+            "labels": [{"name": "bug"}],
+            "pull_request": {"merged_at": "2025-04-01T00:00:00Z"},
+        }
+
+    pages = {1: [make_item(1, "alice")], 2: [make_item(2, "bob")], 3: [make_item(3, "alice")]}
+    requested = []
+    fail_on_page = {3}
+
+    class FakeResponse:
+        def __init__(self, page):
+            self.status_code = 403 if page in fail_on_page else 200
+            self.headers = {"link": 'rel="next"' if page < 3 else ""}
+            self._items = pages[page]
+
+        def json(self):
+            return self._items
+
+    def fake_retry_request(session, url, params=None, **kwargs):
+        requested.append(params["page"])
+        return FakeResponse(params["page"])
+
+    monkeypatch.setattr(analyzer_module, "retry_request", fake_retry_request)
+    checkpoint = str(tmp_path / "checkpoint.json")
+
+    # 3페이지에서 요청 한도 초과로 중단 → 2페이지까지 체크포인트 저장
+    first = RepoAnalyzer("owner/repo", check_exists=False)
+    first.collect_PRs_and_issues(checkpoint_path=checkpoint, checkpoint_interval=1)
+    assert not first._data_collected
+    assert os.path.exists(checkpoint)
+
+    # 재실행 시 3페이지부터 이어서 수집
+    fail_on_page.clear()
+    requested.clear()
+    second = RepoAnalyzer("owner/repo", check_exists=False)
+    second.collect_PRs_and_issues(checkpoint_path=checkpoint, checkpoint_interval=1)
+    assert requested == [3]
+    assert second.participants["alice"]["p_bug"] == 2
+    assert second.participants["bob"]["p_bug"] == 1
+    assert not os.path.exists(checkpoint)
+
+def test_calculate_scores_top_n_with_others():
+    analyzer = RepoAnalyzer("owner/repo", check_exists=False)
+    analyzer.participants = {
+        f"user{i}": {"p_bug": i % 4, "i_documentation": i % 3}
+        for i in range(50)
+    }
+    full = analyzer.calculate_scores()
+    top = analyzer.calculate_scores(top=5, include_others=True)
+
+    # 부분 선택 결과가 전체 정렬 결과의 상위 5명과 같은 순서여야 함
+    assert list(top)[:5] == list(full)[:5]
+    assert list(top)[5] == "(others)"
+    assert top["(others)"]["total"] == sum(score["total"] for score in list(full.values())[5:])
+
+    name = list(full)[7]
+    assert analyzer.get_user_rank(name) == (8, full[name]["total"], 50)
+
+    # 저장소별 점수 합계(overall_repository)도 같은 부분 선택 경로로 상위 N명을 고름
+    totals = {name: {"total": score["total"]} for name, score in full.items()}
+    assert list(select_top_scores(totals, 5)) == list(full)[:5]
+
+def test_generate_chart_splits_large_leaderboards(tmp_path):
+    output_handler = OutputHandler()
+    output_handler.CHART_CONFIG = {**OutputHandler.CHART_CONFIG, 'max_workers': 1}
+    scores = {
+        f"user{i}": {
+            "feat/bug PR": 3, "document PR": 0, "typo PR": 0,
+            "feat/bug issue": 0, "document issue": 0, "total": 30 - i,
+        }
+        for i in range(5)
+    }
+    files = output_handler.generate_chart(scores, save_path=str(tmp_path / "chart.png"), page_size=2)
+    assert [os.path.basename(f) for f in files] == [
+        "chart_001.png", "chart_002.png", "chart_003.png", "chart_index.html"
+    ]
+    assert all(os.path.isfile(f) for f in files)
+    with open(files[-1], encoding="utf-8") as f:
+        assert "chart_003.png" in f.read()
+
+def test_generate_text_aligns_wide_characters(tmp_path):
+    output_handler = OutputHandler()
+    scores = {
+        "홍길동": {"feat/bug PR": 3, "document PR": 0, "typo PR": 0,
+                 "feat/bug issue": 2, "document issue": 0, "total": 5},
+        "alice": {"feat/bug PR": 0, "document PR": 2, "typo PR": 1,
+                  "feat/bug issue": 0, "document issue": 1, "total": 4},
+    }
+    path = tmp_path / "score.txt"
+    output_handler.generate_text(scores, str(path))
+    lines = path.read_text(encoding="utf-8").splitlines()[2:]
+    # 모든 줄의 화면 표시 폭이 같아야 함 (한글은 2칸)
+    from wcwidth import wcswidth
+    assert len({wcswidth(line) for line in lines}) == 1
+    assert lines[3].startswith("| 홍길동 |")
+
+def test_export_records_ndjson_and_parquet(tmp_path, monkeypatch):
+    import json
+    output_handler = OutputHandler()
+    monkeypatch.setattr(OutputHandler, "EXPORT_BATCH_SIZE", 2)
+    scores = {
+        f"user{i}": {"feat/bug PR": 3, "document PR": 0, "typo PR": 0,
+                     "feat/bug issue": 0, "document issue": 0, "total": 10 - i}
+        for i in range(5)
+    }
+    path = output_handler.export_records(
+        "scores", output_handler.score_records("owner/repo", scores), str(tmp_path / "scores"), "ndjson")
+    with open(path, encoding="utf-8") as f:
+        rows = [json.loads(line) for line in f]
+    assert path.endswith("scores.ndjson")
+    assert [row["rank"] for row in rows] == [1, 2, 3, 4, 5]
+    assert list(rows[0]) == [name for name, _ in OutputHandler.EXPORT_SCHEMAS["scores"]]
+
+    pq = pytest.importorskip("pyarrow.parquet")
+    path = output_handler.export_records(
+        "scores", output_handler.score_records("owner/repo", scores), str(tmp_path / "scores"), "parquet")
+    parquet_file = pq.ParquetFile(path)
+    # 배치마다 row group 하나씩 기록
+    assert parquet_file.metadata.num_row_groups == 3
+    assert parquet_file.read().column("name").to_pylist() == list(scores)
+
+
+def test_export_counts_uses_rule_categories(tmp_path):
+    import json
+    from reposcore.participants import ParticipantTable
+    output_handler = OutputHandler()
+    # --rules / --enrich로 추가된 집계 항목도 열로 저장되어야 함
+    participants = ParticipantTable.from_dict({"alice": {"p_bug": 1, "p_review": 4}}, ("p_bug", "p_review"))
+    keys = output_handler.count_keys(participants)
+    path = output_handler.export_records("counts", output_handler.count_records(None, participants),
+                                         str(tmp_path / "counts"), "ndjson", output_handler.counts_schema(keys))
+    with open(path, encoding="utf-8") as f:
+        assert json.loads(f.readline()) == {"repo": None, "name": "alice", "p_bug": 1, "p_review": 4}
+
+def test_calculate_scores_for_date_range():
+    from datetime import date
+    analyzer = RepoAnalyzer("dummy/repo")
+    items = [
+        # (번호, 작성자, 생성 시각(UTC), 라벨, PR 여부)
+        (1, "alice", "2025-03-05T01:00:00Z", "bug", True),
+        (2, "alice", "2025-03-20T01:00:00Z", "bug", True),
+        (3, "bob", "2025-03-20T16:00:00Z", "documentation", True),  # KST 기준 3월 21일
+        (4, "bob", "2025-04-02T01:00:00Z", "enhancement", False),
+    ]
+    for number, author, created_at, label, is_pr in items:
+        item = {"number": number, "user": {"login": author}, "created_at": created_at,
+                "labels": [{"name": label}], "state_reason": None}
+        if is_pr:
+            item["pull_request"] = {"merged_at": created_at}
+        analyzer.update_item(item)
+
+    # 기간을 지정하지 않으면 전체 기간 카운트와 같아야 함
+    assert analyzer.participants_between(date(2000, 1, 1), None).to_dict() == analyzer.participants.to_dict()
+
+    scores = analyzer.calculate_scores(start=date(2025, 3, 10), end=date(2025, 3, 21))
+    assert scores["alice"]["feat/bug PR"] == 3
+    assert scores["bob"]["total"] == 0
+
+    scores = analyzer.calculate_scores(start=date(2025, 3, 21))
+    assert scores["alice"]["total"] == 0
+    assert scores["bob"]["document PR"] == 2
+    assert scores["bob"]["feat/bug issue"] == 2
+
+    # 참여자를 삭제하면 id 배치가 바뀌므로 기간별 카운트도 새 배치로 다시 계산
+    del analyzer.participants["alice"]
+    window = analyzer.participants_between(date(2025, 3, 21), None).to_dict()
+    assert list(window) == ["bob"]
+    assert window["bob"]["p_documentation"] == 1 and window["bob"]["i_enhancement"] == 1
+
+def test_score_timeline_matches_final_scores():
+    from datetime import date
+    analyzer = RepoAnalyzer("dummy/repo")
+    analyzer.set_semester_start_date(date(2025, 3, 3))
+    items = [
+        (1, "alice", "2025-03-04T01:00:00Z", "bug", True),
+        (2, "bob", "2025-03-12T01:00:00Z", "enhancement", True),
+        (3, "bob", "2025-03-13T01:00:00Z", "documentation", True),
+        (4, "alice", "2025-03-20T01:00:00Z", "bug", False),
+    ]
+    for number, author, created_at, label, is_pr in items:
+        item = {"number": number, "user": {"login": author}, "created_at": created_at,
+                "labels": [{"name": label}], "state_reason": None}
+        if is_pr:
+            item["pull_request"] = {"merged_at": created_at}
+        analyzer.update_item(item)
+
+    names, weeks, totals, ranks = analyzer.score_timeline()
+    assert names == ["alice", "bob"]
+    assert weeks == [1, 2, 3]
+    assert totals.tolist() == [[3, 0], [3, 5], [5, 5]]
+    assert ranks.tolist() == [[1, 2], [2, 1], [1, 2]]
+    assert dict(zip(names, totals[-1].tolist())) == analyzer.calculate_totals()
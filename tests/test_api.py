@@ -0,0 +1,47 @@
+import importlib
+import sys
+
+import pytest
+
+from reposcore import ReposcoreClient, RateLimitError, RepositoryNotFoundError
+
+from .conftest import IssuesSession, issue
+
+MERGED = "2025-03-11T01:00:00Z"
+
+
+def test_client_reuses_state_and_raises_typed_errors(tmp_path, capsys, monkeypatch):
+    monkeypatch.setattr("reposcore.github_utils.time.sleep", lambda seconds: None)
+    session = IssuesSession({"o/a": [issue(1, merged_at=MERGED)],
+                             "o/b": [issue(1, label="enhancement", login="bob", merged_at=MERGED)],
+                             "o/limited": "limited"})
+    client = ReposcoreClient(session=session, cache_dir=str(tmp_path / "cache"))
+
+    assert client.score("o/a")["alice"]["total"] == 3
+    # 이미 수집한 저장소는 다시 요청하지 않고, collect()는 바뀐 항목만 요청
+    client.score("o/a")
+    session.repos["o/a"].append(issue(2, "2025-03-12T01:00:00Z", merged_at=MERGED))
+    client.collect("o/a")
+    assert session.requests == [("o/a", None), ("o/a", "2025-03-10T01:00:00Z")]
+    assert client.score("o/a")["alice"]["feat/bug PR"] == 6
+
+    overall = client.score_overall(["o/a", "o/b"])
+    assert set(overall) == {"alice", "bob"}
+    paths = client.render(overall, str(tmp_path / "out"), formats=["table", "text"])
+    assert [path.rsplit("/", 1)[1] for path in paths] == ["score.csv", "score.txt"]
+
+    with pytest.raises(RepositoryNotFoundError):
+        client.collect("o/missing")
+    with pytest.raises(RateLimitError):
+        client.collect("o/limited")
+    with pytest.raises(ValueError):
+        client.collect("not-a-repo")
+
+    # 라이브러리로 사용할 때는 표준 출력에 아무것도 쓰지 않음
+    assert capsys.readouterr().out == ""
+
+
+def test_importing_cli_module_has_no_side_effects(monkeypatch):
+    monkeypatch.setattr(sys, "argv", ["embedded-app", "--unknown-option"])
+    sys.modules.pop("reposcore.__main__", None)
+    importlib.import_module("reposcore.__main__")
@@ -0,0 +1,148 @@
+import json
+import threading
+import time
+from datetime import date
+
+import pytest
+
+from reposcore.aggregate import PartialAggregate
+from reposcore.analyzer import RepoAnalyzer, CACHE_TTL
+from reposcore.cache_file import (
+    CacheFile, CacheFormatError, HEADER_SIZE, cache_lock, cache_path_for, cache_policy, cache_sync_time, cache_watermark,
+    migrate_legacy_cache, read_cache, read_header, write_cache
+)
+from reposcore.scoring import ScoringRules
+
+from .conftest import IssuesSession, issue
+
+
+def test_cache_round_trip_and_header(tmp_path):
+    analyzer = RepoAnalyzer("o/a", check_exists=False)
+    analyzer.update_item(issue(1, "2025-03-11T01:00:00Z"))
+    analyzer.update_item(issue(2, "2025-03-12T01:00:00Z", "enhancement"))
+    path = str(tmp_path / "cache_o_a.bin")
+    analyzer.save_cache(path)
+
+    header = read_header(path)
+    assert header.item_count == 2
+    assert header.last_updated == 1741741200
+    assert time.time() - header.sync_time < 60
+    assert not analyzer.is_cache_update_required(path)
+
+    loaded = RepoAnalyzer("o/a", check_exists=False)
+    loaded.load_cache(path)
+    assert loaded.items == analyzer.items
+    assert loaded.last_updated == "2025-03-12T01:00:00Z"
+    assert loaded.participants["alice"]["i_enhancement"] == 1
+    assert PartialAggregate.load(path, "o/a").participants["alice"]["i_bug"] == 1
+
+    # 만료 여부는 헤더의 저장 시각으로만 판단하고 본문은 load()에서 검증
+    with open(path, "r+b") as f:
+        f.seek(HEADER_SIZE)
+        f.write(b"\0" * 8)
+    assert not analyzer.is_cache_update_required(path)
+    with CacheFile(path) as cache, pytest.raises(CacheFormatError):
+        cache.load()
+
+    write_cache(path, analyzer._state_to_dict(), sync_time=time.time() - CACHE_TTL - 1)
+    assert analyzer.is_cache_update_required(path)
+
+
+def test_legacy_json_cache_is_loaded_but_refreshed(tmp_path):
+    analyzer = RepoAnalyzer("o/a", check_exists=False)
+    analyzer.update_item(issue(1, "2025-03-11T01:00:00Z"))
+    path = tmp_path / "cache_o_a.json"
+    path.write_text(json.dumps(analyzer._state_to_dict()), encoding="utf-8")
+
+    assert read_cache(str(path))["items"]["1"][0] == "alice"
+    assert analyzer.is_cache_update_required(str(path))
+    assert analyzer.is_cache_update_required(str(tmp_path / "missing.bin"))
+
+
+def test_cache_from_other_rules_or_semester_is_not_loaded(tmp_path):
+    analyzer = RepoAnalyzer("o/a", check_exists=False)
+    analyzer.update_item(issue(1, "2025-03-11T01:00:00Z"))
+    path = str(tmp_path / "cache_o_a.bin")
+    analyzer.save_cache(path)
+    assert cache_policy(path) == analyzer.policy
+
+    # 같은 규칙이면 그대로 불러오고, 규칙이나 학기 시작일이 다르면 items와 participants가 어긋나므로 거부
+    assert RepoAnalyzer("o/a", check_exists=False).load_cache(path)
+    other_rules = RepoAnalyzer("o/a", check_exists=False, rules=ScoringRules({"valid_issue_states": ["completed"]}))
+    assert not other_rules.load_cache(path)
+    assert other_rules.items == {}
+    other_semester = RepoAnalyzer("o/a", check_exists=False)
+    other_semester.set_semester_start_date(date(2025, 3, 3))
+    assert not other_semester.load_cache(path)
+
+    # 방금 저장한 캐시라도 집계 기준이 다르면 갱신이 필요 (헤더만 읽어 판단)
+    assert analyzer.cache_matches_policy(path) and not analyzer.is_cache_update_required(path)
+    assert not other_rules.cache_matches_policy(path) and other_rules.is_cache_update_required(path)
+    assert not other_semester.cache_matches_policy(path) and other_semester.is_cache_update_required(path)
+
+    # 집계 기준이 기록되지 않은 이전 캐시는 기본 규칙으로 만든 것으로 간주
+    state = analyzer._state_to_dict()
+    del state["policy"]
+    legacy = tmp_path / "cache_o_a.json"
+    legacy.write_text(json.dumps(state), encoding="utf-8")
+    assert cache_policy(str(legacy)) is None
+    assert RepoAnalyzer("o/a", check_exists=False).load_cache(str(legacy))
+    assert not other_rules.load_cache(str(legacy))
+
+
+def test_legacy_json_cache_is_migrated_to_binary_path(tmp_path):
+    analyzer = RepoAnalyzer("o/a", check_exists=False)
+    analyzer.update_item(issue(1, "2025-03-11T01:00:00Z"))
+    legacy = tmp_path / "cache_o_a.json"
+    legacy.write_text(json.dumps(analyzer._state_to_dict()), encoding="utf-8")
+    modified = legacy.stat().st_mtime
+
+    # 경로 계산은 파일을 건드리지 않음
+    path = cache_path_for(str(tmp_path), "o/a")
+    assert path == str(tmp_path / "cache_o_a.bin")
+    assert legacy.exists()
+
+    # .bin이 없으면 이전 JSON 캐시를 옮겨서 사용 (저장 시각은 JSON 파일 수정 시각 그대로)
+    assert migrate_legacy_cache(path)
+    assert not legacy.exists()
+    assert cache_sync_time(path) == modified
+    loaded = RepoAnalyzer("o/a", check_exists=False)
+    assert loaded.load_cache(path)
+    assert loaded.items == analyzer.items
+    assert not migrate_legacy_cache(path)
+
+
+def test_change_probe_compares_latest_update_with_cache_watermark(tmp_path):
+    analyzer = RepoAnalyzer("o/a", check_exists=False)
+    analyzer.update_item(issue(1, "2025-03-11T01:00:00Z"))
+    path = str(tmp_path / "cache_o_a.bin")
+    write_cache(path, analyzer._state_to_dict(), sync_time=time.time() - CACHE_TTL - 1)
+    watermark = cache_watermark(path)
+
+    analyzer.SESSION = IssuesSession({"o/a": [issue(1, "2025-03-11T01:00:00Z")]})
+    assert analyzer.has_changes_since(watermark) is False
+    analyzer.SESSION.repos["o/a"].append(issue(2, "2025-03-11T02:00:00Z"))
+    assert analyzer.has_changes_since(watermark) is True
+    assert len(analyzer.SESSION.requests) == 2
+
+
+def test_cache_lock_makes_second_writer_wait_for_saved_cache(tmp_path):
+    path = str(tmp_path / "cache_o_a.bin")
+    seen = []
+
+    def second_runner():
+        requested_at = time.time()
+        with cache_lock(path) as waited:
+            seen.append((waited, cache_sync_time(path) >= requested_at))
+
+    with cache_lock(path) as waited:
+        assert not waited
+        thread = threading.Thread(target=second_runner)
+        thread.start()
+        time.sleep(0.2)
+        write_cache(path, {"participants": {}, "items": {}})
+    thread.join(timeout=5)
+
+    # 잠금이 풀릴 때까지 기다린 뒤 그동안 저장된 캐시를 볼 수 있어야 함 (임시 파일은 남지 않음)
+    assert seen == [(True, True)]
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["cache_o_a.bin", "cache_o_a.bin.lock"]
@@ -0,0 +1,45 @@
+import json
+
+import pytest
+import requests
+
+from reposcore.cassette import Cassette, CassetteMissError
+from reposcore.github_utils import retry_request, use_cassette
+
+
+class SequenceSession:
+    """정해진 상태 코드 순서대로 응답하는 requests.Session 대용"""
+
+    def __init__(self, statuses):
+        self.statuses = list(statuses)
+
+    def get(self, url, params=None, headers=None):
+        response = requests.Response()
+        response.status_code = self.statuses.pop(0)
+        response.headers["link"] = ""
+        response._content = json.dumps({"page": params["page"]}).encode("utf-8")
+        return response
+
+
+def test_replay_serves_recorded_sequence(tmp_path):
+    url = "https://api.github.com/repos/o/r/issues"
+    cassette = Cassette(str(tmp_path), "record")
+    use_cassette(cassette)
+    try:
+        response = retry_request(SequenceSession([502, 200]), url, retry_delay=0, params={"page": 1})
+    finally:
+        use_cassette(None)
+        cassette.close()
+    assert response.status_code == 200
+
+    cassette = Cassette(str(tmp_path), "replay")
+    use_cassette(cassette)
+    try:
+        # 녹화할 때와 같이 502 후 재시도해서 200을 받아야 하며, 네트워크(session)는 사용하지 않음
+        response = retry_request(None, url, params={"page": 1})
+        assert response.status_code == 200
+        assert response.json() == {"page": 1}
+        with pytest.raises(CassetteMissError):
+            retry_request(None, url, params={"page": 2})
+    finally:
+        use_cassette(None)
@@ -0,0 +1,80 @@
+import json
+from datetime import date
+
+import requests
+
+from reposcore.analyzer import RepoAnalyzer
+from reposcore.enrichment import GRAPHQL_URL
+from reposcore.scoring import ScoringRules
+
+
+def merged_pr(number, author):
+    return {"number": number, "user": {"login": author}, "created_at": f"2025-03-{number:02d}T01:00:00Z",
+            "labels": [{"name": "enhancement"}], "pull_request": {"merged_at": "2025-03-20T01:00:00Z"}}
+
+
+class GraphQLSession(requests.Session):
+    """별칭(pr<번호>)마다 PR 상세 정보를 돌려주는 GraphQL 응답 흉내"""
+
+    def __init__(self, prs):
+        super().__init__()
+        self.prs = prs
+        self.queries = []
+
+    def post(self, url, params=None, json=None, headers=None):
+        assert url == GRAPHQL_URL
+        self.queries.append(json['query'])
+        nodes = {f"pr{number}": pr for number, pr in self.prs.items() if f"pr{number}:" in json['query']}
+        response = requests.Response()
+        response.status_code = 200
+        response.headers["X-RateLimit-Resource"] = "graphql"
+        response._content = _dumps({"data": {"repository": nodes}})
+        return response
+
+
+def _dumps(data):
+    return json.dumps(data).encode("utf-8")
+
+
+def pr_node(additions, deletions, merged_by, reviewers):
+    return {"additions": additions, "deletions": deletions, "mergedBy": {"login": merged_by},
+            "reviews": {"totalCount": len(reviewers),
+                        "nodes": [{"state": state, "author": {"login": login}} for login, state in reviewers]}}
+
+
+def test_enrichment_batches_prs_and_counts_reviews():
+    analyzer = RepoAnalyzer("o/r", token="t", check_exists=False, rules=ScoringRules().with_enrichment())
+    analyzer.SESSION = session = GraphQLSession({
+        1: pr_node(10, 2, "bob", [("bob", "APPROVED"), ("alice", "COMMENTED"), ("carol", "PENDING")]),
+        2: pr_node(5, 5, "alice", [("bob", "CHANGES_REQUESTED"), ("bob", "APPROVED")]),
+        3: pr_node(1, 0, "bob", []),
+    })
+    session.headers["Authorization"] = "Bearer t"
+    for number, author in ((1, "alice"), (2, "alice"), (3, "bob")):
+        analyzer.update_item(merged_pr(number, author))
+
+    assert analyzer.enrich_pull_requests(batch_size=2) == 3
+    # PR 3개를 2개씩 묶어 요청 2번
+    assert len(session.queries) == 2
+    alice, bob = analyzer.participants["alice"], analyzer.participants["bob"]
+    assert alice["p_changed_lines"] == 22 and bob["p_changed_lines"] == 1
+    # 자기 PR의 리뷰/병합과 제출되지 않은 리뷰는 세지 않음
+    assert bob["p_review"] == 2 and alice["p_review"] == 0
+    assert bob["p_merge"] == 1 and alice["p_merge"] == 0
+    assert "carol" not in analyzer.participants
+    # 기본 규칙에서는 점수에 반영하지 않음
+    assert analyzer.calculate_scores()["bob"]["total"] == 3
+    # 기간별 카운트에도 PR 생성일 기준으로 반영
+    window = analyzer.participants_between(date(2025, 3, 2), None)
+    assert window["bob"]["p_review"] == 1
+
+    # 이미 조회한 PR은 다시 요청하지 않고, 바뀐 PR의 상세 정보는 되돌린 뒤 다시 조회
+    assert analyzer.enrich_pull_requests() == 0
+    assert not analyzer.update_item(merged_pr(1, "alice"))
+    assert analyzer.participants["bob"]["p_review"] == 2
+    relabeled = merged_pr(1, "alice")
+    relabeled["labels"] = [{"name": "bug"}]
+    assert analyzer.update_item(relabeled)
+    assert analyzer.participants["bob"]["p_review"] == 1
+    assert analyzer.enrich_pull_requests() == 1
+    assert analyzer.participants["bob"]["p_review"] == 2
@@ -0,0 +1,96 @@
+import time
+
+from reposcore.github_utils import RateBudget, TokenPool, list_org_repos, retry_request
+
+
+class FakeResponse:
+    def __init__(self, items, status_code=200, link=""):
+        self.status_code = status_code
+        self._items = items
+        self.headers = {"link": link}
+
+    def json(self):
+        return self._items
+
+
+class FakeSession:
+    """페이지 번호별로 정해진 응답을 돌려주는 requests.Session 대용"""
+
+    def __init__(self, pages):
+        self.pages = pages
+        self.urls = []
+
+    def get(self, url, params=None, headers=None):
+        self.urls.append(url)
+        page = params["page"]
+        link = 'rel="next"' if page < len(self.pages) else ""
+        return FakeResponse(self.pages[page - 1], link=link)
+
+
+def test_list_org_repos_filters_by_pattern_across_pages():
+    session = FakeSession([
+        [{"name": "reposcore-py", "full_name": "oss2025hnu/reposcore-py"},
+         {"name": "homework", "full_name": "oss2025hnu/homework"}],
+        [{"name": "reposcore-js", "full_name": "oss2025hnu/reposcore-js"}],
+    ])
+    repos = list_org_repos("oss2025hnu", "reposcore-*", session=session)
+    assert repos == ["oss2025hnu/reposcore-py", "oss2025hnu/reposcore-js"]
+    assert len(session.urls) == 2
+
+
+def test_rate_budget_tracks_remaining_from_headers():
+    budget = RateBudget(reserve=1)
+    budget.update({"X-RateLimit-Remaining": "3", "X-RateLimit-Reset": str(time.time() + 3600)})
+    budget.acquire()
+    budget.acquire()
+    assert budget.remaining == 1
+
+
+class RateLimitedSession:
+    """토큰별로 남은 요청 수를 흉내 내는 requests.Session 대용"""
+
+    def __init__(self, remaining):
+        self.remaining = dict(remaining)
+        self.used = []
+
+    def get(self, url, params=None, headers=None):
+        token = headers["Authorization"].split()[-1]
+        self.used.append(token)
+        if self.remaining[token] == 0:
+            response = FakeResponse({}, status_code=403)
+        else:
+            self.remaining[token] -= 1
+            response = FakeResponse({})
+        response.headers.update({
+            "X-RateLimit-Remaining": str(self.remaining[token]),
+            "X-RateLimit-Reset": str(time.time() + 3600),
+        })
+        return response
+
+
+def test_token_pool_fails_over_to_token_with_headroom():
+    pool = TokenPool(["a", "b"], reserve=0)
+    session = RateLimitedSession({"a": 0, "b": 2})
+    # 처음에는 두 토큰 모두 한도를 모르므로 a를 먼저 쓰고, 403이면 b로 바로 다시 요청
+    assert retry_request(session, "https://api.github.com/x", retry_delay=0, rate_budget=pool).status_code == 200
+    assert session.used == ["a", "b"]
+    # 이후에는 한도가 남은 b만 사용
+    retry_request(session, "https://api.github.com/x", retry_delay=0, rate_budget=pool)
+    assert session.used == ["a", "b", "b"]
+    assert pool.remaining == 0
+
+
+class UserAccountSession(FakeSession):
+    """/orgs/{org}/repos는 404, /users/{org}/repos는 저장소 목록을 돌려주는 requests.Session 대용"""
+
+    def get(self, url, params=None, headers=None):
+        if "/orgs/" in url:
+            self.urls.append(url)
+            return FakeResponse({}, status_code=404)
+        return super().get(url, params, headers)
+
+
+def test_list_org_repos_falls_back_to_user_without_retrying_404():
+    session = UserAccountSession([[{"name": "reposcore-py", "full_name": "alice/reposcore-py"}]])
+    assert list_org_repos("alice", session=session) == ["alice/reposcore-py"]
+    assert session.urls == ["https://api.github.com/orgs/alice/repos", "https://api.github.com/users/alice/repos"]
@@ -0,0 +1,65 @@
+import json
+
+import requests
+
+from reposcore.github_utils import retry_request, use_http_cache
+from reposcore.http_cache import HttpCache
+
+
+class ConditionalSession:
+    """ETag가 맞으면 304를 돌려주는 requests.Session 대용"""
+
+    def __init__(self, max_age):
+        self.max_age = max_age
+        self.requests = []
+        self.headers = {}
+
+    def get(self, url, params=None, headers=None):
+        headers = headers or {}
+        self.requests.append(headers.get("If-None-Match"))
+        response = requests.Response()
+        response.headers["Cache-Control"] = f"private, max-age={self.max_age}"
+        response.headers["ETag"] = '"v1"'
+        if headers.get("If-None-Match") == '"v1"':
+            response.status_code = 304
+            response._content = b""
+        else:
+            response.status_code = 200
+            response._content = json.dumps({"url": url}).encode("utf-8")
+        return response
+
+
+def test_cache_serves_fresh_and_revalidates_stale(tmp_path):
+    url = "https://api.github.com/repos/o/r"
+    use_http_cache(HttpCache(str(tmp_path)))
+    try:
+        fresh = ConditionalSession(max_age=60)
+        assert retry_request(fresh, url).json() == {"url": url}
+        assert retry_request(fresh, url).json() == {"url": url}
+        # 유효 기간 안에서는 두 번째 요청이 네트워크로 가지 않음
+        assert fresh.requests == [None]
+
+        # 다른 실행(새 캐시 객체)에서도 디스크의 응답을 사용하고, 만료되면 ETag로 재검증
+        use_http_cache(HttpCache(str(tmp_path)))
+        stale = ConditionalSession(max_age=0)
+        assert retry_request(stale, url + "/issues").status_code == 200
+        response = retry_request(stale, url + "/issues")
+        assert response.status_code == 200
+        assert response.json() == {"url": url + "/issues"}
+        assert stale.requests == [None, '"v1"']
+    finally:
+        use_http_cache(None)
+
+
+def test_cache_evicts_least_recently_used(tmp_path):
+    cache = HttpCache(str(tmp_path))
+    session = ConditionalSession(max_age=60)
+    cache.store("a", "a", session.get("a"))
+    cache.store("b", "b", session.get("b"))
+    # 두 항목 중 하나만 들어가는 크기로 줄이고 a를 최근에 사용
+    cache.max_bytes = cache.total_bytes - 1
+    cache.lookup("a")
+    cache.store("c", "c", session.get("c"))
+    assert cache.lookup("b") is None
+    assert cache.lookup("c") is not None
+    assert cache.total_bytes <= cache.max_bytes
@@ -0,0 +1,52 @@
+import subprocess
+from datetime import date
+
+import pytest
+
+from reposcore.analyzer import RepoAnalyzer
+from reposcore.local_repo import commit_login, iter_commits
+from reposcore.scoring import ScoringRules
+
+
+def git(path, *args, name="Alice", email="123+alice@users.noreply.github.com", date="2025-03-10T12:00:00+09:00"):
+    env = {"GIT_AUTHOR_NAME": name, "GIT_AUTHOR_EMAIL": email, "GIT_AUTHOR_DATE": date,
+           "GIT_COMMITTER_NAME": name, "GIT_COMMITTER_EMAIL": email, "GIT_COMMITTER_DATE": date,
+           "HOME": str(path), "PATH": "/usr/bin:/bin:/usr/local/bin"}
+    subprocess.run(["git", "-C", str(path), *args], check=True, capture_output=True, env=env)
+
+
+@pytest.fixture
+def local_repo(tmp_path):
+    git(tmp_path, "init", "-q", "-b", "main")
+    git(tmp_path, "commit", "-q", "--allow-empty", "-m", "first")
+    git(tmp_path, "checkout", "-q", "-b", "feature")
+    git(tmp_path, "commit", "-q", "--allow-empty", "-m",
+        "feature\n\nCo-authored-by: Carol <456+carol@users.noreply.github.com>", name="Bob", email="bob@example.com",
+        date="2025-03-20T12:00:00+09:00")
+    git(tmp_path, "checkout", "-q", "main")
+    git(tmp_path, "merge", "-q", "--no-ff", "feature", "-m", "merge", date="2025-03-21T12:00:00+09:00")
+    return tmp_path
+
+
+def test_commit_login_prefers_noreply_login():
+    assert commit_login("Alice Kim", "123+alice@users.noreply.github.com") == "alice"
+    assert commit_login("Bob", "bob@example.com") == "Bob"
+
+
+def test_local_commits_are_counted_and_scored(local_repo):
+    commits = list(iter_commits(str(local_repo)))
+    assert [commit.is_merge for commit in commits] == [True, False, False]
+    assert commits[1].co_authors == ("carol",)
+
+    rules = ScoringRules({"categories": {
+        "c_commit": {"kind": "commit", "group": "feat_bug_pr"},
+    }}).with_commit_categories()
+    analyzer = RepoAnalyzer("dummy/repo", rules=rules)
+    assert analyzer.collect_local_commits(str(local_repo)) == 3
+
+    assert analyzer.participants["alice"]["c_commit"] == 1
+    assert analyzer.participants["alice"]["c_merge"] == 1
+    assert analyzer.participants["carol"]["c_co_authored"] == 1
+    assert analyzer.calculate_scores()["Bob"]["total"] == 3
+    # 기간별 점수에도 커밋 날짜(KST) 기준으로 반영
+    assert analyzer.calculate_scores(end=date(2025, 3, 15))["Bob"]["total"] == 0
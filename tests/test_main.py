@@ -61,3 +61,32 @@ def test_main_without_repo_option():
 #         text=True
 #     )
 #     assert "가 깃허브에 존재하지 않을 수 있음" in result.stdout
+
+def test_main_replay_miss_exits_with_rerecord_message(tmp_path):
+    """--replay 녹화 파일에 없는 요청이면 추적 정보 없이 다시 녹화하라는 안내와 함께 종료"""
+    from reposcore.cassette import Cassette
+    Cassette(str(tmp_path), "record").close()
+    result = subprocess.run(
+        [sys.executable, "-m", "reposcore", "--replay", str(tmp_path), "--org", "someorg",
+         "--output", str(tmp_path / "out")],
+        capture_output=True,
+        text=True
+    )
+    assert result.returncode == 1
+    assert "녹화되지 않은 요청입니다" in result.stdout + result.stderr
+    assert "--record로 녹화 파일을 다시 녹화하세요" in result.stdout + result.stderr
+    assert "Traceback" not in result.stderr
+
+def test_main_user_mode_uses_replay_cassette(tmp_path):
+    """--user 단일 사용자 모드도 --replay 설정 이후에 실행되어 네트워크 대신 녹화 파일을 사용"""
+    from reposcore.cassette import Cassette
+    Cassette(str(tmp_path), "record").close()
+    result = subprocess.run(
+        [sys.executable, "-m", "reposcore", "--replay", str(tmp_path), "--user", "alice", "o/r",
+         "--output", str(tmp_path / "out")],
+        capture_output=True,
+        text=True,
+        env=dict(os.environ, GITHUB_TOKEN="")
+    )
+    assert result.returncode == 1
+    assert "녹화되지 않은 요청입니다: https://api.github.com/repos/o/r" in result.stdout + result.stderr
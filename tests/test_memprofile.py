@@ -0,0 +1,33 @@
+import json
+
+from reposcore.memprofile import memory_phase, start_memory_profiling, stop_memory_profiling, summary_lines
+
+
+def test_phase_records_peak_retained_and_allocation_sites(tmp_path):
+    start_memory_profiling(top=5)
+    kept = []
+    try:
+        with memory_phase("collect", "o/a"):
+            temporary = [bytes(1000) for _ in range(2000)]
+            kept.append(bytes(100_000))
+            del temporary
+        with memory_phase("score", "o/a"):
+            pass
+    finally:
+        path = tmp_path / "memprofile.json"
+        report = stop_memory_profiling(str(path))
+
+    # 프로파일링이 끝나면 아무것도 기록하지 않음
+    with memory_phase("collect", "o/b"):
+        pass
+
+    collect, score = report["phases"]
+    assert (collect["phase"], collect["repo"]) == ("collect", "o/a")
+    # 단계 중에 생겼다가 해제된 메모리는 peak에만 반영되고 남은 증가량에는 포함되지 않음
+    assert collect["peak_increase_bytes"] >= 2_000_000
+    assert 100_000 <= collect["retained_bytes"] < collect["peak_increase_bytes"]
+    assert collect["top_sites"] and "test_memprofile.py" in collect["top_sites"][0]["site"]
+    assert score["peak_increase_bytes"] < collect["peak_increase_bytes"]
+    assert report["by_phase"]["collect"]["count"] == 1
+    assert json.loads(path.read_text(encoding="utf-8"))["by_phase"].keys() == {"collect", "score"}
+    assert any("collect o/a" in line for line in summary_lines(report))
@@ -0,0 +1,29 @@
+from reposcore.participants import ParticipantTable
+
+
+def test_participant_table_behaves_like_dict():
+    table = ParticipantTable.from_dict({
+        "alice": {"p_bug": 2, "i_documentation": 1},
+        "bob": {"p_typo": 1},
+    })
+    assert len(table) == 2
+    assert table["alice"]["p_bug"] == 2
+    assert table["alice"]["p_enhancement"] == 0
+
+    table["bob"]["p_typo"] += 2
+    assert table.to_dict()["bob"]["p_typo"] == 3
+
+    # 삭제 후에도 남은 참여자의 카운트가 유지되어야 함
+    del table["alice"]
+    assert "alice" not in table
+    assert list(table) == ["bob"]
+    assert table["bob"].copy()["p_typo"] == 3
+
+
+def test_participant_table_uses_fixed_width_columns():
+    table = ParticipantTable()
+    participant_id = table.add("alice")
+    assert table.add("alice") == participant_id
+    table.increment(participant_id, table.key_index["p_bug"], 5)
+    assert table.column("p_bug").itemsize == 4
+    assert list(table.column("p_bug")) == [5]
@@ -0,0 +1,66 @@
+import json
+import time
+
+import requests
+
+from reposcore.analyzer import RepoAnalyzer
+from reposcore.github_utils import RateBudget, last_page_number
+from reposcore.progress import ProgressReporter, format_duration
+
+
+def test_last_page_number_and_duration_format():
+    link = ('<https://api.github.com/repositories/1/issues?state=all&page=2>; rel="next", '
+            '<https://api.github.com/repositories/1/issues?state=all&page=34>; rel="last"')
+    assert last_page_number(link) == 34
+    assert last_page_number('<https://api.github.com/x?page=1>; rel="prev"') is None
+    assert format_duration(65) == "01:05"
+    assert format_duration(3723) == "1:02:03"
+    assert format_duration(None) == "--:--"
+
+
+class PagedSession(requests.Session):
+    """페이지마다 Link 헤더(next/last)를 붙여 이슈 목록을 돌려주는 /issues 흉내"""
+
+    def __init__(self, pages):
+        super().__init__()
+        self.pages = pages
+
+    def get(self, url, params=None, headers=None):
+        page = params["page"]
+        response = requests.Response()
+        response.status_code = 200
+        response._content = json.dumps(self.pages[page - 1]).encode("utf-8")
+        if page < len(self.pages):
+            response.headers["link"] = (f'<{url}?page={page + 1}>; rel="next", '
+                                        f'<{url}?page={len(self.pages)}>; rel="last"')
+        response.headers["X-RateLimit-Remaining"] = str(5000 - page)
+        return response
+
+
+def test_collection_reports_pages_items_and_status_lines(tmp_path):
+    pages = [
+        [{"number": n, "user": {"login": "alice"}, "created_at": "2025-03-10T01:00:00Z",
+          "updated_at": "2025-03-10T01:00:00Z", "labels": [], "state_reason": None} for n in range(p * 3, p * 3 + 3)]
+        for p in range(3)
+    ]
+    budget = RateBudget()
+    status_path = tmp_path / "status.jsonl"
+    analyzer = RepoAnalyzer("o/a", check_exists=False)
+    analyzer.SESSION = PagedSession(pages)
+    analyzer.rate_budget = budget
+
+    with ProgressReporter(2, budget, status_path=str(status_path), status_interval=0.05) as progress:
+        analyzer.progress = progress
+        analyzer.collect_PRs_and_issues(checkpoint_interval=0)
+        time.sleep(0.2)
+        snapshot = progress.snapshot()
+        assert snapshot["pages"] == 3 and snapshot["items"] == 9
+        assert snapshot["repos"]["o/a"] == {"page": 3, "last_page": 3, "done": False}
+        assert snapshot["rate_remaining"] == 4997
+        # 시작하지 않은 저장소는 시작한 저장소의 평균 페이지 수(3)로 추정
+        assert snapshot["eta_seconds"] is not None and snapshot["eta_seconds"] > 0
+        progress.finish("o/a")
+
+    lines = [json.loads(line) for line in status_path.read_text(encoding="utf-8").splitlines()]
+    assert len(lines) >= 2
+    assert lines[-1]["repos_done"] == 1 and lines[-1]["repos_total"] == 2
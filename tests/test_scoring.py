@@ -0,0 +1,34 @@
+import pytest
+
+from reposcore.analyzer import RepoAnalyzer
+from reposcore.scoring import ScoringRules
+
+
+def merged_pr(number, author, label):
+    return {"number": number, "user": {"login": author}, "created_at": "2025-03-10T01:00:00Z",
+            "labels": [{"name": label}], "pull_request": {"merged_at": "2025-03-11T01:00:00Z"}}
+
+
+def test_rules_compile_aliases_weights_and_caps():
+    rules = ScoringRules({
+        "label_aliases": {"feature": "enhancement", "docs": "documentation"},
+        "weights": {"feat_bug_pr": 5},
+        "caps": {"doc_typo_pr_per_feat_bug_pr": 1},
+    })
+    assert rules.pr_labels["feature"] == rules.pr_labels["enhancement"]
+    assert rules.issue_labels["docs"] == rules.issue_labels["documentation"]
+
+    analyzer = RepoAnalyzer("dummy/repo", rules=rules)
+    analyzer.update_item(merged_pr(1, "alice", "feature"))
+    for number in range(2, 5):
+        analyzer.update_item(merged_pr(number, "alice", "docs"))
+
+    score = analyzer.calculate_scores()["alice"]
+    assert score["feat/bug PR"] == 5
+    # 문서 PR은 기능/버그 PR 1개당 1개까지만 인정
+    assert score["document PR"] == 2
+
+
+def test_rules_reject_unknown_group():
+    with pytest.raises(ValueError):
+        ScoringRules({"categories": {"p_refactor": {"kind": "pr", "labels": ["refactor"], "group": "refactor"}}})
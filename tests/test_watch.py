@@ -0,0 +1,52 @@
+from reposcore.analyzer import RepoAnalyzer
+from reposcore.cache_file import cache_path_for
+from reposcore.watch import RepoWatcher
+
+from .conftest import IssuesSession, issue
+
+
+def test_watcher_refreshes_only_changed_repositories(tmp_path):
+    analyzers = {}
+    for repo in ("o/a", "o/b"):
+        analyzer = RepoAnalyzer(repo, check_exists=False)
+        analyzer.SESSION = IssuesSession({repo: [issue(1, "2025-03-10T01:00:00Z")]})
+        analyzer.update_item(issue(1, "2025-03-10T01:00:00Z"))
+        analyzers[repo] = analyzer
+
+    watcher = RepoWatcher(analyzers, str(tmp_path), 1, lambda changed: None)
+    # 경계 시각의 항목이 다시 와도 내역이 같으면 변경으로 보지 않음
+    assert watcher.poll_once() == []
+
+    analyzers["o/b"].SESSION.repos["o/b"] = [issue(1, "2025-03-12T01:00:00Z", "enhancement"), issue(2, "2025-03-12T02:00:00Z")]
+    assert watcher.poll_once() == ["o/b"]
+    assert analyzers["o/b"].SESSION.requests == [("o/b", "2025-03-10T01:00:00Z")] * 2
+    assert analyzers["o/b"].last_updated == "2025-03-12T02:00:00Z"
+    assert analyzers["o/b"].participants["alice"]["i_bug"] == 1
+    assert analyzers["o/b"].participants["alice"]["i_enhancement"] == 1
+    # 바뀐 저장소만 캐시를 다시 저장 (캐시 파일 잠금 사용)
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["cache_o_b.bin", "cache_o_b.bin.lock"]
+
+
+def test_watcher_continues_from_cache_saved_by_another_run(tmp_path):
+    watched = RepoAnalyzer("o/a", check_exists=False)
+    watched.SESSION = IssuesSession({"o/a": [issue(1), issue(2, "2025-03-11T01:00:00Z")]})
+    watched.update_item(issue(1))
+    watched.update_item(issue(2, "2025-03-11T01:00:00Z"))
+    path = cache_path_for(str(tmp_path), "o/a")
+    watched.save_cache(path)
+    watcher = RepoWatcher({"o/a": watched}, str(tmp_path), 1, lambda changed: None)
+
+    # 그사이 웹훅이 2번 이슈 삭제를 반영해 캐시를 저장 (삭제된 이슈는 /issues에 다시 나오지 않음)
+    webhook = RepoAnalyzer("o/a", check_exists=False)
+    webhook.load_cache(path)
+    webhook.remove_item(2)
+    webhook.save_cache(path)
+    watched.SESSION.repos["o/a"] = [issue(1), issue(3, "2025-03-12T01:00:00Z", "enhancement")]
+
+    # 더 새로운 캐시를 덮어쓰지 않고 불러와 이어서 반영하므로 삭제된 이슈가 되살아나지 않음
+    assert watcher.refresh("o/a") == 1
+    assert sorted(watched.items) == [1, 3]
+    saved = RepoAnalyzer("o/a", check_exists=False)
+    saved.load_cache(path)
+    assert sorted(saved.items) == [1, 3]
+    assert saved.participants["alice"].copy() == watched.participants["alice"].copy()
@@ -0,0 +1,105 @@
+import hashlib
+import hmac
+import http.client
+import json
+import threading
+
+from reposcore.analyzer import RepoAnalyzer
+from reposcore.cache_file import read_cache
+from reposcore.webhook import WebhookReceiver
+
+REPOSITORY = {"full_name": "oss2025hnu/reposcore-py"}
+
+ISSUE_OPENED = {
+    "action": "opened",
+    "repository": REPOSITORY,
+    "issue": {
+        "number": 7,
+        "created_at": "2025-03-10T01:00:00Z",
+        "user": {"login": "alice"},
+        "labels": [{"name": "bug"}],
+        "state_reason": None,
+    },
+}
+
+PR_MERGED = {
+    "action": "closed",
+    "repository": REPOSITORY,
+    "pull_request": {
+        "number": 8,
+        "created_at": "2025-03-11T01:00:00Z",
+        "merged_at": "2025-03-12T01:00:00Z",
+        "user": {"login": "alice"},
+        "labels": [{"name": "documentation"}],
+    },
+}
+
+
+def post(server, event, payload, secret=None):
+    body = json.dumps(payload).encode("utf-8")
+    headers = {"X-GitHub-Event": event, "Content-Type": "application/json"}
+    if secret:
+        digest = hmac.new(secret.encode("utf-8"), body, hashlib.sha256).hexdigest()
+        headers["X-Hub-Signature-256"] = f"sha256={digest}"
+    conn = http.client.HTTPConnection(*server.server_address)
+    conn.request("POST", "/", body=body, headers=headers)
+    status = conn.getresponse().status
+    conn.close()
+    return status
+
+
+def test_webhook_applies_recorded_payloads(tmp_path):
+    receiver = WebhookReceiver(str(tmp_path), secret="s3cret")
+    server = receiver.make_server(port=0)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        assert post(server, "issues", ISSUE_OPENED) == 401
+        assert post(server, "issues", ISSUE_OPENED, secret="s3cret") == 200
+        # 같은 이슈에 대한 이벤트가 다시 와도 중복 집계되지 않아야 함
+        assert post(server, "issues", ISSUE_OPENED, secret="s3cret") == 200
+        assert post(server, "pull_request", PR_MERGED, secret="s3cret") == 200
+        assert post(server, "push", {}, secret="s3cret") == 202
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    cached = read_cache(str(tmp_path / "cache_oss2025hnu_reposcore-py.bin"))
+    assert cached["participants"]["alice"]["i_bug"] == 1
+    assert cached["participants"]["alice"]["p_documentation"] == 1
+
+
+def test_webhook_label_and_delete_events(tmp_path):
+    receiver = WebhookReceiver(str(tmp_path))
+    receiver.handle_event("issues", ISSUE_OPENED)
+
+    renamed = {
+        "action": "edited",
+        "repository": REPOSITORY,
+        "label": {"name": "enhancement"},
+        "changes": {"name": {"from": "bug"}},
+    }
+    receiver.handle_event("label", renamed)
+    participants = receiver.get_analyzer("oss2025hnu/reposcore-py").participants
+    assert participants["alice"]["i_bug"] == 0
+    assert participants["alice"]["i_enhancement"] == 1
+
+    receiver.handle_event("issues", {**ISSUE_OPENED, "action": "deleted"})
+    assert participants["alice"]["i_enhancement"] == 0
+
+
+def test_webhook_recollects_cache_without_items(tmp_path, monkeypatch):
+    # 이슈/PR별 반영 내역이 없는 예전 캐시 (이슈 7이 이미 participants에 반영되어 있음)
+    cache_path = tmp_path / "cache_oss2025hnu_reposcore-py.bin"
+    cache_path.write_text(json.dumps({"participants": {"alice": {"i_bug": 1}}, "update_time": 0}), encoding="utf-8")
+
+    def collect(self, *args, **kwargs):
+        self.update_item(ISSUE_OPENED["issue"])
+
+    monkeypatch.setattr(RepoAnalyzer, "collect_PRs_and_issues", collect)
+    receiver = WebhookReceiver(str(tmp_path))
+    receiver.handle_event("issues", ISSUE_OPENED)
+
+    cached = read_cache(str(cache_path))
+    assert cached["participants"]["alice"]["i_bug"] == 1
+    assert "7" in cached["items"]
@@ -0,0 +1,52 @@
+import threading
+
+from reposcore.work_queue import DONE, FAILED, WorkQueue, run_worker
+
+
+def test_expired_lease_is_claimed_by_another_worker(tmp_path):
+    queue = WorkQueue(str(tmp_path / "queue.db"), lease_seconds=60, max_attempts=2)
+    queue.enqueue(["o/a", "o/b"])
+
+    assert queue.claim("dead") == "o/a"
+    assert queue.claim("live") == "o/b"
+    assert queue.claim("live") is None
+    assert not queue.is_finished()
+
+    # 기간이 지나면 종료된 작업자의 저장소를 다른 작업자가 가져가고, 원래 작업자의 결과는 기록하지 않음
+    queue.lease_seconds = -1
+    assert queue.renew("o/a", "dead")
+    assert queue.claim("live") == "o/a"
+    assert not queue.complete("o/a", "dead", {"late": True})
+    assert queue.complete("o/a", "live", {"ok": 1})
+
+    # 실패하면 최대 시도 횟수까지 다시 대기 상태가 됨
+    queue.fail("o/b", "live", "403")
+    assert queue.claim("live") == "o/b"
+    queue.fail("o/b", "live", "403")
+    assert queue.is_finished()
+    assert queue.counts() == {DONE: 1, FAILED: 1}
+    assert queue.results() == {"o/a": {"ok": 1}}
+    assert queue.failures() == {"o/b": "403"}
+
+
+def test_workers_share_queue_and_process_each_repo_once(tmp_path):
+    path = str(tmp_path / "queue.db")
+    repos = [f"o/r{i}" for i in range(20)]
+    WorkQueue(path).enqueue(repos)
+    seen = []
+
+    def process(repo):
+        seen.append(repo)
+        return {"repo": repo}
+
+    threads = [
+        threading.Thread(target=run_worker, args=(WorkQueue(path), process), kwargs={"poll_interval": 0.01})
+        for _ in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=30)
+
+    assert sorted(seen) == sorted(repos)
+    assert list(WorkQueue(path).results()) == repos